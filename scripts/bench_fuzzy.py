@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: fuzzy scoring throughput (candidates scored per millisecond).
+
+Builds a FuzzyIndex over synthetic titles and times FuzzyIndex.top() with
+the NumPy scorer (if installed) and the pure-Python fallback.
+
+Usage:
+    python scripts/bench_fuzzy.py [--candidates N] [--queries N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from viki_trakt_sync.fuzzy import HAVE_NUMPY, FuzzyIndex  # noqa: E402
+
+WORDS = (
+    "love moon king queen secret garden crash landing youth hospital playlist "
+    "goblin guardian lawyer doctor romance palace empire reply sky castle "
+    "business proposal dream high school legend blue sea star"
+).split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=20000, help="catalogue titles")
+    parser.add_argument("--queries", type=int, default=200, help="timed queries")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    titles = [" ".join(rng.sample(WORDS, rng.randint(1, 4))) for _ in range(args.candidates)]
+    queries = [rng.choice(titles) + rng.choice(["", " 2", " (2021)", "!"]) for _ in range(args.queries)]
+
+    modes = [("numpy", True)] if HAVE_NUMPY else []
+    modes.append(("pure python", False))
+    for label, use_numpy in modes:
+        started = time.perf_counter()
+        index = FuzzyIndex(titles, use_numpy=use_numpy)
+        built = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for query in queries:
+            index.top(query, k=5)
+        per_query_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        print(
+            f"{label:<12} build {built * 1000:7.1f} ms   "
+            f"{per_query_ms:6.3f} ms/query   {len(titles) / per_query_ms:9.0f} candidates/ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: parse time of an MDL search page plus detail page.
+
+Compares the old BeautifulSoup (html.parser) extraction against the
+pattern-based extractors in viki_trakt_sync.mdl_client, on saved pages.
+
+Usage:
+    python scripts/bench_mdl_extract.py [--search FILE] [--detail FILE] [--rounds N]
+
+Save real pages with e.g.
+    curl -A Mozilla -o search.html 'https://mydramalist.com/search?q=Goblin'
+"""
+
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from viki_trakt_sync.mdl_client import extract_aliases, extract_first_result, extract_viki_id  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "mdl"
+
+
+def legacy_extract(search_html, detail_html):
+    """What MdlClient.search_alias extracted before mdl_client's extractors.
+
+    (It missed Viki links whose target is percent-encoded in a /redirect URL.)
+    """
+    search_soup = BeautifulSoup(search_html, "html.parser")
+    results = search_soup.find_all("a", class_="text-primary")
+    path = results[0].get("href") if results else None
+
+    detail_soup = BeautifulSoup(detail_html, "html.parser")
+    aliases = []
+    for script in detail_soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        alt_names = data.get("alternateName", [])
+        if alt_names:
+            aliases = [n for n in alt_names if not re.search(r"[\u4e00-\u9fff\uac00-\ud7af\u3040-\u309f]", n)]
+            break
+
+    viki_id = None
+    for link in detail_soup.find_all("a"):
+        href = link.get("href", "")
+        if "viki" in href.lower():
+            match = re.search(r"/tv/([a-z0-9]+)", href)
+            if match:
+                viki_id = match.group(1)
+                break
+    return path, aliases, viki_id
+
+
+def lean_extract(search_html, detail_html):
+    return extract_first_result(search_html), extract_aliases(detail_html), extract_viki_id(detail_html)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--search", type=Path, default=FIXTURES / "search.html", help="saved search page")
+    parser.add_argument("--detail", type=Path, default=FIXTURES / "detail.html", help="saved detail page")
+    parser.add_argument("--rounds", type=int, default=50, help="timed rounds")
+    args = parser.parse_args()
+
+    search_html = args.search.read_text(encoding="utf-8")
+    detail_html = args.detail.read_text(encoding="utf-8")
+    print(f"pages: search {len(search_html) / 1024:.0f} KiB, detail {len(detail_html) / 1024:.0f} KiB")
+    print(f"legacy: {legacy_extract(search_html, detail_html)}")
+    print(f"lean:   {lean_extract(search_html, detail_html)}")
+
+    timings = {}
+    for label, fn in (("beautifulsoup", legacy_extract), ("lean", lean_extract)):
+        seconds = min(timeit.repeat(lambda: fn(search_html, detail_html), number=args.rounds, repeat=3))
+        timings[label] = seconds / args.rounds * 1000
+        print(f"{label:<14} {timings[label]:8.3f} ms/lookup")
+    print(f"speedup        {timings['beautifulsoup'] / timings['lean']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
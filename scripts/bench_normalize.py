@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-candidate cost of title normalisation.
+
+Compares the old per-call approach (nested closures calling re.sub with
+pattern strings) against viki_trakt_sync.normalize, cold and warm.
+
+Usage:
+    python scripts/bench_normalize.py [--candidates N] [--rounds N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from viki_trakt_sync import normalize  # noqa: E402
+
+SAMPLE_TITLES = [
+    "The K2", "Descendants of the Sun", "Crash Landing on You", "A Love So Beautiful",
+    "Goblin: The Lonely and Great God", "Hospital Playlist 2", "Love in the Moonlight",
+    "An Empress's Dignity", "My Youth (2025)", "Business Proposal", "The Untamed",
+    "Reply 1988", "Extraordinary Attorney Woo", "Twenty-Five Twenty-One",
+]
+
+
+def legacy_keys(title):
+    """Keys the way the matcher tiers computed them before normalize.py."""
+    def _norm(s):
+        return re.sub(r"[^a-z0-9]+", " ", (s or "").lower()).strip()
+
+    def _norm_no_article(s):
+        return re.sub(r"^(the|a|an)\s+", "", _norm(s))
+
+    def _slugify(s):
+        return re.sub(r"[^a-z0-9]+", "-", (s or "").lower()).strip("-")
+
+    return (
+        _norm(title),
+        _norm_no_article(title),
+        _slugify(title),
+        _slugify(re.sub(r"^(the|a|an)\s+", "", title, flags=re.IGNORECASE)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=2000, help="candidate titles per round")
+    parser.add_argument("--rounds", type=int, default=20, help="timed rounds")
+    args = parser.parse_args()
+
+    candidates = [
+        f"{SAMPLE_TITLES[i % len(SAMPLE_TITLES)]} {i // len(SAMPLE_TITLES) % 50}"
+        for i in range(args.candidates)
+    ]
+    assert all(legacy_keys(c) == tuple(normalize.title_keys(c)) for c in candidates)
+
+    def run_legacy():
+        for c in candidates:
+            legacy_keys(c)
+
+    def run_cold():
+        normalize.cache_clear()
+        normalize.normalize_many(candidates)
+
+    def run_warm():
+        normalize.normalize_many(candidates)
+
+    run_warm()
+    per_candidate = args.rounds * len(candidates)
+    for label, fn in (("legacy closures", run_legacy), ("normalize (cold)", run_cold), ("normalize (warm)", run_warm)):
+        seconds = min(timeit.repeat(fn, number=args.rounds, repeat=3))
+        print(f"{label:<18} {seconds / per_candidate * 1e6:8.3f} µs/candidate")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,5 +7,9 @@ for interacting with external APIs (Viki, Trakt, metadata providers).
 from .viki import VikiAdapter
 from .trakt import TraktAdapter
 from .metadata import MetadataAdapter
+from .aio import AsyncVikiAdapter, AsyncTraktAdapter, AsyncMetadataAdapter
 
-__all__ = ['VikiAdapter', 'TraktAdapter', 'MetadataAdapter']
+__all__ = [
+    'VikiAdapter', 'TraktAdapter', 'MetadataAdapter',
+    'AsyncVikiAdapter', 'AsyncTraktAdapter', 'AsyncMetadataAdapter',
+]
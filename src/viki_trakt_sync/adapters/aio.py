@@ -0,0 +1,232 @@
+"""Asyncio adapters.
+
+Async variants of the Viki, Trakt and metadata adapters for the
+asyncio sync engine (AsyncSyncWorkflow).
+
+The upstream clients are blocking ``requests`` code, so each call runs
+on a worker thread via ``asyncio.to_thread``. A per-adapter semaphore
+bounds how many calls are in flight against each upstream, which lets
+the event loop overlap work across services without flooding any one
+of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .metadata import MetadataAdapter, MetadataResult
+from .trakt import TraktAdapter, TraktEpisode, TraktSearchResult
+from .viki import DEFAULT_MAX_CONCURRENCY, VikiAdapter, VikiEpisode
+
+logger = logging.getLogger(__name__)
+
+# Trakt writes are rate limited; keep reads modest as well
+DEFAULT_TRAKT_CONCURRENCY = 2
+DEFAULT_METADATA_CONCURRENCY = 4
+
+
+class _BoundedAsyncAdapter:
+    """Run blocking adapter calls on threads, bounded by a semaphore.
+
+    Instances must be created inside the event loop that uses them.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._limit = asyncio.Semaphore(self.max_concurrency)
+
+    async def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        async with self._limit:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class AsyncVikiAdapter(_BoundedAsyncAdapter):
+    """Async wrapper around VikiAdapter."""
+
+    def __init__(self, adapter: VikiAdapter, max_concurrency: Optional[int] = None):
+        """Initialize async adapter.
+
+        Args:
+            adapter: Blocking VikiAdapter to delegate to
+            max_concurrency: Max in-flight Viki calls (default: adapter's setting)
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(adapter, "max_concurrency", DEFAULT_MAX_CONCURRENCY)
+            if not isinstance(max_concurrency, int):
+                max_concurrency = DEFAULT_MAX_CONCURRENCY
+        super().__init__(max_concurrency)
+        self.adapter = adapter
+
+    async def get_watch_markers(self, from_timestamp: int = 1) -> Dict[str, Dict[str, Any]]:
+        """Fetch raw watch markers (container_id -> video_id -> marker)."""
+        response = await self._call(
+            self.adapter.client.get_watch_markers, from_timestamp=from_timestamp
+        )
+        return response.get("markers", {})
+
+    async def get_episodes(
+        self,
+        viki_id: str,
+        video_ids: Optional[List[str]] = None,
+        force_refresh: bool = False,
+    ) -> List[VikiEpisode]:
+        """Fetch all episodes for a show (raises on failure).
+
+        When video_ids are given, the adapter's episode cache is consulted
+        first and a fetched list is stored back. Cache access stays on the
+        event loop thread; only the network fetch runs on a worker thread.
+
+        Args:
+            viki_id: Viki container ID
+            video_ids: Watched video IDs that need metadata (enables the cache)
+            force_refresh: Skip the cache lookup
+        """
+        if video_ids is not None and not force_refresh:
+            cached = self.adapter.get_cached_episodes(viki_id, video_ids)
+            if cached is not None:
+                return cached
+
+        episodes = await self._call(self.adapter.get_episodes, viki_id, strict=True)
+        if video_ids is not None:
+            self.adapter.store_cached_episodes(viki_id, episodes)
+        return episodes
+
+    async def get_container(self, viki_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch container (show) metadata, or None if not found."""
+        return await self._call(self.adapter.get_container, viki_id)
+
+    def merge_markers(self, videos: Dict[str, Any], episodes: List[VikiEpisode]) -> Dict[str, Dict[str, Any]]:
+        """Merge one container's markers with episode metadata (no I/O)."""
+        return self.adapter._merge_markers(videos, episodes)
+
+
+class AsyncTraktAdapter(_BoundedAsyncAdapter):
+    """Async wrapper around TraktAdapter."""
+
+    def __init__(self, adapter: TraktAdapter, max_concurrency: int = DEFAULT_TRAKT_CONCURRENCY):
+        """Initialize async adapter.
+
+        Args:
+            adapter: Blocking TraktAdapter to delegate to
+            max_concurrency: Max in-flight Trakt calls
+        """
+        super().__init__(max_concurrency)
+        self.adapter = adapter
+
+    async def search(self, title: str) -> List[TraktSearchResult]:
+        """Search for shows by title."""
+        return await self._call(self.adapter.search, title)
+
+    async def sync_watched(self, episodes: List[TraktEpisode], **kwargs: Any) -> Dict[str, Any]:
+        """Sync watched episodes to Trakt (kwargs as TraktAdapter.sync_watched)."""
+        return await self._call(self.adapter.sync_watched, episodes, **kwargs)
+
+    async def get_last_activities(self) -> Optional[Dict[str, Any]]:
+        """Get the user's /sync/last_activities timestamps."""
+        return await self._call(self.adapter.get_last_activities)
+
+    async def get_watched_shows(self) -> Optional[List[Dict[str, Any]]]:
+        """Get every show the user has watched."""
+        return await self._call(self.adapter.get_watched_shows)
+
+    async def get_seasons(self, trakt_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Get a show's seasons with their episodes."""
+        return await self._call(self.adapter.get_seasons, trakt_id)
+
+
+class AsyncMetadataAdapter(_BoundedAsyncAdapter):
+    """Async wrapper around MetadataAdapter.
+
+    Show matches run on a dedicated pool of max_concurrency threads. A
+    match that times out keeps its thread (and slot) until it really
+    finishes; call close() when done to drop queued work.
+    """
+
+    def __init__(self, adapter: MetadataAdapter, max_concurrency: int = DEFAULT_METADATA_CONCURRENCY):
+        """Initialize async adapter.
+
+        Args:
+            adapter: Blocking MetadataAdapter to delegate to
+            max_concurrency: Max in-flight metadata lookups
+        """
+        super().__init__(max_concurrency)
+        self.adapter = adapter
+        self._match_pool: Optional[ThreadPoolExecutor] = None
+        self._match_slots = asyncio.Condition()
+        self._matching = 0  # busy matcher threads, abandoned ones included
+        self._abandoned: Set[asyncio.Future] = set()
+        self._reapers: Set[asyncio.Task] = set()
+
+    def close(self) -> None:
+        """Stop the matcher pool without waiting for abandoned matches."""
+        if self._match_pool is not None:
+            self._match_pool.shutdown(wait=False, cancel_futures=True)
+            self._match_pool = None
+
+    async def search_tvdb(self, title: str) -> List[MetadataResult]:
+        """Search TVDB for shows by title."""
+        return await self._call(self.adapter.search_tvdb, title)
+
+    async def get_tvdb_show(self, tvdb_id: int) -> Optional[MetadataResult]:
+        """Get show details from TVDB."""
+        return await self._call(self.adapter.get_tvdb_show, tvdb_id)
+
+    async def match(
+        self, matcher: Callable[[Dict], Any], viki_show: Dict, timeout: Optional[float] = None
+    ) -> Any:
+        """Run a (blocking) show matcher, which is metadata-lookup bound.
+
+        Args:
+            matcher: Show matcher, e.g. ShowMatcher.match
+            viki_show: Matcher input
+            timeout: Seconds the lookup may run once it has a slot (time
+                     spent waiting for the slot doesn't count)
+
+        Raises:
+            asyncio.TimeoutError: If the lookup ran longer than timeout, or
+                if every matcher thread is held by a timed-out lookup
+        """
+        async with self._match_slots:
+            await self._match_slots.wait_for(
+                lambda: self._matching < self.max_concurrency
+                or len(self._abandoned) >= self.max_concurrency
+            )
+            if self._matching >= self.max_concurrency:
+                # Hung lookups hold every thread; queued shows would only wait on them
+                raise asyncio.TimeoutError()
+            self._matching += 1
+
+        if self._match_pool is None:
+            self._match_pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="matcher"
+            )
+        future = asyncio.get_running_loop().run_in_executor(self._match_pool, matcher, viki_show)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            async with self._match_slots:
+                self._abandoned.add(future)
+                self._match_slots.notify_all()
+            raise
+        finally:
+            if future.done():
+                await self._free_slot(future)
+            else:
+                future.add_done_callback(self._reap)
+
+    def _reap(self, future: asyncio.Future) -> None:
+        task = asyncio.get_running_loop().create_task(self._free_slot(future))
+        self._reapers.add(task)
+        task.add_done_callback(self._reapers.discard)
+
+    async def _free_slot(self, future: asyncio.Future) -> None:
+        """Release the thread slot of a finished match."""
+        if not future.cancelled():
+            future.exception()  # retrieved, so abandoned failures aren't logged as unhandled
+        async with self._match_slots:
+            self._matching -= 1
+            self._abandoned.discard(future)
+            self._match_slots.notify_all()
@@ -8,7 +8,11 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol
+
+if TYPE_CHECKING:
+    from ..tvdb_auth import TvdbAuth
+    from ..tvdb_series import TvdbSeriesStore
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +42,23 @@ class MetadataAdapter:
     for Asian drama matching.
     """
     
-    def __init__(self, tvdb_session: Optional[TVDBSessionProtocol] = None):
+    def __init__(
+        self,
+        tvdb_session: Optional[TVDBSessionProtocol] = None,
+        tvdb_auth: Optional["TvdbAuth"] = None,
+        tvdb_series: Optional["TvdbSeriesStore"] = None,
+    ):
         """Initialize adapter.
         
         Args:
             tvdb_session: HTTP session for TVDB API (with caching)
+            tvdb_auth: TVDB token manager (default: shared one for TVDB_API_KEY)
+            tvdb_series: TVDB series-detail store (e.g. the matcher's); when
+                         set, get_tvdb_show() is served from it
         """
         self._tvdb_session = tvdb_session
+        self._tvdb_auth = tvdb_auth
+        self.tvdb_series = tvdb_series
     
     @property
     def tvdb_session(self):
@@ -54,6 +68,21 @@ class MetadataAdapter:
             self._tvdb_session = get_tvdb_session()
         return self._tvdb_session
     
+    @property
+    def tvdb_auth(self) -> Optional["TvdbAuth"]:
+        """Lazy-load the shared TVDB token manager (None without an API key)."""
+        if self._tvdb_auth is None:
+            from ..tvdb_auth import get_tvdb_auth
+            self._tvdb_auth = get_tvdb_auth()
+        return self._tvdb_auth
+    
+    def _tvdb_get(self, url: str) -> Any:
+        """GET a TVDB URL, with the bearer token when one is available."""
+        auth = self.tvdb_auth
+        if auth is None:
+            return self.tvdb_session.get(url)
+        return auth.get(self.tvdb_session, url)
+    
     def search_tvdb(self, title: str) -> List[MetadataResult]:
         """Search TVDB for shows by title.
         
@@ -65,7 +94,7 @@ class MetadataAdapter:
         """
         try:
             url = f"https://api4.thetvdb.com/v4/search?query={title}&type=series"
-            response = self.tvdb_session.get(url)
+            response = self._tvdb_get(url)
             
             if hasattr(response, 'json'):
                 data = response.json()
@@ -97,9 +126,20 @@ class MetadataAdapter:
         Returns:
             MetadataResult or None
         """
+        if self.tvdb_series is not None:
+            series = self.tvdb_series.get(tvdb_id, auth=self.tvdb_auth)
+            if series is None:
+                return None
+            return MetadataResult(
+                tvdb_id=series.tvdb_id,
+                title=series.name,
+                year=series.year,
+                aliases=series.alias_names(),
+            )
+
         try:
             url = f"https://api4.thetvdb.com/v4/series/{tvdb_id}"
-            response = self.tvdb_session.get(url)
+            response = self._tvdb_get(url)
             
             if hasattr(response, 'json'):
                 data = response.json()
@@ -137,7 +177,7 @@ class MetadataAdapter:
         try:
             # TVDB allows searching by remote_id
             url = f"https://api4.thetvdb.com/v4/search?remote_id={remote_id}"
-            response = self.tvdb_session.get(url)
+            response = self._tvdb_get(url)
             
             if hasattr(response, 'json'):
                 data = response.json()
@@ -7,12 +7,24 @@ fetching metadata, and syncing watch history.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple, TypeVar
+
+from ..http_cache import CachedSession
+from ..http_utils import API_TIMEOUT
+from ..transport import HttpTransport, get_transport
 
 logger = logging.getLogger(__name__)
 
+# Max episodes per /sync/history POST (a timeout only fails one chunk)
+DEFAULT_HISTORY_CHUNK_SIZE = 100
+# Concurrent history POSTs; the transport's write budget (1/s) still applies
+DEFAULT_PUSH_CONCURRENCY = 2
+
+T = TypeVar("T")
+
 
 @dataclass
 class TraktShow:
@@ -41,6 +53,104 @@ class TraktEpisode:
     watched_at: Optional[datetime] = None
 
 
+@dataclass
+class SyncChunkResult:
+    """Outcome of one /sync/history POST."""
+    episodes: List[TraktEpisode] = field(default_factory=list)
+    added: int = 0
+    existing: int = 0
+    failed: int = 0
+    rejected: List[TraktEpisode] = field(default_factory=list)  # not_found items
+    
+    @property
+    def ok(self) -> bool:
+        """True if Trakt accepted the chunk."""
+        return self.failed == 0
+    
+    @property
+    def accepted(self) -> List[TraktEpisode]:
+        """Episodes of a successful chunk that Trakt did not reject."""
+        if not self.ok:
+            return []
+        rejected = {episode_key(ep) for ep in self.rejected}
+        return [ep for ep in self.episodes if episode_key(ep) not in rejected]
+
+
+def episode_key(ep: TraktEpisode) -> Tuple[int, int, int]:
+    """Identity of an episode within a /sync/history request."""
+    return (ep.show_trakt_id, ep.season, ep.episode)
+
+
+def chunk_by_show(
+    items: List[T],
+    chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+    show_id: Callable[[T], Any] = lambda ep: ep.show_trakt_id,
+) -> List[List[T]]:
+    """Split episodes into size-bounded chunks, keeping each show together.
+    
+    Shows are packed into chunks in first-seen order; only a show with more
+    than chunk_size episodes is split (into chunks of its own).
+    
+    Args:
+        items: Episodes (or anything carrying a show id)
+        chunk_size: Max items per chunk
+        show_id: Extracts the show key from an item
+        
+    Returns:
+        List of chunks
+    """
+    chunk_size = max(1, chunk_size)
+    by_show: Dict[Any, List[T]] = {}
+    for item in items:
+        by_show.setdefault(show_id(item), []).append(item)
+    
+    chunks: List[List[T]] = []
+    current: List[T] = []
+    for show_items in by_show.values():
+        for start in range(0, len(show_items), chunk_size):
+            part = show_items[start:start + chunk_size]
+            if current and len(current) + len(part) > chunk_size:
+                chunks.append(current)
+                current = []
+            current.extend(part)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _not_found_keys(not_found: Dict[str, Any]) -> Set[Tuple[int, Optional[int], Optional[int]]]:
+    """Collect the not_found section of a /sync/history response.
+    
+    Shows are echoed back as sent: with the seasons/episodes Trakt could not
+    resolve, or bare when the show itself is unknown. Bare entries become
+    (trakt_id, None, None), matching every episode of that show.
+    """
+    keys = set()
+    for show in not_found.get("shows") or []:
+        trakt_id = (show.get("ids") or {}).get("trakt")
+        if trakt_id is None:
+            continue
+        seasons = show.get("seasons")
+        if not seasons:
+            keys.add((trakt_id, None, None))
+            continue
+        for season in seasons:
+            episodes = season.get("episodes")
+            if not episodes:
+                keys.add((trakt_id, season.get("number"), None))
+            for episode in episodes or []:
+                keys.add((trakt_id, season.get("number"), episode.get("number")))
+    return keys
+
+
+def _is_not_found(ep: TraktEpisode, keys: Set[Tuple[int, Optional[int], Optional[int]]]) -> bool:
+    return (
+        (ep.show_trakt_id, None, None) in keys
+        or (ep.show_trakt_id, ep.season, None) in keys
+        or episode_key(ep) in keys
+    )
+
+
 class TraktClientProtocol(Protocol):
     """Protocol defining what we need from a Trakt client."""
     
@@ -173,19 +283,80 @@ class TraktAdapter:
             return dt.isoformat()
         return str(dt)
     
-    def sync_watched(self, episodes: List[TraktEpisode]) -> Dict[str, int]:
+    def sync_watched(
+        self,
+        episodes: List[TraktEpisode],
+        chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+    ) -> Dict[str, Any]:
         """Sync watched episodes to Trakt.
         
+        Large batches are split into chunks (see sync_watched_chunks); the
+        counts are totals over all chunks.
+        
+        Args:
+            episodes: List of episodes to mark as watched
+            chunk_size: Max episodes per POST
+            max_concurrency: Max concurrent POSTs
+            
+        Returns:
+            Dict with 'added', 'existing', 'failed' counts and 'rejected',
+            the episodes Trakt reported as not_found
+        """
+        totals: Dict[str, Any] = {"added": 0, "existing": 0, "failed": 0, "rejected": []}
+        for chunk in self.sync_watched_chunks(episodes, chunk_size, max_concurrency):
+            totals["added"] += chunk.added
+            totals["existing"] += chunk.existing
+            totals["failed"] += chunk.failed
+            totals["rejected"].extend(chunk.rejected)
+        return totals
+    
+    def sync_watched_chunks(
+        self,
+        episodes: List[TraktEpisode],
+        chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+    ) -> List[SyncChunkResult]:
+        """Sync watched episodes in show-grouped chunks, reporting each chunk.
+        
+        A failed POST only fails its own chunk, so callers can mark the
+        episodes of successful chunks as synced and retry the rest.
+        
         Args:
             episodes: List of episodes to mark as watched
+            chunk_size: Max episodes per POST
+            max_concurrency: Max concurrent POSTs
             
         Returns:
-            Dict with 'added', 'existing', 'failed' counts
+            One SyncChunkResult per chunk, in chunk order
         """
-        if not episodes:
-            return {"added": 0, "existing": 0, "failed": 0}
+        chunks = chunk_by_show(episodes, chunk_size)
+        if not chunks:
+            return []
+        if len(chunks) == 1:
+            return [self._sync_chunk(chunks[0])]
         
-        # Group episodes by show for batch sync
+        workers = max(1, min(max_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trakt-push") as pool:
+            return list(pool.map(self._sync_chunk, chunks))
+    
+    def _sync_chunk(self, episodes: List[TraktEpisode]) -> SyncChunkResult:
+        """POST one chunk to /sync/history."""
+        try:
+            result = self._post_sync_history(self._build_history_payload(episodes))
+            not_found = _not_found_keys(result.get("not_found") or {})
+            return SyncChunkResult(
+                episodes=episodes,
+                added=result.get("added", {}).get("episodes", 0),
+                existing=result.get("existing", {}).get("episodes", 0),
+                rejected=[ep for ep in episodes if _is_not_found(ep, not_found)],
+            )
+        except Exception as e:
+            logger.error(f"Failed to sync {len(episodes)} episodes to Trakt: {e}")
+            return SyncChunkResult(episodes=episodes, failed=len(episodes))
+    
+    def _build_history_payload(self, episodes: List[TraktEpisode]) -> Dict:
+        """Build a /sync/history payload grouped by show and season."""
         shows_data = {}
         for ep in episodes:
             if ep.show_trakt_id not in shows_data:
@@ -196,8 +367,7 @@ class TraktAdapter:
                 "watched_at": self._format_datetime(ep.watched_at),
             })
         
-        # Build sync payload
-        payload = {
+        return {
             "shows": [
                 {
                     "ids": {"trakt": trakt_id},
@@ -206,41 +376,6 @@ class TraktAdapter:
                 for trakt_id, eps in shows_data.items()
             ]
         }
-        
-        # Call Trakt sync/history endpoint
-        try:
-            result = self._post_sync_history(payload)
-            return {
-                "added": result.get("added", {}).get("episodes", 0),
-                "existing": result.get("existing", {}).get("episodes", 0),  # FIXED: was 'not_found'
-                "failed": 0,
-            }
-        except Exception as e:
-            logger.error(f"Failed to sync {len(episodes)} episodes to Trakt: {e}")
-            return {"added": 0, "existing": 0, "failed": len(episodes)}
-        
-        # Build sync payload
-        payload = {
-            "shows": [
-                {
-                    "ids": {"trakt": trakt_id},
-                    "seasons": self._group_episodes_by_season(eps)
-                }
-                for trakt_id, eps in shows_data.items()
-            ]
-        }
-        
-        # Call Trakt sync/history endpoint
-        try:
-            result = self._post_sync_history(payload)
-            return {
-                "added": result.get("added", {}).get("episodes", 0),
-                "existing": result.get("not_found", {}).get("episodes", 0),
-                "failed": 0,
-            }
-        except Exception as e:
-            logger.error(f"Failed to sync {len(episodes)} episodes to Trakt: {e}")
-            return {"added": 0, "existing": 0, "failed": len(episodes)}
     
     def _group_episodes_by_season(self, episodes: List[Dict]) -> List[Dict]:
         """Group episodes by season for Trakt API."""
@@ -255,31 +390,99 @@ class TraktAdapter:
             })
         return list(seasons.values())
     
-    def _post_sync_history(self, payload: Dict) -> Dict:
-        """Post to Trakt sync/history endpoint.
+    def get_last_activities(self) -> Optional[Dict[str, Any]]:
+        """Get the user's /sync/last_activities timestamps.
         
-        Uses direct HTTP since we need the sync endpoint.
+        Returns:
+            Activities dict (e.g. {"episodes": {"watched_at": ...}}), or None on error
         """
-        import requests
+        try:
+            return self._get_sync("/sync/last_activities")
+        except Exception as e:
+            logger.error(f"Failed to get Trakt last activities: {e}")
+            return None
+    
+    def get_watched_shows(self) -> Optional[List[Dict[str, Any]]]:
+        """Get every show the user has watched, with seasons and episodes.
         
+        Returns:
+            /sync/watched/shows items, or None on error (an empty list means
+            nothing is watched)
+        """
+        try:
+            return self._get_sync("/sync/watched/shows")
+        except Exception as e:
+            logger.error(f"Failed to get Trakt watched shows: {e}")
+            return None
+    
+    def get_seasons(self, trakt_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Get a show's seasons with their episodes.
+        
+        Args:
+            trakt_id: Trakt show ID
+            
+        Returns:
+            /shows/{id}/seasons?extended=episodes items, or None on error
+        """
+        try:
+            return self._get_api(f"/shows/{trakt_id}/seasons?extended=episodes", auth=False, endpoint="seasons")
+        except Exception as e:
+            logger.error(f"Failed to get Trakt seasons for {trakt_id}: {e}")
+            return None
+    
+    def _auth_headers(self, auth: bool = True) -> Dict[str, str]:
+        """Build Trakt API headers (with the user's token for /sync endpoints)."""
         # Get credentials from client
         client_id = getattr(self.client, 'client_id', None)
         access_token = getattr(self.client, 'access_token', None)
         
         if not client_id:
             raise RuntimeError("Trakt client_id not available")
-        if not access_token:
-            raise RuntimeError("Trakt access_token required for sync")
         
         headers = {
             'Content-Type': 'application/json',
             'trakt-api-version': '2',
             'trakt-api-key': client_id,
-            'Authorization': f'Bearer {access_token}',
         }
+        if auth:
+            if not access_token:
+                raise RuntimeError("Trakt access_token required for sync")
+            headers['Authorization'] = f'Bearer {access_token}'
+        return headers
+    
+    def _transport(self) -> HttpTransport:
+        transport = getattr(self.client, 'transport', None)
+        if not isinstance(transport, HttpTransport):
+            transport = get_transport()
+        return transport
+    
+    def _get_sync(self, path: str) -> Any:
+        """GET an authenticated Trakt endpoint and decode the JSON body."""
+        return self._get_api(path)
+    
+    def _get_api(self, path: str, auth: bool = True, endpoint: Optional[str] = None) -> Any:
+        """GET a Trakt endpoint and decode the JSON body.
         
+        Public (auth=False) requests go through the client's HTTP cache when
+        it has one; user-specific ones always hit the network.
+        """
+        url = f"https://api.trakt.tv{path}"
+        headers = self._auth_headers(auth)
+        http_cache = getattr(self.client, 'http_cache', None)
+        if not auth and isinstance(http_cache, CachedSession):
+            resp = http_cache.get(url, endpoint=endpoint, headers=headers, timeout=API_TIMEOUT)
+        else:
+            resp = self._transport().get(url, headers=headers, timeout=API_TIMEOUT)
+        resp.raise_for_status()
+        return resp.json()
+    
+    def _post_sync_history(self, payload: Dict) -> Dict:
+        """Post to Trakt sync/history endpoint.
+        
+        Uses direct HTTP since we need the sync endpoint.
+        """
         url = "https://api.trakt.tv/sync/history"
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
+        resp = self._transport().post(url, headers=self._auth_headers(), json=payload, timeout=API_TIMEOUT)
         resp.raise_for_status()
         
         return resp.json()
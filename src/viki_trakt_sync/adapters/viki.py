@@ -13,12 +13,19 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Deque, Dict, Iterator, List, Optional, Protocol, Tuple, Union
+
+from ..pagination import DEFAULT_PAGE_PREFETCH, iter_pages
 
 logger = logging.getLogger(__name__)
 
+# Concurrent episode-list fetches against api.viki.io during enrichment
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 @dataclass
 class VikiBillboardItem:
@@ -52,6 +59,14 @@ class VikiClientProtocol(Protocol):
     def get_episodes(self, container_id: str, page: int = 1, per_page: int = 100) -> Dict[str, Any]: ...
     def get_watch_markers(self, from_timestamp: int = 1) -> Dict[str, Any]: ...
     def get_watchlaters(self, ids_only: bool = True, page: int = 1, per_page: int = 100) -> Dict[str, Any]: ...
+    # Optional: def iter_watch_markers(self, from_timestamp: int = 1) -> Iterator[Tuple[str, Dict[str, Any]]]
+
+
+class EpisodeCacheProtocol(Protocol):
+    """Protocol for a persistent episode metadata store (see EpisodeMetadataCache)."""
+    
+    def lookup(self, viki_id: str, video_ids: List[str]) -> Optional[List[VikiEpisode]]: ...
+    def store(self, viki_id: str, episodes: List[VikiEpisode]) -> None: ...
 
 
 class VikiAdapter:
@@ -60,13 +75,30 @@ class VikiAdapter:
     Wraps VikiClient to provide a clean domain-focused interface.
     """
     
-    def __init__(self, client: VikiClientProtocol):
+    def __init__(
+        self,
+        client: VikiClientProtocol,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        episode_cache: Optional[EpisodeCacheProtocol] = None,
+        page_prefetch: int = DEFAULT_PAGE_PREFETCH,
+    ):
         """Initialize adapter with a Viki client.
         
         Args:
             client: VikiClient instance (or mock for testing)
+            max_concurrency: Max concurrent episode-list requests to api.viki.io
+                             during enrichment (1 = sequential)
+            episode_cache: Optional persistent episode metadata store; containers
+                           it can serve are not refetched during enrichment
+            page_prefetch: Pages of a paginated list requested ahead of the one
+                           being parsed (0 = strictly one page at a time)
         """
         self.client = client
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.episode_cache = episode_cache
+        self.page_prefetch = max(0, int(page_prefetch))
+        # container_id -> error message from the last enrichment run
+        self.enrichment_errors: Dict[str, str] = {}
     
     def get_billboard(self) -> List[VikiBillboardItem]:
         """Fetch the user's watchlist (billboard) from Viki.
@@ -78,40 +110,41 @@ class VikiAdapter:
         page = 1
         per_page = 100
         
-        while True:
-            try:
-                response = self.client.get_watchlist(page=page, per_page=per_page)
-            except Exception as e:
-                logger.error(f"Failed to fetch watchlist page {page}: {e}")
-                break
-            
-            shows = response.get("response", [])
-            if not shows:
-                break
-            
-            for show in shows:
-                # Extract last_watched info for change detection
-                last_watched = show.get("last_watched", {})
+        pages = iter_pages(
+            lambda n: self.client.get_watchlist(page=n, per_page=per_page),
+            prefetch=self.page_prefetch,
+            page_size=per_page,
+        )
+        try:
+            for response in pages:
+                shows = response.get("response", [])
+                if not shows:
+                    break
                 
-                items.append(VikiBillboardItem(
-                    viki_id=show.get("id", ""),
-                    title=self._get_title(show),
-                    type=show.get("type", "series"),
-                    origin_country=show.get("origin", {}).get("country"),
-                    origin_language=show.get("origin", {}).get("language"),
-                    last_video_id=last_watched.get("id") if last_watched else None,
-                    last_watched_at=last_watched.get("updated_at") if last_watched else None,
-                ))
-            
-            if not response.get("more", False):
-                break
-            
-            page += 1
+                for show in shows:
+                    # Extract last_watched info for change detection
+                    last_watched = show.get("last_watched", {})
+                    
+                    items.append(VikiBillboardItem(
+                        viki_id=show.get("id", ""),
+                        title=self._get_title(show),
+                        type=show.get("type", "series"),
+                        origin_country=show.get("origin", {}).get("country"),
+                        origin_language=show.get("origin", {}).get("language"),
+                        last_video_id=last_watched.get("id") if last_watched else None,
+                        last_watched_at=last_watched.get("updated_at") if last_watched else None,
+                    ))
+                
+                page += 1
+        except Exception as e:
+            logger.error(f"Failed to fetch watchlist page {page}: {e}")
+        finally:
+            pages.close()
         
         logger.info(f"Fetched {len(items)} shows from Viki billboard")
         return items
     
-    def get_episodes(self, viki_id: str) -> List[VikiEpisode]:
+    def get_episodes(self, viki_id: str, strict: bool = False) -> List[VikiEpisode]:
         """Fetch all episodes for a show.
         
         Episodes are fetched from the container endpoint, which returns video IDs.
@@ -120,6 +153,7 @@ class VikiAdapter:
         
         Args:
             viki_id: Viki container ID
+            strict: Re-raise page fetch errors instead of returning partial results
             
         Returns:
             List of episodes with metadata
@@ -128,48 +162,51 @@ class VikiAdapter:
         page = 1
         per_page = 100
         
-        # First, get list of video IDs from the container
-        while True:
-            try:
-                response = self.client.get_episodes(viki_id, page=page, per_page=per_page)
-            except Exception as e:
-                logger.error(f"Failed to fetch episodes for {viki_id} page {page}: {e}")
-                break
-            
-            eps = response.get("response", [])
-            if not eps:
-                break
-            
-            # The response is a list of video IDs or video objects
-            # For each, we may need to fetch full details to get watch_marker
-            for ep in eps:
-                # If it's a string (just ID), we'll still create episode entry
-                # with basic info and fetch watch marker separately
-                if isinstance(ep, str):
-                    video_id = ep
-                    # We could fetch full video details here, but for now
-                    # we create a basic entry and rely on get_watch_progress() for markers
-                    episodes.append(VikiEpisode(
-                        viki_video_id=video_id,
-                        viki_id=viki_id,
-                        episode_number=0,  # Will be updated from full video data
-                        duration=0,  # Will be updated from full video data
-                    ))
-                else:
-                    # It's a dict with episode data
-                    episodes.append(VikiEpisode(
-                        viki_video_id=ep.get("id", ""),
-                        viki_id=viki_id,
-                        episode_number=ep.get("number", 0),
-                        duration=ep.get("duration", 0),
-                        watched_seconds=ep.get("watch_marker", 0),  # Extract if present
-                        credits_marker=ep.get("credits_marker"),
-                    ))
-            
-            if not response.get("more", False):
-                break
-            
-            page += 1
+        # First, get list of video IDs from the container (pages pipelined)
+        pages = iter_pages(
+            lambda n: self.client.get_episodes(viki_id, page=n, per_page=per_page),
+            prefetch=self.page_prefetch,
+            page_size=per_page,
+        )
+        try:
+            for response in pages:
+                eps = response.get("response", [])
+                if not eps:
+                    break
+                
+                # The response is a list of video IDs or video objects
+                # For each, we may need to fetch full details to get watch_marker
+                for ep in eps:
+                    # If it's a string (just ID), we'll still create episode entry
+                    # with basic info and fetch watch marker separately
+                    if isinstance(ep, str):
+                        video_id = ep
+                        # We could fetch full video details here, but for now
+                        # we create a basic entry and rely on get_watch_progress() for markers
+                        episodes.append(VikiEpisode(
+                            viki_video_id=video_id,
+                            viki_id=viki_id,
+                            episode_number=0,  # Will be updated from full video data
+                            duration=0,  # Will be updated from full video data
+                        ))
+                    else:
+                        # It's a dict with episode data
+                        episodes.append(VikiEpisode(
+                            viki_video_id=ep.get("id", ""),
+                            viki_id=viki_id,
+                            episode_number=ep.get("number", 0),
+                            duration=ep.get("duration", 0),
+                            watched_seconds=ep.get("watch_marker", 0),  # Extract if present
+                            credits_marker=ep.get("credits_marker"),
+                        ))
+                
+                page += 1
+        except Exception as e:
+            if strict:
+                raise
+            logger.error(f"Failed to fetch episodes for {viki_id} page {page}: {e}")
+        finally:
+            pages.close()
         
         logger.debug(f"Fetched {len(episodes)} episodes for {viki_id}")
         return episodes
@@ -215,7 +252,11 @@ class VikiAdapter:
         logger.info(f"Fetched watch progress for {len(progress)} shows from timestamp {from_timestamp}")
         return progress
     
-    def get_watch_status_with_metadata(self, from_timestamp: int = 1) -> tuple[Dict[str, Dict[str, Any]], int]:
+    def get_watch_status_with_metadata(
+        self,
+        from_timestamp: int = 1,
+        force_refresh: bool = False,
+    ) -> tuple[Dict[str, Dict[str, Any]], int]:
         """PRIMARY METHOD: Fetch watch status with enriched metadata.
         
         This is the primary data source for the sync. Returns watch status
@@ -223,6 +264,7 @@ class VikiAdapter:
         
         Args:
             from_timestamp: Unix timestamp to fetch markers from (1 = all history)
+            force_refresh: Ignore the episode cache and refetch every episode list
         
         Returns:
             Tuple of:
@@ -239,11 +281,17 @@ class VikiAdapter:
           1. Fetch watch markers (PRIMARY - what's actually watched)
              - Uses ?from=<timestamp> parameter for incremental updates
              - Returns ALL markers >= timestamp in ONE global call
-          2. For each watched video, fetch episode metadata
+          2. For each watched container, use cached episode metadata if the
+             episode cache knows every watched video; otherwise fetch it
+             (up to max_concurrency containers at once) and store it
           3. Merge and return
+        
+        Containers whose episode list could not be fetched are still returned
+        (with empty metadata) and recorded in ``enrichment_errors``.
         """
         # Capture timestamp BEFORE fetch to ensure we don't miss updates
         current_timestamp = int(time.time())
+        self.enrichment_errors = {}
         
         # Step 1: Get watch status (SOURCE OF TRUTH) - ONE global call
         watch_markers_response = self.client.get_watch_markers(from_timestamp=from_timestamp)
@@ -253,39 +301,188 @@ class VikiAdapter:
             logger.info("No watch status found")
             return {}, current_timestamp
         
-        # Step 2: Enrich with episode metadata
-        result = {}
+        # Step 2: Enrich with episode metadata (cache first, then bounded concurrency)
+        episodes_by_container: Dict[str, List[VikiEpisode]] = {}
+        to_fetch = []
+        for container_id, videos in watch_markers.items():
+            cached = None if force_refresh else self.get_cached_episodes(container_id, list(videos))
+            if cached is None:
+                to_fetch.append(container_id)
+            else:
+                episodes_by_container[container_id] = cached
+        
+        fetched = self._fetch_episodes_concurrently(to_fetch)
+        for container_id, episodes in fetched.items():
+            self.store_cached_episodes(container_id, episodes)
+        episodes_by_container.update(fetched)
         
+        # Step 3: Merge in marker order so the result is deterministic
+        result = {}
         for container_id, videos in watch_markers.items():
-            result[container_id] = {}
-            
-            # Fetch episodes for this show to get metadata
-            episodes = self.get_episodes(container_id)
-            episode_by_id = {ep.viki_video_id: ep for ep in episodes}
-            
-            # Merge watch status with episode metadata
-            for video_id, marker in videos.items():
-                # marker might be a dict with watch_marker, timestamp, etc.
-                if isinstance(marker, dict):
-                    watched_seconds = marker.get("watch_marker", marker.get("watched_seconds", 0))
-                    timestamp = marker.get("timestamp")  # Viki's timestamp for when watched
-                else:
-                    watched_seconds = marker
-                    timestamp = None
-                
-                episode = episode_by_id.get(video_id)
-                
-                result[container_id][video_id] = {
-                    "watched_seconds": watched_seconds,
-                    "episode_number": episode.episode_number if episode else 0,
-                    "duration": episode.duration if episode else 0,
-                    "credits_marker": episode.credits_marker if episode else None,
-                    "timestamp": timestamp,  # Include Viki's marker timestamp
-                }
+            result[container_id] = self._merge_markers(
+                videos, episodes_by_container.get(container_id, [])
+            )
         
         logger.info(f"Watch status with metadata for {len(result)} shows")
         return result, current_timestamp
     
+    def iter_watch_status_with_metadata(
+        self,
+        from_timestamp: int = 1,
+        force_refresh: bool = False,
+    ) -> Iterator[Tuple[str, Dict[str, Dict[str, Any]]]]:
+        """Streaming variant of get_watch_status_with_metadata.
+        
+        Markers are read container by container (client.iter_watch_markers
+        when available) and enriched through a bounded window of in-flight
+        episode fetches, so memory stays bounded however long the history is.
+        The caller should capture its own timestamp before iterating.
+        
+        Args:
+            from_timestamp: Unix timestamp to fetch markers from (1 = all history)
+            force_refresh: Ignore the episode cache and refetch every episode list
+        
+        Yields:
+            (container_id, {video_id: enriched marker}) tuples, in marker order;
+            see get_watch_status_with_metadata for the marker fields
+        """
+        self.enrichment_errors = {}
+        window = self.max_concurrency * 2
+        pending: Deque[Tuple[str, Dict[str, Any], Union[Future, List[VikiEpisode]]]] = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="viki-enrich") as pool:
+            for container_id, videos in self._iter_watch_markers(from_timestamp):
+                cached = None if force_refresh else self.get_cached_episodes(container_id, list(videos))
+                if cached is None:
+                    pending.append((container_id, videos, pool.submit(self.get_episodes, container_id, strict=True)))
+                else:
+                    pending.append((container_id, videos, cached))
+                
+                # Emit in order: anything resolved at the head, or block once the window is full
+                while pending and (len(pending) > window or not isinstance(pending[0][2], Future)):
+                    yield self._resolve_enrichment(*pending.popleft())
+            
+            while pending:
+                yield self._resolve_enrichment(*pending.popleft())
+        
+        if self.enrichment_errors:
+            logger.warning(f"Episode enrichment failed for {len(self.enrichment_errors)} shows")
+    
+    def _iter_watch_markers(self, from_timestamp: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate raw markers, streaming if the client supports it."""
+        iter_markers = getattr(self.client, "iter_watch_markers", None)
+        if callable(iter_markers):
+            yield from iter_markers(from_timestamp=from_timestamp)
+        else:
+            response = self.client.get_watch_markers(from_timestamp=from_timestamp)
+            yield from response.get("markers", {}).items()
+    
+    def _resolve_enrichment(
+        self,
+        container_id: str,
+        videos: Dict[str, Any],
+        outcome: Union[Future, List[VikiEpisode]],
+    ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        """Wait for one container's episodes (if fetched) and merge its markers."""
+        if isinstance(outcome, Future):
+            try:
+                episodes = outcome.result()
+                self.store_cached_episodes(container_id, episodes)
+            except Exception as e:
+                logger.error(f"Failed to fetch episodes for {container_id}: {e}")
+                self.enrichment_errors[container_id] = str(e)
+                episodes = []
+        else:
+            episodes = outcome
+        return container_id, self._merge_markers(videos, episodes)
+    
+    def _fetch_episodes_concurrently(self, container_ids: List[str]) -> Dict[str, List[VikiEpisode]]:
+        """Fetch episode lists for many containers, isolating failures.
+        
+        Args:
+            container_ids: Viki container IDs to fetch
+            
+        Returns:
+            Dict mapping container_id -> episodes (failed containers are omitted
+            and recorded in ``enrichment_errors``)
+        """
+        episodes_by_container: Dict[str, List[VikiEpisode]] = {}
+        
+        if not container_ids:
+            return episodes_by_container
+        
+        workers = min(self.max_concurrency, len(container_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="viki-enrich") as pool:
+            futures = {
+                container_id: pool.submit(self.get_episodes, container_id, strict=True)
+                for container_id in container_ids
+            }
+            for container_id, future in futures.items():
+                try:
+                    episodes_by_container[container_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch episodes for {container_id}: {e}")
+                    self.enrichment_errors[container_id] = str(e)
+        
+        if self.enrichment_errors:
+            logger.warning(
+                f"Episode enrichment failed for {len(self.enrichment_errors)}/{len(container_ids)} shows"
+            )
+        return episodes_by_container
+    
+    def get_cached_episodes(self, viki_id: str, video_ids: List[str]) -> Optional[List[VikiEpisode]]:
+        """Look up a container's episodes in the episode cache.
+        
+        Args:
+            viki_id: Viki container ID
+            video_ids: Video IDs that need metadata
+            
+        Returns:
+            Cached episodes, or None if there is no cache or it can't serve them
+        """
+        if self.episode_cache is None:
+            return None
+        try:
+            return self.episode_cache.lookup(viki_id, video_ids)
+        except Exception as e:
+            logger.warning(f"Episode cache lookup failed for {viki_id}: {e}")
+            return None
+    
+    def store_cached_episodes(self, viki_id: str, episodes: List[VikiEpisode]) -> None:
+        """Store a fetched episode list in the episode cache (if any)."""
+        if self.episode_cache is None or not episodes:
+            return
+        try:
+            self.episode_cache.store(viki_id, episodes)
+        except Exception as e:
+            logger.warning(f"Episode cache store failed for {viki_id}: {e}")
+    
+    def _merge_markers(self, videos: Dict[str, Any], episodes: List[VikiEpisode]) -> Dict[str, Dict[str, Any]]:
+        """Merge one container's watch markers with its episode metadata."""
+        episode_by_id = {ep.viki_video_id: ep for ep in episodes}
+        merged = {}
+        
+        for video_id, marker in videos.items():
+            # marker might be a dict with watch_marker, timestamp, etc.
+            if isinstance(marker, dict):
+                watched_seconds = marker.get("watch_marker", marker.get("watched_seconds", 0))
+                timestamp = marker.get("timestamp")  # Viki's timestamp for when watched
+            else:
+                watched_seconds = marker
+                timestamp = None
+            
+            episode = episode_by_id.get(video_id)
+            
+            merged[video_id] = {
+                "watched_seconds": watched_seconds,
+                "episode_number": episode.episode_number if episode else 0,
+                "duration": episode.duration if episode else 0,
+                "credits_marker": episode.credits_marker if episode else None,
+                "timestamp": timestamp,  # Include Viki's marker timestamp
+            }
+        
+        return merged
+    
     def get_container(self, viki_id: str) -> Optional[Dict[str, Any]]:
         """Fetch container (show) metadata.
         
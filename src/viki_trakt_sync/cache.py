@@ -2,9 +2,14 @@
 
 import json
 import logging
-from datetime import datetime, timezone, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .adapters.trakt import TraktAdapter
+    from .adapters.viki import VikiEpisode
+    from .repository import Repository
 
 logger = logging.getLogger(__name__)
 
@@ -237,3 +242,447 @@ class ShowMetadataCache:
         self.cache = {}
         self._save()
         logger.info("Cleared show metadata cache")
+
+
+# Container title/type/origin almost never change
+DEFAULT_CONTAINER_TTL = timedelta(days=30)
+
+# Episode lists change rarely once a show has aired; new episodes show up
+# as unknown video ids and trigger a refetch regardless of age
+DEFAULT_EPISODE_TTL = timedelta(days=7)
+
+# Trakt season layouts only change when a show airs or is re-split
+DEFAULT_SEASON_MAP_TTL = timedelta(days=30)
+
+
+class EpisodeMetadataCache:
+    """Per-container episode metadata cache backed by the Episode table.
+
+    Episode rows already hold episode_number, duration and credits_marker,
+    so the cache only adds Show.episodes_fetched_at to know when a full
+    episode list was last stored. A container is served from the database
+    when every watched video id is already known AND its list is younger
+    than the TTL; anything else is a miss and the list is refetched.
+
+    Not thread-safe: call lookup()/store() from the thread that owns the
+    database connection (the enrichment workers only do network I/O).
+    """
+
+    def __init__(self, repository: "Repository", ttl: timedelta = DEFAULT_EPISODE_TTL):
+        """Initialize cache.
+
+        Args:
+            repository: Repository used for storage
+            ttl: Max age of a cached episode list
+        """
+        self.repo = repository
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, viki_id: str, video_ids: Iterable[str]) -> Optional[List["VikiEpisode"]]:
+        """Get a container's cached episodes, if still valid.
+
+        Args:
+            viki_id: Viki container ID
+            video_ids: Video IDs the caller needs metadata for
+
+        Returns:
+            Cached episodes, or None on a miss (unknown video id or stale list)
+        """
+        from .adapters.viki import VikiEpisode
+
+        show = self.repo.get_show(viki_id)
+        fetched_at = show.episodes_fetched_at if show else None
+        if fetched_at is None or self._is_stale(fetched_at):
+            self.misses += 1
+            return None
+
+        rows = {ep.viki_video_id: ep for ep in self.repo.get_show_episodes(viki_id)}
+        if any(video_id not in rows for video_id in video_ids):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [
+            VikiEpisode(
+                viki_video_id=row.viki_video_id,
+                viki_id=viki_id,
+                episode_number=row.episode_number or 0,
+                duration=row.duration or 0,
+                credits_marker=row.credits_marker,
+            )
+            for row in rows.values()
+        ]
+
+    def store(self, viki_id: str, episodes: List["VikiEpisode"]) -> None:
+        """Store a freshly fetched episode list.
+
+        Args:
+            viki_id: Viki container ID
+            episodes: Full episode list for the container
+        """
+        self.repo.store_episode_metadata(viki_id, [
+            {
+                "viki_video_id": ep.viki_video_id,
+                "episode_number": ep.episode_number,
+                "duration": ep.duration,
+                "credits_marker": ep.credits_marker,
+            }
+            for ep in episodes
+            if ep.viki_video_id
+        ])
+
+    def invalidate(self, viki_id: str) -> None:
+        """Drop a container's cached list so the next lookup misses."""
+        self.repo.invalidate_episode_metadata(viki_id)
+
+    def stats(self) -> Dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses and hit_rate (0.0-1.0)
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _is_stale(self, fetched_at: datetime) -> bool:
+        return _is_older_than(fetched_at, self.ttl)
+
+
+class ContainerMetadataCache:
+    """Container (show) metadata cache backed by the Show table.
+
+    Title, type and origin already live on the Show row, so the cache only
+    tracks Show.container_fetched_at to decide which shows must be fetched
+    from Viki again. Shows never fetched, or fetched longer ago than the
+    TTL, are stale; everything else is served from the database.
+    """
+
+    def __init__(self, repository: "Repository", ttl: timedelta = DEFAULT_CONTAINER_TTL):
+        """Initialize cache.
+
+        Args:
+            repository: Repository used for storage
+            ttl: Max age of cached container metadata
+        """
+        self.repo = repository
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def stale(self, viki_ids: List[str], force_refresh: bool = False) -> List[str]:
+        """Select the shows whose container metadata must be refetched.
+
+        Args:
+            viki_ids: Viki container IDs needed by this run
+            force_refresh: Treat every show as stale
+
+        Returns:
+            Stale IDs, in input order
+        """
+        fetched = {} if force_refresh else self.repo.get_container_fetched_times(viki_ids)
+        stale = [
+            viki_id for viki_id in viki_ids
+            if fetched.get(viki_id) is None or _is_older_than(fetched[viki_id], self.ttl)
+        ]
+        self.misses += len(stale)
+        self.hits += len(viki_ids) - len(stale)
+        return stale
+
+    def mark_fetched(self, viki_id: str) -> None:
+        """Record a successful container fetch (the Show row must exist)."""
+        self.repo.mark_container_fetched(viki_id)
+
+    def stats(self) -> Dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses and hit_rate (0.0-1.0)
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class TraktWatchedIndex:
+    """Local index of the episodes already watched on Trakt.
+
+    Each show's seasons are kept as bitsets (bit n set = episode n watched),
+    so membership checks are O(1) and the whole index for a large history
+    fits in a small JSON blob stored in SyncMetadata.
+
+    refresh() is incremental: /sync/last_activities is cheap, and the full
+    /sync/watched/shows list is only refetched when its episodes.watched_at
+    timestamp moved since the index was built. A push by this tool moves
+    that timestamp too, so the index is rebuilt on the run after a push.
+
+    Usage:
+        index = TraktWatchedIndex(repo)
+        index.refresh(trakt_adapter)
+        if index.contains(trakt_id, season=1, episode=3):
+            ...  # already watched on Trakt, no need to push
+    """
+
+    METADATA_KEY = "trakt_watched_index"
+
+    def __init__(self, repository: "Repository"):
+        """Initialize index.
+
+        Args:
+            repository: Repository used for storage
+        """
+        self.repo = repository
+        self.watched_at: Optional[str] = None
+        self._shows: Optional[Dict[int, Dict[int, int]]] = None
+        self.refreshed = False
+        self.hits = 0
+        self.misses = 0
+
+    def refresh(self, trakt: "TraktAdapter", force: bool = False) -> bool:
+        """Bring the index up to date with Trakt.
+
+        Args:
+            trakt: Adapter used for the /sync requests
+            force: Rebuild even if Trakt reports no new watch activity
+
+        Returns:
+            True if the index was rebuilt, False if it was current (or Trakt
+            could not be reached, in which case the stored index is kept)
+        """
+        activities = trakt.get_last_activities()
+        if not force and self.is_current(activities):
+            logger.debug("Trakt watched index is current")
+            return False
+        if not isinstance(activities, dict):
+            return False
+        return self.rebuild(trakt.get_watched_shows(), activities)
+
+    def is_current(self, activities: Optional[Dict]) -> bool:
+        """Check /sync/last_activities against the activity the index was built from.
+
+        Returns:
+            True if no episode was watched (or unwatched) on Trakt since
+        """
+        self._load()
+        if not isinstance(activities, dict):
+            return False
+        watched_at = (activities.get("episodes") or {}).get("watched_at")
+        return watched_at is not None and watched_at == self.watched_at
+
+    def rebuild(self, items: Optional[List[Dict]], activities: Dict) -> bool:
+        """Replace the index with a fresh /sync/watched/shows list.
+
+        Args:
+            items: /sync/watched/shows items (None if the fetch failed)
+            activities: /sync/last_activities fetched before the items
+
+        Returns:
+            True if the index was rebuilt
+        """
+        if not isinstance(items, list):
+            return False
+        self._shows = self._build(items)
+        self.watched_at = (activities.get("episodes") or {}).get("watched_at")
+        self.refreshed = True
+        self._save()
+        logger.info(f"Rebuilt Trakt watched index ({len(self._shows)} shows)")
+        return True
+
+    def contains(self, show_trakt_id: int, season: int, episode: int) -> bool:
+        """Check whether an episode is already watched on Trakt."""
+        self._load()
+        mask = self._shows.get(show_trakt_id, {}).get(season, 0)
+        found = episode >= 0 and bool((mask >> episode) & 1)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def invalidate(self) -> None:
+        """Forget the stored activity timestamp so the next refresh rebuilds."""
+        self._load()
+        self.watched_at = None
+        self._save()
+
+    def stats(self) -> Dict:
+        """Get index statistics.
+
+        Returns:
+            Dict with shows, episodes, hits (already watched), misses and refreshed
+        """
+        self._load()
+        return {
+            "shows": len(self._shows),
+            "episodes": sum(
+                bin(mask).count("1") for seasons in self._shows.values() for mask in seasons.values()
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshed": self.refreshed,
+        }
+
+    @staticmethod
+    def _build(items: List[Dict]) -> Dict[int, Dict[int, int]]:
+        """Turn /sync/watched/shows items into per-season bitsets."""
+        shows: Dict[int, Dict[int, int]] = {}
+        for item in items:
+            trakt_id = ((item.get("show") or {}).get("ids") or {}).get("trakt")
+            if trakt_id is None:
+                continue
+            seasons = shows.setdefault(int(trakt_id), {})
+            for season in item.get("seasons") or []:
+                mask = seasons.get(season.get("number", 0), 0)
+                for episode in season.get("episodes") or []:
+                    number = episode.get("number")
+                    if isinstance(number, int) and number >= 0:
+                        mask |= 1 << number
+                if mask:
+                    seasons[season.get("number", 0)] = mask
+        return shows
+
+    def _load(self) -> None:
+        if self._shows is not None:
+            return
+        self._shows = {}
+        raw = self.repo.get_metadata(self.METADATA_KEY)
+        if not raw:
+            return
+        try:
+            data = json.loads(raw)
+            self.watched_at = data.get("watched_at")
+            self._shows = {
+                int(trakt_id): {int(season): int(mask, 16) for season, mask in seasons.items()}
+                for trakt_id, seasons in data.get("shows", {}).items()
+            }
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Discarding unreadable Trakt watched index: {e}")
+            self.watched_at = None
+            self._shows = {}
+
+    def _save(self) -> None:
+        self.repo.set_metadata(self.METADATA_KEY, json.dumps({
+            "watched_at": self.watched_at,
+            "shows": {
+                str(trakt_id): {str(season): format(mask, "x") for season, mask in seasons.items()}
+                for trakt_id, seasons in self._shows.items()
+            },
+        }))
+
+
+class TraktSeasonMapCache:
+    """Absolute episode number -> Trakt (season, episode), per Trakt show.
+
+    Viki numbers episodes 1..N, while Trakt may split the same show into
+    seasons. Each Trakt show's layout is fetched once from
+    /shows/{id}/seasons?extended=episodes, stored in the trakt_season_maps
+    table and refetched after the TTL. Specials (season 0) are ignored.
+
+    Fetching happens up front (stale() then store()); lookup() is a local
+    list index and never touches the network, so the push phase
+    costs no extra requests. Shows without a map fall back to season 1.
+    """
+
+    def __init__(self, repository: "Repository", ttl: timedelta = DEFAULT_SEASON_MAP_TTL):
+        """Initialize cache.
+
+        Args:
+            repository: Repository used for storage
+            ttl: Max age of a stored season map
+        """
+        self.repo = repository
+        self.ttl = ttl
+        self._maps: Dict[int, List[Tuple[int, int]]] = {}
+        self._fetched: set = set()  # Stored by this instance; never stale again
+        self.hits = 0
+        self.misses = 0
+
+    def stale(self, trakt_ids: Iterable[int], force_refresh: bool = False) -> List[int]:
+        """Load stored maps and select the shows whose map must be fetched.
+
+        Args:
+            trakt_ids: Trakt show IDs about to be pushed
+            force_refresh: Treat every map as stale
+
+        Returns:
+            Stale IDs, in first-seen order
+        """
+        trakt_ids = [trakt_id for trakt_id in dict.fromkeys(trakt_ids) if trakt_id not in self._fetched]
+        rows = self.repo.get_trakt_season_maps(trakt_ids)
+        stale = []
+        for trakt_id in trakt_ids:
+            row = rows.get(trakt_id)
+            if row is not None:
+                self._maps[trakt_id] = [tuple(pair) for pair in json.loads(row.episodes)]
+            if row is None or force_refresh or _is_older_than(row.fetched_at, self.ttl):
+                stale.append(trakt_id)
+        return stale
+
+    def store(self, trakt_id: int, seasons: Optional[List[Dict]]) -> None:
+        """Store a freshly fetched /shows/{id}/seasons?extended=episodes list.
+
+        A failed fetch (None) keeps whatever map is already loaded.
+        """
+        if not isinstance(seasons, list):
+            return
+        episodes = self._flatten(seasons)
+        self._maps[trakt_id] = episodes
+        self._fetched.add(trakt_id)
+        self.repo.store_trakt_season_map(trakt_id, [list(pair) for pair in episodes])
+
+    def lookup(self, trakt_id: int, number: int) -> Optional[Tuple[int, int]]:
+        """Map an absolute episode number to (season, episode).
+
+        Returns:
+            Trakt (season, episode), or None if the show or number is unknown
+        """
+        episodes = self._maps.get(trakt_id)
+        if episodes and 1 <= number <= len(episodes):
+            self.hits += 1
+            return episodes[number - 1]
+        self.misses += 1
+        return None
+
+    def stats(self) -> Dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with shows (maps loaded), hits, misses and hit_rate (0.0-1.0)
+        """
+        total = self.hits + self.misses
+        return {
+            "shows": len(self._maps),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    @staticmethod
+    def _flatten(seasons: List[Dict]) -> List[Tuple[int, int]]:
+        """Order regular-season episodes absolutely (number_abs when Trakt has it)."""
+        episodes = []
+        for season in sorted(seasons, key=lambda s: s.get("number") or 0):
+            number = season.get("number")
+            if not number:
+                continue
+            for episode in sorted(season.get("episodes") or [], key=lambda e: e.get("number") or 0):
+                if isinstance(episode.get("number"), int):
+                    episodes.append((episode.get("number_abs"), number, episode["number"]))
+        if episodes and all(isinstance(abs_number, int) for abs_number, _, _ in episodes):
+            episodes.sort(key=lambda item: item[0])
+        return [(season, episode) for _, season, episode in episodes]
+
+
+def _is_older_than(fetched_at: datetime, ttl: timedelta) -> bool:
+    """Check a stored (UTC) timestamp against a TTL."""
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - fetched_at > ttl
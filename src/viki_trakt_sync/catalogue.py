@@ -0,0 +1,416 @@
+"""Offline mirror of Trakt show metadata for network-free matching.
+
+Shows are stored in SQLite (~/.config/viki-trakt-sync/trakt_catalogue.db)
+and loaded into in-memory indexes keyed by:
+  - normalised title and alias (exact and leading-article-stripped)
+  - slug (sorted, for prefix lookups such as "my-youth" -> "my-youth-2025")
+  - TVDB id
+
+The catalogue is seeded from the corpus written by MatchCorpusBuilder and
+from Trakt responses already in the HTTP cache, grows as ShowMatcher finds
+confident matches, and can be refreshed in bulk from the Trakt API.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from .normalize import norm_title, norm_title_no_article
+
+logger = logging.getLogger(__name__)
+
+# Re-fetch catalogue entries older than this on refresh()
+DEFAULT_CATALOGUE_MAX_AGE = timedelta(days=30)
+
+
+@dataclass
+class CatalogueShow:
+    """One Trakt show in the catalogue."""
+    trakt_id: int
+    slug: Optional[str] = None
+    title: Optional[str] = None
+    year: Optional[int] = None
+    tvdb_id: Optional[int] = None
+    aliases: List[str] = field(default_factory=list)
+    updated_at: Optional[datetime] = None
+
+    def titles(self) -> List[str]:
+        """Primary title followed by aliases."""
+        return [t for t in [self.title, *self.aliases] if t]
+
+
+class TraktCatalogue:
+    """Indexed local catalogue of Trakt shows.
+
+    Safe to share between matcher threads: writes and index updates are
+    serialized by a per-instance lock.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize catalogue and load its indexes.
+
+        Args:
+            db_path: Path to SQLite database (default: ~/.config/viki-trakt-sync/trakt_catalogue.db)
+        """
+        if db_path is None:
+            db_path = Path.home() / ".config" / "viki-trakt-sync" / "trakt_catalogue.db"
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._shows: Dict[int, CatalogueShow] = {}
+        self._by_title: Dict[str, Set[int]] = {}
+        self._by_title_no_article: Dict[str, Set[int]] = {}
+        self._by_tvdb: Dict[int, int] = {}
+        self._slugs: List[str] = []
+        self._by_slug: Dict[str, int] = {}
+        self.version = 0  # bumped on every change, for derived indexes
+
+        self._init_db()
+        self._load()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS trakt_shows (
+                    trakt_id INTEGER PRIMARY KEY,
+                    slug TEXT,
+                    title TEXT,
+                    year INTEGER,
+                    tvdb_id INTEGER,
+                    aliases TEXT,
+                    updated_at TEXT
+                )
+                """
+            )
+
+    def _load(self) -> None:
+        """Build the in-memory indexes from the database."""
+        rows = self._conn.execute(
+            "SELECT trakt_id, slug, title, year, tvdb_id, aliases, updated_at FROM trakt_shows"
+        ).fetchall()
+        with self._lock:
+            for trakt_id, slug, title, year, tvdb_id, aliases, updated_at in rows:
+                self._index(CatalogueShow(
+                    trakt_id=trakt_id,
+                    slug=slug,
+                    title=title,
+                    year=year,
+                    tvdb_id=tvdb_id,
+                    aliases=json.loads(aliases) if aliases else [],
+                    updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+                ))
+        logger.debug(f"Loaded {len(self._shows)} shows from Trakt catalogue")
+
+    def __len__(self) -> int:
+        return len(self._shows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ---- lookups ----
+
+    def get(self, trakt_id: int) -> Optional[CatalogueShow]:
+        """Get a show by Trakt ID."""
+        return self._shows.get(trakt_id)
+
+    def lookup_title(self, title: str) -> List[CatalogueShow]:
+        """Shows whose normalised title or alias equals the title's."""
+        return self._resolve(self._by_title.get(norm_title(title)))
+
+    def lookup_title_no_article(self, title: str) -> List[CatalogueShow]:
+        """Like lookup_title(), ignoring a leading "the"/"a"/"an" on both sides."""
+        return self._resolve(self._by_title_no_article.get(norm_title_no_article(title)))
+
+    def lookup_slug_prefix(self, prefix: str) -> List[CatalogueShow]:
+        """Shows whose slug starts with prefix, in slug order."""
+        if not prefix:
+            return []
+        with self._lock:
+            start = bisect.bisect_left(self._slugs, prefix)
+            end = bisect.bisect_left(self._slugs, prefix + "\uffff", start)
+            ids = [self._by_slug[slug] for slug in self._slugs[start:end]]
+        return [self._shows[i] for i in ids]
+
+    def lookup_tvdb(self, tvdb_id: int) -> Optional[CatalogueShow]:
+        """Get a show by TVDB ID."""
+        trakt_id = self._by_tvdb.get(int(tvdb_id))
+        return self._shows.get(trakt_id) if trakt_id is not None else None
+
+    def all_titles(self) -> List[Tuple[int, str]]:
+        """(trakt_id, title) for every title and alias, e.g. to build a FuzzyIndex."""
+        with self._lock:
+            return [(s.trakt_id, title) for s in self._shows.values() for title in s.titles()]
+
+    def _resolve(self, ids: Optional[Set[int]]) -> List[CatalogueShow]:
+        if not ids:
+            return []
+        with self._lock:
+            return [self._shows[i] for i in sorted(ids)]
+
+    # ---- updates ----
+
+    def add(self, show: Dict[str, Any], aliases: Iterable[str] = ()) -> Optional[CatalogueShow]:
+        """Add or update one show.
+
+        Args:
+            show: Trakt show dict ({"title", "year", "ids": {"trakt", "slug", "tvdb"}})
+            aliases: Extra titles that refer to this show
+
+        Returns:
+            The stored CatalogueShow, or None if the dict has no Trakt ID
+        """
+        added = self.add_many([(show, list(aliases))])
+        return added[0] if added else None
+
+    def add_many(self, shows: Iterable[Tuple[Dict[str, Any], List[str]]]) -> List[CatalogueShow]:
+        """Add or update many shows in one transaction.
+
+        Args:
+            shows: (Trakt show dict, aliases) pairs
+
+        Returns:
+            The stored CatalogueShows (dicts without a Trakt ID are skipped)
+        """
+        now = datetime.now(timezone.utc)
+        stored: Dict[int, CatalogueShow] = {}
+        changed = False
+
+        with self._lock:
+            for show, aliases in shows:
+                ids = (show or {}).get("ids") or {}
+                trakt_id = ids.get("trakt")
+                if not trakt_id:
+                    continue
+                current = stored.get(trakt_id) or self._shows.get(trakt_id)
+                merged = _merge(current, show, aliases, now)
+                if current is not None and _same_content(current, merged):
+                    # Only the timestamp moves: indexes (and version) stay put
+                    self._shows[trakt_id] = merged
+                else:
+                    if current is not None:
+                        self._unindex(current)
+                    self._index(merged)
+                    changed = True
+                stored[trakt_id] = merged
+
+            if changed:
+                self.version += 1
+
+            if stored:
+                with self._conn:
+                    self._conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO trakt_shows
+                        (trakt_id, slug, title, year, tvdb_id, aliases, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                s.trakt_id,
+                                s.slug,
+                                s.title,
+                                s.year,
+                                s.tvdb_id,
+                                json.dumps(s.aliases, ensure_ascii=False),
+                                s.updated_at.isoformat() if s.updated_at else None,
+                            )
+                            for s in stored.values()
+                        ],
+                    )
+
+        return list(stored.values())
+
+    def _index(self, show: CatalogueShow) -> None:
+        """Add a show to the in-memory indexes. Caller holds the lock."""
+        self._shows[show.trakt_id] = show
+        for title in show.titles():
+            self._by_title.setdefault(norm_title(title), set()).add(show.trakt_id)
+            self._by_title_no_article.setdefault(norm_title_no_article(title), set()).add(show.trakt_id)
+        if show.tvdb_id:
+            self._by_tvdb[show.tvdb_id] = show.trakt_id
+        if show.slug:
+            if show.slug not in self._by_slug:
+                bisect.insort(self._slugs, show.slug)
+            self._by_slug[show.slug] = show.trakt_id
+
+    def _unindex(self, show: CatalogueShow) -> None:
+        """Remove a show from the in-memory indexes. Caller holds the lock."""
+        for title in show.titles():
+            for index, key in (
+                (self._by_title, norm_title(title)),
+                (self._by_title_no_article, norm_title_no_article(title)),
+            ):
+                ids = index.get(key)
+                if ids:
+                    ids.discard(show.trakt_id)
+                    if not ids:
+                        del index[key]
+        if show.tvdb_id and self._by_tvdb.get(show.tvdb_id) == show.trakt_id:
+            del self._by_tvdb[show.tvdb_id]
+        if show.slug and self._by_slug.get(show.slug) == show.trakt_id:
+            del self._by_slug[show.slug]
+            i = bisect.bisect_left(self._slugs, show.slug)
+            if i < len(self._slugs) and self._slugs[i] == show.slug:
+                del self._slugs[i]
+
+    # ---- seeding ----
+
+    def seed_from_corpus(self, corpus: Dict[str, Any]) -> int:
+        """Add every Trakt show referenced by a MatchCorpusBuilder corpus.
+
+        Confident corpus matches (>= 0.9) also record the Viki titles as
+        aliases of the matched show.
+
+        Args:
+            corpus: Loaded corpus ({"items": [...]}, see MatchCorpusBuilder.load)
+
+        Returns:
+            Number of shows added or updated
+        """
+        pairs: List[Tuple[Dict[str, Any], List[str]]] = []
+        for item in corpus.get("items", []):
+            for result in item.get("trakt_search") or []:
+                pairs.append((result.get("show") or {}, []))
+            for show in (item.get("trakt_slug_fetch") or {}).values():
+                pairs.append((show or {}, []))
+
+            matched = item.get("matched") or {}
+            if matched.get("trakt_id") and (matched.get("match_confidence") or 0) >= 0.9:
+                titles = list((item.get("viki_titles") or {}).values())
+                pairs.append((_show_from_match(matched), titles))
+
+        return len(self.add_many(pairs))
+
+    def seed_from_http_cache(self, cached_session: Any) -> int:
+        """Add Trakt shows found in cached search and show responses.
+
+        Args:
+            cached_session: http_cache.CachedSession for api.trakt.tv
+
+        Returns:
+            Number of shows added or updated
+        """
+        pairs: List[Tuple[Dict[str, Any], List[str]]] = []
+        for response in cached_session.session.cache.filter(expired=True):
+            parts = urlsplit(response.url)
+            if parts.hostname != "api.trakt.tv" or response.status_code != 200:
+                continue
+            path = parts.path.strip("/").split("/")
+            if path[0] not in ("search", "shows") or (path[0] == "shows" and len(path) != 2):
+                continue
+            try:
+                data = response.json()
+            except ValueError:
+                continue
+            if isinstance(data, list):
+                pairs.extend((item.get("show") or {}, []) for item in data if isinstance(item, dict))
+            elif isinstance(data, dict):
+                pairs.append((data, []))
+
+        return len(self.add_many(pairs))
+
+    def refresh(
+        self,
+        trakt: Any,
+        max_age: timedelta = DEFAULT_CATALOGUE_MAX_AGE,
+        max_workers: int = 4,
+    ) -> int:
+        """Re-fetch shows older than max_age from Trakt.
+
+        Args:
+            trakt: Object with get_show_by_slug(slug), e.g. TraktClient
+            max_age: Refresh entries last updated longer ago than this
+            max_workers: Concurrent Trakt lookups
+
+        Returns:
+            Number of shows refreshed
+        """
+        cutoff = datetime.now(timezone.utc) - max_age
+        with self._lock:
+            stale = [
+                s.slug or str(s.trakt_id) for s in self._shows.values()
+                if s.updated_at is None or s.updated_at < cutoff
+            ]
+        if not stale:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="catalogue") as pool:
+            fetched = list(pool.map(trakt.get_show_by_slug, stale))
+
+        return len(self.add_many((show, []) for show in fetched if show))
+
+    def stats(self) -> Dict[str, int]:
+        """Get catalogue size counters."""
+        with self._lock:
+            return {
+                "shows": len(self._shows),
+                "titles": len(self._by_title),
+                "tvdb_ids": len(self._by_tvdb),
+            }
+
+
+def _merge(
+    current: Optional[CatalogueShow],
+    show: Dict[str, Any],
+    aliases: Iterable[str],
+    now: datetime,
+) -> CatalogueShow:
+    """Combine a stored entry with new data (new non-empty fields win)."""
+    ids = show.get("ids") or {}
+    current = current or CatalogueShow(trakt_id=ids["trakt"])
+    merged_aliases = list(current.aliases)
+    for alias in aliases:
+        if alias and alias not in merged_aliases and alias != (show.get("title") or current.title):
+            merged_aliases.append(alias)
+    return CatalogueShow(
+        trakt_id=current.trakt_id,
+        slug=ids.get("slug") or current.slug,
+        title=show.get("title") or current.title,
+        year=show.get("year") or current.year,
+        tvdb_id=ids.get("tvdb") or current.tvdb_id,
+        aliases=merged_aliases,
+        updated_at=now,
+    )
+
+
+def _same_content(a: CatalogueShow, b: CatalogueShow) -> bool:
+    """True if two entries differ at most in updated_at."""
+    return (a.slug, a.title, a.year, a.tvdb_id, a.aliases) == (b.slug, b.title, b.year, b.tvdb_id, b.aliases)
+
+
+def _show_from_match(matched: Dict[str, Any]) -> Dict[str, Any]:
+    """Trakt show dict from a MatchResult dict."""
+    return {
+        "title": matched.get("trakt_title"),
+        "ids": {
+            "trakt": matched.get("trakt_id"),
+            "slug": matched.get("trakt_slug"),
+            "tvdb": matched.get("tvdb_id"),
+        },
+    }
+
+
+__all__ = [
+    "CatalogueShow",
+    "DEFAULT_CATALOGUE_MAX_AGE",
+    "TraktCatalogue",
+]
@@ -12,6 +12,8 @@ Import this in cli.py to add the new commands.
 
 import logging
 import sys
+from datetime import timedelta
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -131,8 +133,15 @@ def refresh(force: bool):
 @click.option("--force-refresh", is_flag=True, help="Force refresh all shows")
 @click.option("--dry-run", is_flag=True, help="Preview only, don't sync to Trakt")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@click.option(
+    "--engine",
+    type=click.Choice(["sync", "async"]),
+    default="sync",
+    show_default=True,
+    help="Sync engine: sequential, or asyncio with overlapping stages",
+)
 @click.pass_context
-def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool):
+def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool, engine: str):
     """Sync watch history from Viki to Trakt.
     
     This is the main workflow that:
@@ -154,6 +163,7 @@ def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool):
     
     try:
         config = get_config()
+        _configure_http(config)
         viki_client = config.get_viki_client()
         trakt_client = config.get_trakt_client()
     except Exception as e:
@@ -162,23 +172,79 @@ def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool):
         sys.exit(1)
     
     # Import adapters and workflow
-    from .adapters import VikiAdapter, TraktAdapter
-    from .workflows import SyncWorkflow
+    from .adapters import MetadataAdapter, VikiAdapter, TraktAdapter
+    from .adapters.viki import DEFAULT_MAX_CONCURRENCY
+    from .adapters.trakt import DEFAULT_HISTORY_CHUNK_SIZE, DEFAULT_PUSH_CONCURRENCY
+    from .pagination import DEFAULT_PAGE_PREFETCH
+    from .cache import (
+        DEFAULT_CONTAINER_TTL,
+        DEFAULT_EPISODE_TTL,
+        DEFAULT_SEASON_MAP_TTL,
+        ContainerMetadataCache,
+        EpisodeMetadataCache,
+        TraktSeasonMapCache,
+        TraktWatchedIndex,
+    )
+    from .workflows import SyncWorkflow, AsyncSyncWorkflow
+    from .workflows.sync import DEFAULT_MATCH_CONCURRENCY, DEFAULT_MATCH_TIMEOUT
     from .matcher import ShowMatcher
     from .config_provider import TomlConfigProvider
     
-    viki = VikiAdapter(viki_client)
+    repo = Repository()
+    ttl_hours = config.get("sync", "episode_cache_ttl_hours", DEFAULT_EPISODE_TTL.total_seconds() / 3600)
+    episode_cache = EpisodeMetadataCache(repo, ttl=timedelta(hours=ttl_hours))
+    ttl_hours = config.get("sync", "container_cache_ttl_hours", DEFAULT_CONTAINER_TTL.total_seconds() / 3600)
+    container_cache = ContainerMetadataCache(repo, ttl=timedelta(hours=ttl_hours))
+    viki = VikiAdapter(
+        viki_client,
+        max_concurrency=config.get("sync", "max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        episode_cache=episode_cache,
+        page_prefetch=config.get("sync", "page_prefetch", DEFAULT_PAGE_PREFETCH),
+    )
     trakt = TraktAdapter(trakt_client)
     
     # Create matcher with config provider (DI pattern)
     config_provider = TomlConfigProvider()
     matcher = ShowMatcher(config_provider=config_provider)
-    
-    workflow = SyncWorkflow(
-        viki=viki,
-        trakt=trakt,
-        matcher=matcher.match,
-    )
+    metadata = MetadataAdapter(tvdb_series=matcher.tvdb_series)
+    
+    push_chunk_size = config.get("sync", "push_chunk_size", DEFAULT_HISTORY_CHUNK_SIZE)
+    push_concurrency = config.get("sync", "push_concurrency", DEFAULT_PUSH_CONCURRENCY)
+    watched_index = TraktWatchedIndex(repo) if config.get("sync", "trakt_watched_index", True) else None
+    ttl_hours = config.get("sync", "season_map_ttl_hours", DEFAULT_SEASON_MAP_TTL.total_seconds() / 3600)
+    season_map = TraktSeasonMapCache(repo, ttl=timedelta(hours=ttl_hours))
+    match_timeout = config.get("sync", "match_timeout", DEFAULT_MATCH_TIMEOUT)
+    if engine == "async":
+        workflow = AsyncSyncWorkflow(
+            viki=viki,
+            trakt=trakt,
+            repository=repo,
+            metadata=metadata,
+            matcher=matcher.match,
+            container_cache=container_cache,
+            push_chunk_size=push_chunk_size,
+            push_concurrency=push_concurrency,
+            watched_index=watched_index,
+            season_map=season_map,
+            match_concurrency=config.get("sync", "match_concurrency", DEFAULT_MATCH_CONCURRENCY),
+            match_timeout=match_timeout,
+        )
+    else:
+        workflow = SyncWorkflow(
+            viki=viki,
+            trakt=trakt,
+            repository=repo,
+            metadata=metadata,
+            matcher=matcher.match,
+            container_cache=container_cache,
+            stream_markers=bool(config.get("sync", "stream_markers", False)),
+            push_chunk_size=push_chunk_size,
+            push_concurrency=push_concurrency,
+            watched_index=watched_index,
+            season_map=season_map,
+            match_concurrency=config.get("sync", "match_concurrency", DEFAULT_MATCH_CONCURRENCY),
+            match_timeout=match_timeout,
+        )
     
     def progress(msg: str):
         click.echo(f"  {msg}")
@@ -197,6 +263,27 @@ def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool):
     click.echo(f"  Episodes fetched: {result.episodes_fetched}")
     click.echo(f"  Matches found:    {result.matches_found}/{result.matches_attempted}")
     click.echo(f"  Episodes synced:  {result.episodes_synced}")
+    if result.episodes_skipped:
+        click.echo(f"  Already on Trakt: {result.episodes_skipped}")
+    if result.episodes_rejected:
+        click.echo(f"  Rejected:         {result.episodes_rejected} (not found on Trakt)")
+    
+    if verbose:
+        caches = (
+            ("Container cache:", container_cache),
+            ("Episode cache:", episode_cache),
+            ("Season maps:", season_map),
+        )
+        for label, cache in caches:
+            cache_stats = cache.stats()
+            click.echo(f"  {label:<17} {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+        if watched_index is not None:
+            index_stats = watched_index.stats()
+            state = "rebuilt" if index_stats["refreshed"] else "current"
+            click.echo(
+                f"  Watched index:    {index_stats['episodes']} episodes in {index_stats['shows']} shows ({state})"
+            )
+        _print_network_stats()
     
     # Show session ID for undo capability
     if result.sync_session_id and result.episodes_synced > 0:
@@ -215,6 +302,66 @@ def sync(ctx, force_refresh: bool, dry_run: bool, verbose: bool):
         _print_episode_status_tree(viki)
 
 
+def _configure_http(config) -> None:
+    """Apply [http] pool, rate limit and retry settings to the shared transport."""
+    from .transport import (
+        DEFAULT_MAX_RETRIES,
+        DEFAULT_POOL_CONNECTIONS,
+        DEFAULT_POOL_MAXSIZE,
+        configure_transport,
+    )
+    
+    http = config.get_section("http")
+    if not http:
+        return
+    configure_transport(
+        pool_connections=http.get("pool_connections", DEFAULT_POOL_CONNECTIONS),
+        pool_maxsize=http.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+        pool_sizes=http.get("pool_sizes"),
+        rate_limits=http.get("rate_limits"),
+        max_retries=http.get("max_retries", DEFAULT_MAX_RETRIES),
+    )
+
+
+def _print_network_stats():
+    """Print per-host transport counters and HTTP cache validator hit rates."""
+    from .http_cache import get_session_stats
+    from .transport import get_transport
+    
+    transport = get_transport()
+    stats = transport.stats.snapshot()
+    if not stats:
+        return
+    throttle = transport.limiter.snapshot()
+    
+    click.echo("\n🌐 Network:")
+    for host, s in sorted(stats.items()):
+        click.echo(
+            f"  {host:<22} {s['requests']:>5} req  "
+            f"{s['bytes_received'] / 1024:>8.1f} KiB  "
+            f"avg {s['avg_latency_ms']:>6.0f} ms  max {s['max_latency_ms']:>6.0f} ms"
+            + (f"  ({s['errors']} errors)" if s['errors'] else "")
+        )
+        t = throttle.get(host)
+        if t and (t["throttled_requests"] or t["rate_limited"]):
+            click.echo(
+                f"  {'':<22} throttled {t['throttled_requests']} req for {t['throttled_seconds']:.1f}s"
+                f", {t['rate_limited']} x 429, {t['retries']} retries"
+            )
+    
+    for name, s in sorted(get_session_stats().items()):
+        if not (s.get("hits") or s.get("revalidated") or s.get("misses")):
+            continue
+        click.echo(
+            f"  {name + ' cache':<22} {s['hits']:>5} hit  {s['revalidated']:>5} 304  "
+            f"{s['misses']:>5} miss  {s['bytes_saved'] / 1024:>8.1f} KiB saved  "
+            f"(validator hit rate {s['validator_hit_rate']:.0%})"
+        )
+        for endpoint, e in sorted(s.get("endpoints", {}).items()):
+            total = e["hits"] + e["revalidated"] + e["misses"]
+            click.echo(f"  {'  ' + endpoint:<22} {total:>5} req  hit rate {e['hit_rate']:.0%}")
+
+
 def _print_episode_status_tree(viki_adapter):
     """Print a tree view of episode watch status for all shows."""
     repo = Repository()
@@ -493,6 +640,7 @@ def status(as_json: bool):
                 'watched_episodes': stats.watched_episodes,
                 'synced_episodes': stats.synced_episodes,
                 'pending_sync': stats.pending_sync,
+                'rejected_episodes': stats.rejected_episodes,
                 'match_rate': stats.match_rate,
                 'sync_rate': stats.sync_rate,
             },
@@ -510,6 +658,8 @@ def status(as_json: bool):
     click.echo(f"   Shows:    {stats.matched_shows}/{stats.total_shows} matched ({stats.match_rate:.0f}%)")
     click.echo(f"   Episodes: {stats.synced_episodes}/{stats.watched_episodes} synced ({stats.sync_rate:.0f}%)")
     click.echo(f"   Pending:  {stats.pending_sync} episodes to sync")
+    if stats.rejected_episodes:
+        click.echo(f"   Rejected: {stats.rejected_episodes} episodes not found on Trakt")
     
     if stats.last_sync:
         click.echo(f"\n   Last sync: {stats.last_sync} ({stats.last_sync_status})")
@@ -540,6 +690,7 @@ def match_cmd():
       list          List unmatched shows
       set           Set a manual match
       clear         Clear a match
+      catalogue     Seed/refresh the offline Trakt catalogue
     """
     pass
 
@@ -633,6 +784,43 @@ def match_clear(viki_id: str):
         sys.exit(1)
 
 
+@match_cmd.command("catalogue")
+@click.option("--corpus", "corpus_path", type=click.Path(dir_okay=False, path_type=Path),
+              help="Match corpus to seed from (default: ~/.config/viki-trakt-sync/match_corpus.json)")
+@click.option("--refresh-days", type=int, default=None,
+              help="Re-fetch entries older than this many days from Trakt")
+def match_catalogue(corpus_path: Optional[Path], refresh_days: Optional[int]):
+    """Seed the offline Trakt catalogue used by the first matching tier.
+    
+    Adds every show from the match corpus and from cached Trakt search/show
+    responses, then optionally refreshes old entries from the Trakt API.
+    """
+    from .catalogue import TraktCatalogue
+    from .config import get_config
+    from .dataset import MatchCorpusBuilder
+    from .http_cache import get_trakt_session
+    from .trakt_client import TraktClient
+    
+    catalogue = TraktCatalogue()
+    
+    corpus_path = corpus_path or MatchCorpusBuilder.default_path()
+    if corpus_path.exists():
+        added = catalogue.seed_from_corpus(MatchCorpusBuilder.load(corpus_path))
+        click.echo(f"✓ Corpus: {added} shows from {corpus_path}")
+    
+    added = catalogue.seed_from_http_cache(get_trakt_session())
+    click.echo(f"✓ HTTP cache: {added} shows")
+    
+    if refresh_days is not None:
+        trakt_creds = get_config().get_section("trakt")
+        trakt = TraktClient(trakt_creds.get("client_id"), trakt_creds.get("client_secret"))
+        refreshed = catalogue.refresh(trakt, max_age=timedelta(days=refresh_days))
+        click.echo(f"✓ Refreshed {refreshed} shows from Trakt")
+    
+    stats = catalogue.stats()
+    click.echo(f"\n📚 Catalogue: {stats['shows']} shows, {stats['titles']} titles, {stats['tvdb_ids']} TVDB ids")
+
+
 @match_cmd.command("test")
 def match_test():
     """Test matcher on all shows in local watchlist.
@@ -667,21 +855,13 @@ def match_test():
         
         click.echo(f"\n🔍 Testing matcher on {len(all_shows)} shows\n")
         
-        # Test each show
-        results = []
-        matched_count = 0
-        
-        for show in all_shows:
-            viki_show = {
-                'id': show.viki_id,
-                'titles': {'en': show.title}
-            }
-            
-            result = matcher.match(viki_show)
-            results.append((show, result))
-            
-            if result.is_matched():
-                matched_count += 1
+        # Test each show (cached matches are looked up in one query)
+        viki_shows = [
+            {'id': show.viki_id, 'titles': {'en': show.title}}
+            for show in all_shows
+        ]
+        results = list(zip(all_shows, matcher.match_many(viki_shows)))
+        matched_count = sum(1 for _, result in results if result.is_matched())
         
         # Display results summary
         success_rate = 100*matched_count/len(all_shows)
@@ -17,6 +17,7 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 from .viki_client import VikiClient
 from .http_cache import get_trakt_session
 from .matcher import ShowMatcher, MatchResult
+from .normalize import slug_candidates
 
 logger = logging.getLogger(__name__)
 
@@ -138,13 +139,7 @@ class MatchCorpusBuilder:
             search = self._trakt_search(title_en)
 
             # Slug candidates from title normalization and common year suffixes
-            import re
-            from datetime import datetime
-            slug_base = re.sub(r"[^a-z0-9]+", "-", title_en.lower()).strip("-")
-            current_year = datetime.now().year
-            year_candidates = [current_year, current_year - 1, current_year + 1, current_year - 2]
-            slug_candidates = [slug_base] + [f"{slug_base}-{y}" for y in year_candidates]
-            slug_fetch = self._trakt_slug_fetch(slug_candidates)
+            slug_fetch = self._trakt_slug_fetch(slug_candidates(title_en))
 
             # Current matcher result
             result: MatchResult = self.matcher.match({
@@ -0,0 +1,229 @@
+"""Fuzzy title scoring: character n-gram TF-IDF with cosine similarity.
+
+Titles are normalised (see normalize.py), padded with a space on each side
+and split into overlapping character trigrams. Each candidate becomes an
+L2-normalised TF-IDF vector; a query is scored against every candidate at
+once as a sparse dot product.
+
+FuzzyIndex preloads the candidate matrix in column form (for each n-gram,
+the candidates containing it and their weights), so scoring a query only
+touches the columns of its own n-grams. With NumPy installed each column
+is one vectorised scatter-add; without it a pure-Python accumulator gives
+identical scores.
+
+extended() appends candidates to a copy of an index without recomputing
+the IDF of the existing ones, for catalogues that grow a few titles at a
+time.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .normalize import norm_title
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pip install numpy
+    np = None
+
+HAVE_NUMPY = np is not None
+
+DEFAULT_NGRAM = 3
+
+
+@lru_cache(maxsize=8192)
+def _ngram_counts(normalised: str, n: int) -> Tuple[Tuple[str, int], ...]:
+    padded = f" {normalised} "
+    return tuple(Counter(padded[i:i + n] for i in range(len(padded) - n + 1)).items())
+
+
+def char_ngrams(title: Optional[str], n: int = DEFAULT_NGRAM) -> Dict[str, int]:
+    """Character n-gram counts of a normalised, space-padded title."""
+    return dict(_ngram_counts(norm_title(title), n))
+
+
+class FuzzyIndex:
+    """Preloaded TF-IDF matrix for a fixed list of candidate titles.
+
+    Usage:
+        index = FuzzyIndex(["Goblin", "The K2"], keys=[101, 202])
+        index.top("goblin the lonely god", k=3)   # [(101, "Goblin", 0.61), ...]
+    """
+
+    def __init__(
+        self,
+        titles: Sequence[Optional[str]],
+        keys: Optional[Sequence[Any]] = None,
+        n: int = DEFAULT_NGRAM,
+        use_numpy: Optional[bool] = None,
+    ):
+        """Build the candidate matrix.
+
+        Args:
+            titles: Candidate titles
+            keys: Value returned for each candidate (default: its position)
+            n: N-gram length
+            use_numpy: Force the NumPy (True) or pure-Python (False) scorer
+                       (default: NumPy when installed)
+        """
+        if keys is not None and len(keys) != len(titles):
+            raise ValueError("keys and titles must have the same length")
+
+        self.titles = list(titles)
+        self.keys = list(keys) if keys is not None else list(range(len(self.titles)))
+        self.n = n
+        self.use_numpy = HAVE_NUMPY if use_numpy is None else (use_numpy and HAVE_NUMPY)
+
+        docs = [char_ngrams(title, n) for title in self.titles]
+        df: Counter = Counter()
+        for doc in docs:
+            df.update(doc.keys())
+
+        size = len(docs)
+        self._idf = {gram: math.log((1 + size) / (1 + count)) + 1 for gram, count in df.items()}
+        self._unseen_idf = math.log(1 + size) + 1
+
+        self._columns = {
+            gram: self._column(rows, values)
+            for gram, (rows, values) in self._build_columns(docs, start=0).items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def _build_columns(
+        self, docs: Sequence[Dict[str, int]], start: int
+    ) -> Dict[str, Tuple[List[int], List[float]]]:
+        """Column postings for rows start, start + 1, ... (n-grams this
+        index has not seen get the unseen IDF)."""
+        columns: Dict[str, Tuple[List[int], List[float]]] = {}
+        for row, doc in enumerate(docs, start):
+            weights = {gram: count * self._idf.get(gram, self._unseen_idf) for gram, count in doc.items()}
+            length = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for gram, weight in weights.items():
+                rows, values = columns.setdefault(gram, ([], []))
+                rows.append(row)
+                values.append(weight / length)
+        return columns
+
+    def _column(self, rows: List[int], values: List[float]) -> Tuple[Any, Any]:
+        if self.use_numpy:
+            return np.asarray(rows, dtype=np.intp), np.asarray(values, dtype=np.float64)
+        return rows, values
+
+    def extended(self, titles: Sequence[Optional[str]], keys: Optional[Sequence[Any]] = None) -> "FuzzyIndex":
+        """A copy of this index with more candidates appended.
+
+        New rows are weighted with this index's IDF, so scores drift slightly
+        from a full rebuild as titles pile up. This index is left unchanged
+        and stays safe to query from other threads.
+
+        Args:
+            titles: Candidate titles to add
+            keys: Value returned for each (default: its position)
+        """
+        if keys is not None and len(keys) != len(titles):
+            raise ValueError("keys and titles must have the same length")
+
+        start = len(self.titles)
+        clone = object.__new__(FuzzyIndex)
+        clone.__dict__.update(self.__dict__)
+        clone.titles = self.titles + list(titles)
+        clone.keys = self.keys + (list(keys) if keys is not None else list(range(start, len(clone.titles))))
+        clone._columns = dict(self._columns)
+
+        docs = [char_ngrams(title, self.n) for title in titles]
+        for gram, (rows, values) in self._build_columns(docs, start).items():
+            if gram not in clone._columns:
+                clone._columns[gram] = self._column(rows, values)
+            elif self.use_numpy:
+                old_rows, old_values = clone._columns[gram]
+                new_rows, new_values = self._column(rows, values)
+                clone._columns[gram] = (np.concatenate([old_rows, new_rows]), np.concatenate([old_values, new_values]))
+            else:
+                old_rows, old_values = clone._columns[gram]
+                clone._columns[gram] = (old_rows + rows, old_values + values)
+        return clone
+
+    def _query_vector(self, query: Optional[str]) -> Dict[str, float]:
+        """L2-normalised TF-IDF weights of the query (unseen n-grams count toward its length)."""
+        weights = {
+            gram: count * self._idf.get(gram, self._unseen_idf)
+            for gram, count in char_ngrams(query, self.n).items()
+        }
+        length = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {gram: w / length for gram, w in weights.items() if gram in self._columns}
+
+    def scores(self, query: Optional[str]) -> Sequence[float]:
+        """Cosine similarity of the query against every candidate, in order.
+
+        Returns:
+            NumPy array (or list without NumPy) of scores in [0, 1]
+        """
+        vector = self._query_vector(query)
+        if self.use_numpy:
+            scores = np.zeros(len(self.titles))
+            for gram, weight in vector.items():
+                rows, values = self._columns[gram]
+                scores[rows] += weight * values
+            return scores
+
+        scores = [0.0] * len(self.titles)
+        for gram, weight in vector.items():
+            rows, values = self._columns[gram]
+            for row, value in zip(rows, values):
+                scores[row] += weight * value
+        return scores
+
+    def top(self, query: Optional[str], k: int = 5, min_score: float = 0.0) -> List[Tuple[Any, str, float]]:
+        """Best-scoring candidates for a query.
+
+        Args:
+            query: Title to look up
+            k: Maximum number of results
+            min_score: Drop candidates scoring below this
+
+        Returns:
+            (key, title, score) tuples, best first
+        """
+        if not self.titles or k <= 0:
+            return []
+        scores = self.scores(query)
+
+        if self.use_numpy:
+            k = min(k, len(scores))
+            best = np.argpartition(-scores, k - 1)[:k]
+            rows = sorted(best.tolist(), key=lambda row: (-scores[row], row))
+        else:
+            rows = heapq.nsmallest(k, range(len(scores)), key=lambda row: (-scores[row], row))
+
+        return [
+            (self.keys[row], self.titles[row], float(scores[row]))
+            for row in rows
+            if scores[row] >= min_score and scores[row] > 0
+        ]
+
+
+def rank_titles(query: Optional[str], titles: Sequence[Optional[str]]) -> List[float]:
+    """Score one query against an ad-hoc candidate list in one batch.
+
+    Returns:
+        Cosine similarity per candidate, in input order
+    """
+    if not titles:
+        return []
+    return [float(score) for score in FuzzyIndex(titles).scores(query)]
+
+
+__all__ = [
+    "DEFAULT_NGRAM",
+    "FuzzyIndex",
+    "HAVE_NUMPY",
+    "char_ngrams",
+    "rank_titles",
+]
@@ -1,16 +1,28 @@
-"""HTTP caching layer for external API requests (Trakt, TVDB, etc).
+"""HTTP caching layer for external API requests (Trakt, TVDB, Viki, etc).
 
 Uses requests-cache to cache GET requests with configurable TTL.
 Prevents repeated API calls during development and testing.
+
+Sessions created with always_revalidate=True store the ETag/Last-Modified
+validators with each cached body and send a conditional request every
+time, so unchanged resources cost a bodiless 304.
+
+Negative results (404, or an empty JSON list/object such as a search with
+no hits) can be kept for their own, usually shorter, negative_expire_after.
 """
 
 import logging
+import threading
 from datetime import timedelta
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
 import requests_cache
+from requests_cache import DO_NOT_CACHE, get_expiration_datetime
+
+from .transport import get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +36,10 @@ class CachedSession:
     - Other: 1 hour
 
     Uses SQLite backend: ~/.config/viki-trakt-sync/http_cache.db
+
+    Every GET is counted as a cache hit (no network), a revalidation
+    (conditional request answered 304, cached body reused) or a miss
+    (full body downloaded), overall and per endpoint; see stats().
     """
 
     def __init__(
@@ -31,6 +47,10 @@ class CachedSession:
         cache_dir: Optional[Path] = None,
         cache_name: str = "http_cache",
         expire_after: Optional[timedelta] = None,
+        host: str = "",
+        always_revalidate: bool = False,
+        negative_expire_after: Optional[timedelta] = None,
+        urls_expire_after: Optional[Dict[str, Any]] = None,
     ):
         """Initialize cached session.
 
@@ -38,6 +58,12 @@ class CachedSession:
             cache_dir: Directory for cache database (default: ~/.config/viki-trakt-sync)
             cache_name: Name of cache database file (without extension)
             expire_after: How long to cache responses (default: 3600s = 1 hour)
+            host: Upstream host this session talks to (selects transport pool size)
+            always_revalidate: Send a conditional request (If-None-Match /
+                               If-Modified-Since) even for unexpired responses
+            negative_expire_after: How long to cache 404s and empty results
+                                   (default: same as expire_after)
+            urls_expire_after: Per-URL-pattern TTLs, e.g. {"host/path/*": DO_NOT_CACHE}
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".config" / "viki-trakt-sync"
@@ -49,8 +75,9 @@ class CachedSession:
             expire_after = timedelta(hours=1)
 
         self.expire_after = expire_after
+        self.negative_expire_after = negative_expire_after
 
-        # Create cached session
+        # Create cached session (cache misses go over the shared pooled transport)
         self.session = requests_cache.CachedSession(
             str(self.cache_path),
             backend="sqlite",
@@ -58,18 +85,26 @@ class CachedSession:
             allowable_methods=("GET", "HEAD"),
             allowable_codes=(200, 404),
             stale_if_error=True,
+            always_revalidate=always_revalidate,
+            urls_expire_after=urls_expire_after,
         )
+        get_transport().instrument(self.session, host)
+
+        self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0, "negative": 0}
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+        self._counters_lock = threading.Lock()
 
         logger.debug(
             f"Initialized HTTP cache at {self.cache_path} "
             f"(expire_after={expire_after.total_seconds()}s)"
         )
 
-    def get(self, url: str, **kwargs) -> requests_cache.models.Response:
+    def get(self, url: str, endpoint: Optional[str] = None, **kwargs) -> requests_cache.models.Response:
         """GET request with caching.
 
         Args:
             url: URL to request
+            endpoint: Label for per-endpoint stats (default: first path segment)
             **kwargs: Passed to requests.get()
 
         Returns:
@@ -77,13 +112,53 @@ class CachedSession:
         """
         response = self.session.get(url, **kwargs)
         
-        # Log cache hit/miss
+        # Log and count cache hit/revalidation/miss
         if hasattr(response, "from_cache"):
-            source = "cache" if response.from_cache else "network"
+            if getattr(response, "revalidated", False):
+                source = "revalidated"
+            elif response.from_cache:
+                source = "cache"
+            else:
+                source = "network"
+                self._expire_negative(response)
+            self._count(source, response, endpoint or _endpoint_label(url))
             logger.debug(f"GET {url}: {source}")
         
         return response
 
+    def _expire_negative(self, response) -> None:
+        """Re-store a fresh negative response with the negative TTL."""
+        if self.negative_expire_after is None or not _is_negative(response):
+            return
+        try:
+            cache = self.session.cache
+            cache_key = getattr(response, "cache_key", None) or cache.create_key(response.request)
+            if not cache.contains(cache_key):
+                return  # Not cacheable (e.g. DO_NOT_CACHE URL)
+            cache.save_response(
+                response,
+                cache_key=cache_key,
+                expires=get_expiration_datetime(self.negative_expire_after),
+            )
+            with self._counters_lock:
+                self._counters["negative"] += 1
+        except Exception as e:
+            logger.debug(f"Could not apply negative TTL: {e}")
+
+    def _count(self, source: str, response, endpoint: str) -> None:
+        with self._counters_lock:
+            per_endpoint = self._endpoints.setdefault(endpoint, {"hits": 0, "revalidated": 0, "misses": 0})
+            if source == "revalidated":
+                self._counters["revalidated"] += 1
+                self._counters["bytes_saved"] += len(response.content or b"")
+                per_endpoint["revalidated"] += 1
+            elif source == "cache":
+                self._counters["hits"] += 1
+                per_endpoint["hits"] += 1
+            else:
+                self._counters["misses"] += 1
+                per_endpoint["misses"] += 1
+
     def get_json(self, url: str, **kwargs) -> dict:
         """GET request returning JSON, with caching.
 
@@ -112,10 +187,23 @@ class CachedSession:
                 if cache_file.exists():
                     cache_size = cache_file.stat().st_size
 
+            with self._counters_lock:
+                counters = dict(self._counters)
+                endpoints = {name: dict(counts) for name, counts in self._endpoints.items()}
+
+            for counts in endpoints.values():
+                total = counts["hits"] + counts["revalidated"] + counts["misses"]
+                counts["hit_rate"] = (counts["hits"] + counts["revalidated"]) / total if total else 0.0
+
+            # Share of network round-trips answered with a bodiless 304
+            validated = counters["revalidated"] + counters["misses"]
             return {
                 "cache_path": str(self.cache_path),
                 "cache_size_mb": cache_size / (1024 * 1024),
                 "expire_after_hours": self.expire_after.total_seconds() / 3600,
+                **counters,
+                "validator_hit_rate": counters["revalidated"] / validated if validated else 0.0,
+                "endpoints": endpoints,
             }
         except Exception as e:
             logger.warning(f"Failed to get cache stats: {e}")
@@ -140,15 +228,32 @@ class CachedSession:
         self.close()
 
 
+def _endpoint_label(url: str) -> str:
+    """Default stats label for a URL: its first path segment."""
+    path = urlsplit(url).path.strip("/")
+    return path.split("/", 1)[0] or "/"
+
+
+def _is_negative(response) -> bool:
+    """404, or a successful response whose JSON body is empty."""
+    if response.status_code == 404:
+        return True
+    return response.status_code == 200 and (response.content or b"").strip() in (b"[]", b"{}")
+
+
 # Global cached session instances
 _trakt_session: Optional[CachedSession] = None
 _tvdb_session: Optional[CachedSession] = None
+_viki_session: Optional[CachedSession] = None
 
 
 def get_trakt_session() -> CachedSession:
     """Get global Trakt API cached session.
 
-    Caches for 1 hour (Trakt API rarely changes during that time).
+    Show lookups and searches are cached for 24 hours; 404s and empty
+    searches (e.g. slug probes during matching) for 6 hours, so new shows
+    are picked up reasonably soon. User-specific /sync endpoints are
+    never cached.
 
     Returns:
         CachedSession configured for Trakt
@@ -157,10 +262,14 @@ def get_trakt_session() -> CachedSession:
 
     if _trakt_session is None:
         # Allow TTL override via env (hours)
-        ttl_hours = float(os.getenv("TRAKT_CACHE_HOURS", "1"))
+        ttl_hours = float(os.getenv("TRAKT_CACHE_HOURS", "24"))
+        negative_hours = float(os.getenv("TRAKT_NEGATIVE_CACHE_HOURS", "6"))
         _trakt_session = CachedSession(
             cache_name="http_cache_trakt",
             expire_after=timedelta(hours=ttl_hours),
+            host="api.trakt.tv",
+            negative_expire_after=timedelta(hours=negative_hours),
+            urls_expire_after={"api.trakt.tv/sync/*": DO_NOT_CACHE},
         )
 
     return _trakt_session
@@ -181,6 +290,41 @@ def get_tvdb_session() -> CachedSession:
         _tvdb_session = CachedSession(
             cache_name="http_cache_tvdb",
             expire_after=timedelta(hours=ttl_hours),
+            host="api4.thetvdb.com",
         )
 
     return _tvdb_session
+
+
+def get_viki_session() -> CachedSession:
+    """Get global Viki v4 API cached session.
+
+    Container and episode lists can change at any time, so every request
+    is revalidated with the stored ETag/Last-Modified; the TTL only bounds
+    how long entries without validators are kept.
+
+    Returns:
+        CachedSession configured for api.viki.io
+    """
+    global _viki_session
+
+    if _viki_session is None:
+        ttl_hours = float(os.getenv("VIKI_CACHE_HOURS", "168"))
+        _viki_session = CachedSession(
+            cache_name="http_cache_viki",
+            expire_after=timedelta(hours=ttl_hours),
+            host="api.viki.io",
+            always_revalidate=True,
+        )
+
+    return _viki_session
+
+
+def get_session_stats() -> Dict[str, dict]:
+    """Get stats for every global cached session created so far.
+
+    Returns:
+        Dict mapping session name (trakt, tvdb, viki) -> CachedSession.stats()
+    """
+    sessions = {"trakt": _trakt_session, "tvdb": _tvdb_session, "viki": _viki_session}
+    return {name: session.stats() for name, session in sessions.items() if session is not None}
@@ -4,6 +4,8 @@ import logging
 import time
 from typing import Optional, Callable, Any
 
+from .rate_limit import parse_retry_after, retry_delay
+
 logger = logging.getLogger(__name__)
 
 # Default timeouts: (connect_timeout, read_timeout)
@@ -20,10 +22,14 @@ def retry_on_transient(
 ) -> Any:
     """Lightweight retry wrapper for transient failures (429, 5xx).
 
+    Requests sent through the shared transport are already rate limited
+    and retried there; this is for ad-hoc calls outside it.
+
     Args:
         func: Callable to retry (e.g., requests.get)
         max_retries: Number of retries on transient error
-        backoff_factor: Exponential backoff multiplier (e.g., 1.0 = 1s, 2s, 4s)
+        backoff_factor: Exponential backoff base (1.0 = up to 1s, 2s, 4s,
+                        jittered); a Retry-After header takes precedence
         *args: Positional arguments to func
         **kwargs: Keyword arguments to func
 
@@ -43,10 +49,11 @@ def retry_on_transient(
             # Retry on transient errors
             if response.status_code in (429, 503, 504):
                 if attempt < max_retries:
-                    wait = (backoff_factor ** attempt)
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    wait = retry_delay(attempt, retry_after, backoff_factor)
                     logger.debug(
                         f"Transient error {response.status_code}, "
-                        f"retrying in {wait}s (attempt {attempt + 1}/{max_retries})"
+                        f"retrying in {wait:.1f}s (attempt {attempt + 1}/{max_retries})"
                     )
                     time.sleep(wait)
                     attempt += 1
@@ -60,10 +67,10 @@ def retry_on_transient(
             last_exception = e
 
             if attempt < max_retries:
-                wait = (backoff_factor ** attempt)
+                wait = retry_delay(attempt, backoff_factor=backoff_factor)
                 logger.debug(
                     f"Connection error: {e}. "
-                    f"Retrying in {wait}s (attempt {attempt + 1}/{max_retries})"
+                    f"Retrying in {wait:.1f}s (attempt {attempt + 1}/{max_retries})"
                 )
                 time.sleep(wait)
                 attempt += 1
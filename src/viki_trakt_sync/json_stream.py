@@ -0,0 +1,137 @@
+"""Incremental JSON parsing for large API responses.
+
+The Viki watch markers response is one object whose ``markers`` member
+maps container ID -> {video ID -> marker}. For a full-history pull that
+body can be several megabytes; ``response.json()`` materialises all of
+it (plus the adapter's copies) at once.
+
+iter_object_items() walks the byte stream instead and yields the members
+of one top-level object one at a time, so only the current member (one
+container's markers) and a single read chunk are held in memory.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+_WHITESPACE = " \t\n\r"
+
+# Drop consumed text from the buffer once this much has accumulated
+_COMPACT_AFTER = 64 * 1024
+
+
+class _StreamReader:
+    """Character-level cursor over a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str = "utf-8"):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._decoder_json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk into the buffer. Returns False at end of stream."""
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_AFTER:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.buf += self._decoder.decode(chunk)
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> Optional[str]:
+        """Next non-whitespace character (None at end of stream)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char: str) -> None:
+        """Consume one expected structural character."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder_json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number touching the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_object_items(chunks: Iterable[bytes], key: str, encoding: str = "utf-8") -> Iterator[Tuple[str, Any]]:
+    """Yield the members of a top-level object member, one at a time.
+
+    For ``{"markers": {"a": {...}, "b": {...}}, "count": 2}`` and
+    ``key="markers"`` this yields ``("a", {...})`` then ``("b", {...})``.
+    Other top-level members are decoded and discarded. If ``key`` is
+    missing or not an object, nothing is yielded.
+
+    Args:
+        chunks: Raw body chunks (e.g. ``response.iter_content(65536)``)
+        key: Top-level member whose object members to yield
+        encoding: Body encoding
+
+    Yields:
+        (member name, decoded member value) tuples, in document order
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated
+    """
+    reader = _StreamReader(chunks, encoding)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "{":
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.pos += 1
+            else:
+                while True:
+                    item_name = reader.value()
+                    reader.expect(":")
+                    yield item_name, reader.value()
+                    if reader.peek() == ",":
+                        reader.pos += 1
+                        continue
+                    reader.expect("}")
+                    break
+        else:
+            reader.value()
+
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("}")
+        return
+
+
+__all__ = ["iter_object_items"]
@@ -2,30 +2,73 @@
 
 Matches Viki shows to Trakt.tv shows using multi-tier strategy:
   Tier 1: Local cache (instant)
+  Tier 1b: Offline Trakt catalogue (instant, no network)
   Tier 2: Exact Trakt search (fast)
   Tier 3: TVDB intermediary (reliable)
-  Tier 4: Fuzzy matching (fallback)
+  Tier 4: MyDramaList aliases
+  Tier 5: Fuzzy matching against the catalogue (fallback)
 """
 
 import logging
 import os
+import re
 import sqlite3
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import requests
 
+from .catalogue import CatalogueShow, TraktCatalogue
+from .fuzzy import FuzzyIndex, rank_titles
 from .http_cache import get_trakt_session
 from .http_cache import get_tvdb_session
+from .normalize import norm_title, norm_title_no_article, normalize_many, slug_candidates, slugify, title_keys
 from .trakt_client import TraktClient
+from .tvdb_auth import get_tvdb_auth
+from .tvdb_series import DEFAULT_SERIES_TTL, TvdbSeries, TvdbSeriesStore
 
 if TYPE_CHECKING:
     from .config_provider import ConfigProvider
 
 logger = logging.getLogger(__name__)
 
+# Matches at least this confident are answered by / added to the catalogue
+CATALOGUE_CONFIDENCE = 0.9
+
+_YEAR_SUFFIX = re.compile(r"-\d{4}")
+
+# Fuzzy tier: minimum cosine score, and lead over the next-best show
+FUZZY_MIN_SCORE = 0.8
+FUZZY_MIN_MARGIN = 0.05
+# Fuzzy matches are capped below the exact tiers' confidence
+FUZZY_CONFIDENCE = 0.85
+# A search result must score at least this to displace results[0]
+FUZZY_RERANK_MIN_SCORE = 0.5
+# Titles added to the catalogue are appended to the fuzzy index until they
+# exceed this fraction of it (or titles were removed); then it is rebuilt
+FUZZY_REBUILD_FRACTION = 0.1
+
+# Network tiers in precedence order: (name, method, confidence to exceed).
+# Tier 2 at exactly 0.8 (exact_trakt_first) keeps looking.
+NETWORK_TIERS = (
+    ("exact_trakt", "_tier_exact_trakt", 0.85),
+    ("tvdb", "_tier_tvdb", 0.7),
+    ("tvdb_aliases", "_tier_tvdb_aliases", 0.65),
+    ("mdl", "_tier_mdl", 0.6),
+)
+
+# Threads shared by all speculative matches of one ShowMatcher
+DEFAULT_TIER_WORKERS = 8
+
+# Concurrent TVDB/Trakt lookups of one show's MDL aliases
+DEFAULT_ALIAS_WORKERS = 4
+
 
 @dataclass
 class MatchResult:
@@ -54,8 +97,84 @@ class MatchResult:
         return data
 
 
+class MatchCancelledError(Exception):
+    """Raised inside a speculative tier once the match has been decided."""
+
+
+@dataclass
+class MatchContext:
+    """Memo for one ShowMatcher.match() call.
+
+    Every upstream query (Trakt search, slug probe, TVDB search, ...) and
+    every tier result is computed at most once per show, however many tiers
+    ask for it. `calls` counts the upstream calls actually made, by name.
+
+    Safe to share between concurrently running tiers: a second caller of
+    the same key waits for the first instead of repeating the query.
+    """
+
+    calls: Counter = field(default_factory=Counter)
+    _memo: Dict[Tuple[str, Any], Any] = field(default_factory=dict, repr=False)
+    _key_locks: Dict[Tuple[str, Any], threading.Lock] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _cancelled: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
+    def call(self, name: str, key: Any, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s memoised result for (name, key), calling it on first use.
+
+        Raises:
+            MatchCancelledError: If the match was decided and fn() has not run yet
+        """
+        return self._memoised((name, key), fn, count=name)
+
+    def tier(self, name: str, fn: Callable[[], "MatchResult"]) -> "MatchResult":
+        """Return a tier's memoised result (not counted as an upstream call)."""
+        return self._memoised(("tier", name), fn)
+
+    def cancel(self) -> None:
+        """Make pending upstream calls raise MatchCancelledError."""
+        self._cancelled.set()
+
+    def _memoised(self, memo_key: Tuple[str, Any], fn: Callable[[], Any], count: Optional[str] = None) -> Any:
+        with self._lock:
+            if memo_key in self._memo:
+                return self._memo[memo_key]
+            key_lock = self._key_locks.setdefault(memo_key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if memo_key in self._memo:
+                    return self._memo[memo_key]
+            if count is not None:
+                if self._cancelled.is_set():
+                    raise MatchCancelledError(count)
+                with self._lock:
+                    self.calls[count] += 1
+            value = fn()
+            with self._lock:
+                self._memo[memo_key] = value
+            return value
+
+
 class MatchDB:
-    """Local SQLite database for caching Viki→Trakt matches."""
+    """Local SQLite database for caching Viki→Trakt matches.
+
+    Holds one long-lived connection in WAL mode instead of opening the file
+    per statement. Safe to share between matcher threads: statements are
+    serialized by a per-instance lock. Use get_many()/save_many() to look up
+    or store many shows in a single query/transaction.
+    """
+
+    # Stay under SQLITE_MAX_VARIABLE_NUMBER on old SQLite builds
+    _BATCH_SIZE = 500
+
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8000",
+        "PRAGMA busy_timeout=5000",
+    )
 
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize match database.
@@ -68,30 +187,48 @@ class MatchDB:
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
 
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Get the shared connection, opening it on first use. Caller holds the lock."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for pragma in self._PRAGMAS:
+                self._conn.execute(pragma)
+        return self._conn
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS viki_trakt_matches (
-                    viki_id TEXT PRIMARY KEY,
-                    viki_title TEXT NOT NULL,
-                    trakt_id INTEGER,
-                    trakt_slug TEXT,
-                    trakt_title TEXT,
-                    tvdb_id INTEGER,
-                    confidence REAL,
-                    method TEXT,
-                    matched_at TEXT,
-                    notes TEXT,
-                    updated_at TEXT
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS viki_trakt_matches (
+                        viki_id TEXT PRIMARY KEY,
+                        viki_title TEXT NOT NULL,
+                        trakt_id INTEGER,
+                        trakt_slug TEXT,
+                        trakt_title TEXT,
+                        tvdb_id INTEGER,
+                        confidence REAL,
+                        method TEXT,
+                        matched_at TEXT,
+                        notes TEXT,
+                        updated_at TEXT
+                    )
+                    """
                 )
-                """
-            )
-            conn.commit()
+
+    def close(self) -> None:
+        """Close the shared connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def get(self, viki_id: str) -> Optional[MatchResult]:
         """Get cached match for Viki show.
@@ -102,45 +239,38 @@ class MatchDB:
         Returns:
             MatchResult if cached, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._connection().execute(
                 "SELECT * FROM viki_trakt_matches WHERE viki_id = ?",
                 (viki_id,),
             )
             row = cursor.fetchone()
 
-        if not row:
-            return None
+        return _row_to_result(row) if row else None
 
-        (
-            viki_id,
-            viki_title,
-            trakt_id,
-            trakt_slug,
-            trakt_title,
-            tvdb_id,
-            confidence,
-            method,
-            matched_at,
-            notes,
-            _updated_at,
-        ) = row
-
-        if matched_at:
-            matched_at = datetime.fromisoformat(matched_at)
+    def get_many(self, viki_ids: List[str]) -> Dict[str, MatchResult]:
+        """Get cached matches for many Viki shows at once.
 
-        return MatchResult(
-            viki_id=viki_id,
-            viki_title=viki_title,
-            trakt_id=trakt_id,
-            trakt_slug=trakt_slug,
-            trakt_title=trakt_title,
-            tvdb_id=tvdb_id,
-            match_confidence=confidence,
-            match_method=method,
-            matched_at=matched_at,
-            notes=notes,
-        )
+        Args:
+            viki_ids: Viki show IDs
+
+        Returns:
+            Dict of viki_id -> MatchResult for the IDs that are cached
+        """
+        ids = list(dict.fromkeys(viki_ids))
+        rows = []
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(ids), self._BATCH_SIZE):
+                batch = ids[i:i + self._BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT * FROM viki_trakt_matches WHERE viki_id IN ({placeholders})",
+                    batch,
+                )
+                rows.extend(cursor.fetchall())
+
+        return {row[0]: _row_to_result(row) for row in rows}
 
     def save(self, result: MatchResult) -> None:
         """Save match result to database.
@@ -148,38 +278,52 @@ class MatchDB:
         Args:
             result: MatchResult to save
         """
-        now = datetime.now(timezone.utc).isoformat()
-        matched_at = result.matched_at.isoformat() if result.matched_at else None
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO viki_trakt_matches
-                (viki_id, viki_title, trakt_id, trakt_slug, trakt_title, tvdb_id,
-                 confidence, method, matched_at, notes, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    result.viki_id,
-                    result.viki_title,
-                    result.trakt_id,
-                    result.trakt_slug,
-                    result.trakt_title,
-                    result.tvdb_id,
-                    result.match_confidence,
-                    result.match_method,
-                    matched_at,
-                    result.notes,
-                    now,
-                ),
-            )
-            conn.commit()
+        self.save_many([result])
 
         logger.info(
             f"Saved match: {result.viki_id} → {result.trakt_id} "
             f"({result.match_confidence:.0%}, {result.match_method})"
         )
 
+    def save_many(self, results: List[MatchResult]) -> None:
+        """Save many match results in one transaction.
+
+        Args:
+            results: MatchResults to save
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                result.viki_id,
+                result.viki_title,
+                result.trakt_id,
+                result.trakt_slug,
+                result.trakt_title,
+                result.tvdb_id,
+                result.match_confidence,
+                result.match_method,
+                result.matched_at.isoformat() if result.matched_at else None,
+                result.notes,
+                now,
+            )
+            for result in results
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO viki_trakt_matches
+                    (viki_id, viki_title, trakt_id, trakt_slug, trakt_title, tvdb_id,
+                     confidence, method, matched_at, notes, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
     def list_unmatched(self, limit: int = 10) -> List[str]:
         """Get list of unmatched Viki IDs.
 
@@ -189,8 +333,8 @@ class MatchDB:
         Returns:
             List of unmatched Viki IDs
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._connection().execute(
                 "SELECT viki_id FROM viki_trakt_matches WHERE trakt_id IS NULL LIMIT ?",
                 (limit,),
             )
@@ -204,8 +348,8 @@ class MatchDB:
         Returns:
             Dict with total, matched, unmatched counts
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._connection().execute(
                 "SELECT COUNT(*), SUM(CASE WHEN trakt_id IS NOT NULL THEN 1 ELSE 0 END) "
                 "FROM viki_trakt_matches"
             )
@@ -218,6 +362,39 @@ class MatchDB:
         }
 
 
+def _row_to_result(row: Tuple) -> MatchResult:
+    """Build a MatchResult from a viki_trakt_matches row."""
+    (
+        viki_id,
+        viki_title,
+        trakt_id,
+        trakt_slug,
+        trakt_title,
+        tvdb_id,
+        confidence,
+        method,
+        matched_at,
+        notes,
+        _updated_at,
+    ) = row
+
+    if matched_at:
+        matched_at = datetime.fromisoformat(matched_at)
+
+    return MatchResult(
+        viki_id=viki_id,
+        viki_title=viki_title,
+        trakt_id=trakt_id,
+        trakt_slug=trakt_slug,
+        trakt_title=trakt_title,
+        tvdb_id=tvdb_id,
+        match_confidence=confidence,
+        match_method=method,
+        matched_at=matched_at,
+        notes=notes,
+    )
+
+
 class ShowMatcher:
     """Match Viki shows to Trakt shows using multi-tier strategy."""
 
@@ -228,6 +405,11 @@ class ShowMatcher:
         tvdb_api_key: Optional[str] = None,
         db_path: Optional[Path] = None,
         config_provider: Optional['ConfigProvider'] = None,
+        catalogue: Optional[TraktCatalogue] = None,
+        speculative: Optional[bool] = None,
+        tier_workers: int = DEFAULT_TIER_WORKERS,
+        tvdb_series: Optional[TvdbSeriesStore] = None,
+        alias_workers: int = DEFAULT_ALIAS_WORKERS,
     ):
         """Initialize matcher.
 
@@ -237,8 +419,24 @@ class ShowMatcher:
             tvdb_api_key: TVDB API key (overrides config)
             db_path: Path to matches database
             config_provider: Configuration provider (injected dependency)
+            catalogue: Offline Trakt catalogue (default: trakt_catalogue.db
+                       next to the matches database)
+            speculative: Run the network tiers concurrently and keep the
+                         highest-precedence result that clears its gate
+                         (default: [sync] speculative_match, else False)
+            tier_workers: Threads for speculative tiers, shared across matches
+            tvdb_series: TVDB series-detail store (default: tvdb_series.db next
+                         to the matches database, TTL from [sync]
+                         tvdb_series_ttl_hours)
+            alias_workers: Concurrent lookups of one show's MDL aliases
+                           (1 = one alias at a time)
         """
         self.db = MatchDB(db_path)
+        self.catalogue = catalogue or TraktCatalogue(self.db.db_path.parent / "trakt_catalogue.db")
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._fuzzy_version = -1
+        self._fuzzy_pairs: set = set()
+        self._fuzzy_lock = threading.Lock()
 
         # Get credentials from explicit parameters or config provider
         client_id = trakt_client_id
@@ -253,6 +451,25 @@ class ShowMatcher:
         if not self.tvdb_api_key and config_provider:
             self.tvdb_api_key = config_provider.get("tvdb", "api_key")
 
+        if speculative is None:
+            speculative = bool(config_provider.get("sync", "speculative_match", False)) if config_provider else False
+        self.speculative = speculative
+        self.tier_workers = tier_workers
+        self.alias_workers = alias_workers
+        self._tier_pool: Optional[ThreadPoolExecutor] = None
+        self._tier_pool_lock = threading.Lock()
+
+        if tvdb_series is None:
+            ttl_hours = DEFAULT_SERIES_TTL.total_seconds() / 3600
+            if config_provider:
+                ttl_hours = config_provider.get("sync", "tvdb_series_ttl_hours", ttl_hours)
+            tvdb_series = TvdbSeriesStore(
+                self.db.db_path.parent / "tvdb_series.db", ttl=timedelta(hours=float(ttl_hours))
+            )
+        self.tvdb_series = tvdb_series
+        self._mdl = None
+        self._mdl_lock = threading.Lock()
+
         # Configure Trakt via pytrakt (hard requirement for full sync)
         if not client_id:
             logger.warning("Trakt matching disabled: missing TRAKT_CLIENT_ID")
@@ -268,6 +485,14 @@ class ShowMatcher:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup resources."""
+        self.db.close()
+        self.catalogue.close()
+        self.tvdb_series.close()
+        if self._mdl is not None:
+            self._mdl.cache.close()
+        if self._tier_pool is not None:
+            self._tier_pool.shutdown(wait=False, cancel_futures=True)
+
         # Ensure HTTP sessions are closed
         try:
             session = get_trakt_session()
@@ -285,14 +510,16 @@ class ShowMatcher:
         
         return False
 
-    def match(self, viki_show: Dict) -> MatchResult:
+    def match(self, viki_show: Dict, context: Optional[MatchContext] = None) -> MatchResult:
         """Match Viki show to Trakt show.
 
         Uses multi-tier matching strategy:
           1. Local cache (instant)
+          1b. Offline Trakt catalogue (instant)
           2. Exact Trakt search (fast)
           3. TVDB search (reliable)
-          4. Fuzzy matching (fallback)
+          4. MyDramaList aliases
+          5. Fuzzy match against the catalogue (fallback)
 
         Args:
             viki_show: Dict with Viki show data:
@@ -300,10 +527,39 @@ class ShowMatcher:
                 - titles: Dict of {lang: title}
                 - origin: Dict with country/language
                 - (optional) year: Show year
+            context: Per-match memo to use (e.g. to inspect call counts);
+                     a fresh one by default
 
         Returns:
             MatchResult with match details
         """
+        viki_id, viki_title = self._identify(viki_show)
+
+        # Tier 1: Check local cache
+        return self._match_after_cache(
+            viki_show, viki_id, viki_title, self.db.get(viki_id), context or MatchContext()
+        )
+
+    def match_many(self, viki_shows: List[Dict]) -> List[MatchResult]:
+        """Match many Viki shows, checking the local cache in one query.
+
+        Args:
+            viki_shows: Show dicts as accepted by match()
+
+        Returns:
+            MatchResults, in input order
+        """
+        identities = [self._identify(show) for show in viki_shows]
+        cached = self.db.get_many([viki_id for viki_id, _ in identities])
+
+        return [
+            self._match_after_cache(show, viki_id, viki_title, cached.get(viki_id), MatchContext())
+            for show, (viki_id, viki_title) in zip(viki_shows, identities)
+        ]
+
+    @staticmethod
+    def _identify(viki_show: Dict) -> Tuple[str, str]:
+        """Get (viki_id, English title) for a show dict."""
         viki_id = viki_show.get("id") or viki_show.get("viki_id")
         if not viki_id:
             raise ValueError("viki_show missing 'id' or 'viki_id' field")
@@ -311,50 +567,50 @@ class ShowMatcher:
         # Get English title
         titles = viki_show.get("titles", {})
         viki_title = titles.get("en") or next(iter(titles.values()), f"Unknown ({viki_id})")
+        return viki_id, viki_title
 
+    def _match_after_cache(
+        self,
+        viki_show: Dict,
+        viki_id: str,
+        viki_title: str,
+        cached: Optional[MatchResult],
+        ctx: MatchContext,
+    ) -> MatchResult:
+        """Return a cached match, or run the catalogue and network tiers (1b-5)."""
         logger.info(f"Matching: {viki_title} (Viki ID: {viki_id})")
 
-        # Tier 1: Check local cache
-        cached = self.db.get(viki_id)
         if cached and cached.is_matched():
             logger.debug(f"Cache hit: {viki_id} → {cached.trakt_id}")
             return cached
         elif cached:
             logger.debug(f"Cache has previous no-match for {viki_id}; retrying match")
 
-        # Tier 2: Try exact Trakt search (HTTP). This does not require python-trakt.
-        result = self._tier_exact_trakt(viki_show, viki_title)
-        # Only return early if confidence is high (0.9+).
-        # If confidence is exactly 0.8 (exact_trakt_first fallback), continue to other tiers.
-        if result.is_matched() and result.match_confidence > 0.85:
+        # Tier 1b: Offline catalogue (no network)
+        result = ctx.tier("catalogue", lambda: self._tier_catalogue(viki_show, viki_title, ctx))
+        if result.is_matched():
             self.db.save(result)
             return result
 
-        # Tier 3: Try TVDB search
-        result = self._tier_tvdb(viki_show, viki_title)
-        if result.is_matched() and result.match_confidence > 0.7:
-            self.db.save(result)
-            return result
-
-        # Tier 3b: Try TVDB alias matching (enhanced)
-        result = self._tier_tvdb_aliases(viki_show, viki_title)
-        if result.is_matched() and result.match_confidence > 0.65:
-            self.db.save(result)
-            return result
+        # Tiers 2-4: Trakt search, TVDB, TVDB aliases, MyDramaList (see NETWORK_TIERS)
+        if self.speculative:
+            result = self._run_tiers_speculatively(viki_show, viki_title, ctx)
+        else:
+            result = self._run_tiers_in_order(viki_show, viki_title, ctx)
+        if result is not None:
+            return self._remember(result)
 
-        # Tier 4: Try MyDramaList alias resolution
-        # This helps when Trakt search was uncertain (0.8 confidence exact_trakt_first)
-        result = self._tier_mdl(viki_show, viki_title)
-        if result.is_matched() and result.match_confidence > 0.6:
+        # Tier 5: Fuzzy match against the offline catalogue
+        result = ctx.tier("fuzzy", lambda: self._tier_fuzzy(viki_show, viki_title, ctx))
+        if result.is_matched():
             self.db.save(result)
             return result
 
         # Fallback to Tier 2 result if no better match found
         # (allows low-confidence Trakt matches when no better match available)
-        result = self._tier_exact_trakt(viki_show, viki_title)
+        result = ctx.tier("exact_trakt", lambda: self._tier_exact_trakt(viki_show, viki_title, ctx))
         if result.is_matched() and result.match_confidence >= 0.8:
-            self.db.save(result)
-            return result
+            return self._remember(result)
 
         # No match found
         result = MatchResult(
@@ -367,8 +623,179 @@ class ShowMatcher:
         self.db.save(result)
         return result
 
+    def _run_tiers_in_order(
+        self, viki_show: Dict, viki_title: str, ctx: MatchContext
+    ) -> Optional[MatchResult]:
+        """First network tier whose result clears its gate, one tier at a time."""
+        for name, method, gate in NETWORK_TIERS:
+            tier = getattr(self, method)
+            result = ctx.tier(name, lambda: tier(viki_show, viki_title, ctx))
+            if result.is_matched() and result.match_confidence > gate:
+                return result
+        return None
+
+    def _run_tiers_speculatively(
+        self, viki_show: Dict, viki_title: str, ctx: MatchContext
+    ) -> Optional[MatchResult]:
+        """Same outcome as _run_tiers_in_order, with every tier started at once.
+
+        Results are examined in precedence order, so the first tier that
+        clears its gate wins as soon as every tier ahead of it has failed;
+        the others are then cancelled (queued ones never start, running ones
+        stop at their next upstream call).
+        """
+        pool = self._tier_executor()
+        futures = [
+            (gate, pool.submit(ctx.tier, name, partial(getattr(self, method), viki_show, viki_title, ctx)))
+            for name, method, gate in NETWORK_TIERS
+        ]
+        try:
+            for gate, future in futures:
+                result = future.result()
+                if result.is_matched() and result.match_confidence > gate:
+                    return result
+            return None
+        finally:
+            ctx.cancel()
+            for _, future in futures:
+                future.cancel()
+
+    def _tier_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for speculative tiers, created on first use."""
+        with self._tier_pool_lock:
+            if self._tier_pool is None:
+                self._tier_pool = ThreadPoolExecutor(max_workers=self.tier_workers, thread_name_prefix="match-tier")
+            return self._tier_pool
+
+    def _remember(self, result: MatchResult) -> MatchResult:
+        """Save a network match, and teach the catalogue confident ones."""
+        self.db.save(result)
+        if result.match_confidence >= CATALOGUE_CONFIDENCE:
+            self.catalogue.add(
+                {
+                    "title": result.trakt_title,
+                    "ids": {"trakt": result.trakt_id, "slug": result.trakt_slug, "tvdb": result.tvdb_id},
+                },
+                aliases=[result.viki_title],
+            )
+        return result
+
+    def _tier_catalogue(
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
+    ) -> MatchResult:
+        """Tier 1b: Look the title up in the offline Trakt catalogue.
+
+        Only unambiguous hits count, in order:
+          1) exactly one show with this normalised title or alias (1.0)
+          2) exactly one show once leading articles are dropped (0.9)
+          3) exactly one show whose slug is the title's slug, optionally
+             with a year suffix (0.9)
+        Several candidates are narrowed by the Viki year when known;
+        otherwise the network tiers decide.
+        """
+        viki_id = viki_show.get("id") or viki_show.get("viki_id")
+        year = viki_show.get("year")
+
+        def _unique(shows: List[CatalogueShow]) -> Optional[CatalogueShow]:
+            if len(shows) > 1 and year:
+                shows = [s for s in shows if s.year == year]
+            return shows[0] if len(shows) == 1 else None
+
+        def _slug_hits() -> List[CatalogueShow]:
+            slug_query = slugify(viki_title)
+            return [
+                s for s in self.catalogue.lookup_slug_prefix(slug_query)
+                if s.slug == slug_query or _YEAR_SUFFIX.fullmatch(s.slug[len(slug_query):])
+            ]
+
+        for lookup, confidence, method in (
+            (lambda: self.catalogue.lookup_title(viki_title), 1.0, "catalogue"),
+            (lambda: self.catalogue.lookup_title_no_article(viki_title), CATALOGUE_CONFIDENCE, "catalogue_article"),
+            (_slug_hits, CATALOGUE_CONFIDENCE, "catalogue_slug"),
+        ):
+            show = _unique(lookup())
+            if show:
+                logger.debug(f"Catalogue match: {viki_title} → {show.title} (ID: {show.trakt_id}, via {method})")
+                return MatchResult(
+                    viki_id=viki_id,
+                    viki_title=viki_title,
+                    trakt_id=show.trakt_id,
+                    trakt_slug=show.slug,
+                    trakt_title=show.title,
+                    tvdb_id=show.tvdb_id,
+                    match_confidence=confidence,
+                    match_method=method,
+                    matched_at=datetime.now(timezone.utc),
+                )
+
+        return MatchResult(viki_id=viki_id, viki_title=viki_title)
+
+    def _fuzzy_index(self) -> FuzzyIndex:
+        """TF-IDF index over every catalogue title, kept in step with the catalogue.
+
+        Titles learned since the last build are appended; the index is only
+        rebuilt once titles were removed or the additions pass
+        FUZZY_REBUILD_FRACTION of it.
+        """
+        with self._fuzzy_lock:
+            version = self.catalogue.version
+            if self._fuzzy is not None and self._fuzzy_version == version:
+                return self._fuzzy
+
+            pairs = self.catalogue.all_titles()
+            current = set(pairs)
+            added = [pair for pair in pairs if pair not in self._fuzzy_pairs]
+            removed = len(self._fuzzy_pairs) - (len(current) - len(set(added)))
+            if (
+                self._fuzzy is None
+                or removed
+                or len(added) > FUZZY_REBUILD_FRACTION * len(self._fuzzy)
+            ):
+                self._fuzzy = FuzzyIndex([title for _, title in pairs], keys=[tid for tid, _ in pairs])
+            elif added:
+                self._fuzzy = self._fuzzy.extended([title for _, title in added], keys=[tid for tid, _ in added])
+            self._fuzzy_pairs = current
+            self._fuzzy_version = version
+            return self._fuzzy
+
+    def _tier_fuzzy(
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
+    ) -> MatchResult:
+        """Tier 5: Character n-gram TF-IDF match against the offline catalogue.
+
+        The best show must score at least FUZZY_MIN_SCORE and lead the
+        next-best different show by FUZZY_MIN_MARGIN.
+        """
+        viki_id = viki_show.get("id") or viki_show.get("viki_id")
+
+        best: Dict[int, float] = {}
+        for trakt_id, _title, score in self._fuzzy_index().top(viki_title, k=10):
+            best.setdefault(trakt_id, score)
+        ranked = sorted(best.items(), key=lambda item: -item[1])
+        if not ranked:
+            return MatchResult(viki_id=viki_id, viki_title=viki_title)
+
+        trakt_id, score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        show = self.catalogue.get(trakt_id)
+        if score < FUZZY_MIN_SCORE or score - runner_up < FUZZY_MIN_MARGIN or show is None:
+            return MatchResult(viki_id=viki_id, viki_title=viki_title)
+
+        logger.debug(f"Fuzzy match: {viki_title} → {show.title} (ID: {trakt_id}, score={score:.2f})")
+        return MatchResult(
+            viki_id=viki_id,
+            viki_title=viki_title,
+            trakt_id=trakt_id,
+            trakt_slug=show.slug,
+            trakt_title=show.title,
+            tvdb_id=show.tvdb_id,
+            match_confidence=round(FUZZY_CONFIDENCE * score, 2),
+            match_method="fuzzy",
+            matched_at=datetime.now(timezone.utc),
+        )
+
     def _tier_exact_trakt(
-        self, viki_show: Dict, viki_title: str
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
     ) -> MatchResult:
         """Tier 2: Exact Trakt API search using HTTP requests.
 
@@ -380,50 +807,32 @@ class ShowMatcher:
             MatchResult
         """
         viki_id = viki_show.get("id") or viki_show.get("viki_id")
+        ctx = ctx or MatchContext()
 
         if not self.trakt_available or not self.trakt:
             return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="Trakt not configured")
 
         # Search via pytrakt wrapper (returns list of dicts like HTTP search)
-        results = self.trakt.search_shows(viki_title)
+        results = ctx.call("trakt.search", viki_title, lambda: self.trakt.search_shows(viki_title))
         logger.debug(f"Trakt results count={len(results)} for '{viki_title}'")
         if not results:
             logger.debug(f"No Trakt results for: {viki_title}")
             return MatchResult(viki_id=viki_id, viki_title=viki_title)
 
         # Prefer slug match or normalized title match (with leading-article handling)
-        import re
-
-        def _norm(s: str) -> str:
-            return re.sub(r"[^a-z0-9]+", " ", (s or "").lower()).strip()
-
-        def _norm_no_article(s: str) -> str:
-            ns = _norm(s)
-            return re.sub(r"^(the|a|an)\s+", "", ns)
-
-        def _slugify(s: str) -> str:
-            return re.sub(r"[^a-z0-9]+", "-", (s or "").lower()).strip("-")
-
-        norm_query = _norm(viki_title)
-        norm_query_wo = _norm_no_article(viki_title)
-        slug_query = _slugify(viki_title)
-        slug_query_wo = _slugify(re.sub(r"^(the|a|an)\s+", "", viki_title, flags=re.IGNORECASE))
+        norm_query, norm_query_wo, slug_query, slug_query_wo = title_keys(viki_title)
 
         chosen = None
         chosen_article = None
         matched_via_article = False
         # 1) One-pass scan: prefer exact normalized, otherwise remember article-dropped match
-        for item in results:
-            show = item.get("show", {})
-            title = show.get("title") or ""
-            t_norm = _norm(title)
-            if t_norm == norm_query:
+        candidate_keys = normalize_many(item.get("show", {}).get("title") or "" for item in results)
+        for item, keys in zip(results, candidate_keys):
+            if keys.norm == norm_query:
                 chosen = item
                 break
-            if chosen_article is None:
-                t_norm_wo = _norm_no_article(title)
-                if t_norm_wo == norm_query_wo:
-                    chosen_article = item
+            if chosen_article is None and keys.norm_no_article == norm_query_wo:
+                chosen_article = item
         if chosen is None and chosen_article is not None:
             chosen = chosen_article
             matched_via_article = True
@@ -446,12 +855,11 @@ class ShowMatcher:
                     break
         if chosen is None:
             # 3) Try direct slug lookup via pytrakt (handles shows not indexed by search)
-            from datetime import datetime
-            current_year = datetime.now().year
-            year_candidates = [current_year, current_year - 1, current_year + 1, current_year - 2]
-            slug_candidates = [slug_query] + [f"{slug_query}-{y}" for y in year_candidates]
-            for slug_try in slug_candidates:
-                data = getattr(self.trakt, "get_show_by_slug", lambda s: None)(slug_try)
+            for slug_try in slug_candidates(viki_title):
+                data = ctx.call(
+                    "trakt.slug", slug_try,
+                    lambda: getattr(self.trakt, "get_show_by_slug", lambda s: None)(slug_try),
+                )
                 if data:
                     ids = data.get("ids", {})
                     return MatchResult(
@@ -465,18 +873,21 @@ class ShowMatcher:
                         matched_at=datetime.now(timezone.utc),
                     )
 
-            # 4) As last resort, fall back to first search result
-            chosen = results[0]
+            # 4) As last resort, take the best fuzzy-scored search result
+            #    (the first one unless another is clearly closer)
+            scores = rank_titles(viki_title, [item.get("show", {}).get("title") for item in results])
+            best = max(range(len(results)), key=lambda i: (scores[i], -i))
+            chosen = results[best] if scores[best] >= FUZZY_RERANK_MIN_SCORE else results[0]
 
         show_data = chosen.get("show", {})
         trakt_id = show_data.get("ids", {}).get("trakt")
         trakt_slug = show_data.get("ids", {}).get("slug")
         trakt_title = show_data.get("title")
 
-        if _norm(trakt_title) == norm_query or (trakt_slug or "").startswith(slug_query):
+        if norm_title(trakt_title) == norm_query or (trakt_slug or "").startswith(slug_query):
             confidence = 1.0
             method = "exact_trakt"
-        elif matched_via_article or _norm_no_article(trakt_title) == norm_query_wo or (trakt_slug or "").startswith(slug_query_wo):
+        elif matched_via_article or norm_title_no_article(trakt_title) == norm_query_wo or (trakt_slug or "").startswith(slug_query_wo):
             confidence = 0.9
             method = "exact_trakt_article"
         else:
@@ -500,64 +911,148 @@ class ShowMatcher:
 
         
 
-    def _tier_tvdb(self, viki_show: Dict, viki_title: str) -> MatchResult:
+    def _tvdb_auth(self):
+        """Shared TVDB token manager for the configured key (None if no key)."""
+        return get_tvdb_auth(self.tvdb_api_key or os.getenv("TVDB_API_KEY"))  # Fallback to env for backward compat
+
+    def _tvdb_search(self, ctx: MatchContext, auth, tvdb, query: str):
+        """TVDB series search, once per query per match."""
+        return ctx.call(
+            "tvdb.search", query,
+            lambda: auth.get(
+                tvdb, "https://api4.thetvdb.com/v4/search",
+                params={"query": query, "type": "series"}, timeout=10,
+            ),
+        )
+
+    def _resolve_mdl_aliases(
+        self, ctx: MatchContext, auth, tvdb, aliases: List[str]
+    ) -> Optional[Tuple[int, str, Any, Dict]]:
+        """Resolve MDL aliases to Trakt, up to alias_workers at a time.
+
+        Results are taken in alias order, so the lowest-index alias that
+        resolves wins even if a later one finishes first. Once it is known,
+        queued lookups are cancelled and running ones stop before their next
+        request.
+
+        Returns:
+            (alias index, alias, tvdb_id, Trakt show), or None
+        """
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.alias_workers, len(aliases))), thread_name_prefix="mdl-alias"
+        )
+        futures = [
+            pool.submit(self._resolve_mdl_alias, ctx, auth, tvdb, alias, stop) for alias in aliases
+        ]
+        try:
+            for i, (alias, future) in enumerate(zip(aliases, futures)):
+                try:
+                    resolved = future.result()
+                except Exception as e:
+                    logger.debug(f"MDL alias {alias!r} lookup error: {e}")
+                    continue
+                if resolved:
+                    return (i, alias, *resolved)
+            return None
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _resolve_mdl_alias(
+        self, ctx: MatchContext, auth, tvdb, alias: str, stop: threading.Event
+    ) -> Optional[Tuple[Any, Dict]]:
+        """TVDB id and Trakt show for one MDL alias (None once stop is set)."""
+        if stop.is_set():
+            return None
+        search_resp = self._tvdb_search(ctx, auth, tvdb, alias)
+        if search_resp.status_code != 200:
+            return None
+        results = search_resp.json().get("data", [])
+        if not results:
+            return None
+
+        # Prefer a top result named (or English-aliased) exactly
+        # like this alias, else use the first TVDB result
+        top_ids = [r.get("tvdb_id") for r in results[:3]]
+        details = self._tvdb_series_details(ctx, auth, top_ids)
+        tvdb_id = next(
+            (
+                series.tvdb_id for series in details.values()
+                if norm_title(alias) in {norm_title(t) for t in series.titles()}
+            ),
+            results[0].get("tvdb_id"),
+        )
+        if not tvdb_id or stop.is_set():
+            return None
+
+        # Cross-reference to Trakt
+        t_show = self._trakt_by_tvdb(ctx, tvdb_id)
+        if not t_show or not t_show.get("ids", {}).get("trakt"):
+            return None
+        return tvdb_id, t_show
+
+    def _mdl_client(self):
+        """Shared MDL scraper whose results persist in mdl_cache.db (created on first use)."""
+        with self._mdl_lock:
+            if self._mdl is None:
+                from .mdl_client import MdlCache, MdlClient
+                self._mdl = MdlClient(cache=MdlCache(self.db.db_path.parent / "mdl_cache.db"))
+            return self._mdl
+
+    def _tvdb_series_details(self, ctx: MatchContext, auth, tvdb_ids: List[Any]) -> Dict[int, TvdbSeries]:
+        """TVDB series details (stored, missing ones fetched concurrently), once per match."""
+        ids = tuple(tvdb_ids)
+        return ctx.call("tvdb.series", ids, lambda: self.tvdb_series.get_many(ids, auth=auth))
+
+    def _trakt_by_tvdb(self, ctx: MatchContext, tvdb_id) -> Optional[Dict]:
+        """Trakt show for a TVDB id, once per id per match."""
+        return ctx.call("trakt.tvdb", str(tvdb_id), lambda: self.trakt.get_show_by_tvdb(tvdb_id))
+
+    def _tier_tvdb(
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
+    ) -> MatchResult:
         """Tier 3: TVDB search + Trakt lookup by TVDB ID.
 
         Flow:
-          1) Login to TVDB v4 with API key to get bearer token
+          1) Get the shared TVDB bearer token (see tvdb_auth)
           2) Search TVDB by viki_title (type=series)
           3) Pick best result (exact normalized match preferred)
           4) Call Trakt: /search/tvdb/{id}?type=show
           5) If found, return MatchResult(method="tvdb")
         """
         viki_id = viki_show.get("id") or viki_show.get("viki_id")
+        ctx = ctx or MatchContext()
 
-        api_key = self.tvdb_api_key or os.getenv("TVDB_API_KEY")  # Fallback to env for backward compat
-        if not api_key:
+        auth = self._tvdb_auth()
+        if not auth:
             return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="Missing TVDB API key in config")
 
         try:
             tvdb = get_tvdb_session()
 
-            # Login to get token
-            token_resp = tvdb.session.post(
-                "https://api4.thetvdb.com/v4/login",
-                json={"apikey": api_key},
-                timeout=15,
-            )
-            if token_resp.status_code != 200:
+            if not auth.token():
                 return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="TVDB login failed")
-            token = token_resp.json().get("data", {}).get("token")
-            if not token:
-                return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="TVDB token missing")
-
-            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
             # Search series
-            params = {"query": viki_title, "type": "series"}
-            search_resp = tvdb.get("https://api4.thetvdb.com/v4/search", params=params, headers=headers)
+            search_resp = self._tvdb_search(ctx, auth, tvdb, viki_title)
             if search_resp.status_code != 200:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="TVDB search failed")
             results = search_resp.json().get("data", [])
             if not results:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="TVDB no results")
 
-            import re
-
-            def _norm(s: str) -> str:
-                return re.sub(r"[^a-z0-9]+", " ", (s or "").lower()).strip()
-
-            norm_query = _norm(viki_title)
+            norm_query = norm_title(viki_title)
 
             # Pick best: normalized name or aliases match
             chosen = None
             for r in results:
                 name = r.get("name") or r.get("seriesName") or r.get("title")
-                if _norm(name) == norm_query:
+                if norm_title(name) == norm_query:
                     chosen = r
                     break
                 for a in r.get("aliases", []) or []:
-                    if _norm(a) == norm_query:
+                    if norm_title(a) == norm_query:
                         chosen = r
                         break
                 if chosen:
@@ -573,7 +1068,7 @@ class ShowMatcher:
             # Cross-reference to Trakt by TVDB id via pytrakt
             if not self.trakt:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="Trakt not configured")
-            t_show = self.trakt.get_show_by_tvdb(tvdb_id)
+            t_show = self._trakt_by_tvdb(ctx, tvdb_id)
             if not t_show:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title, notes="Trakt no result for TVDB id")
             ids = t_show.get("ids", {})
@@ -599,7 +1094,9 @@ class ShowMatcher:
             logger.debug(f"TVDB/Trakt HTTP error: {e}")
             return MatchResult(viki_id=viki_id, viki_title=viki_title, notes=str(e))
 
-    def _tier_tvdb_aliases(self, viki_show: Dict, viki_title: str) -> MatchResult:
+    def _tier_tvdb_aliases(
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
+    ) -> MatchResult:
         """Tier 3b: Enhanced TVDB alias matching.
 
         This tier goes deeper into TVDB's alias list to find matches
@@ -607,50 +1104,31 @@ class ShowMatcher:
         alternative English titles, romanized titles, etc.
 
         Flow:
-          1) Login to TVDB v4 with API key
+          1) Get the shared TVDB bearer token (see tvdb_auth)
           2) Search TVDB broadly by viki_title
-          3) For each result, fetch full show details (including aliases)
+          3) Get full details (including aliases) of the top results from
+             the TVDB series store, fetching missing ones concurrently
           4) Check all aliases for normalized matches
           5) Return best match with confidence based on alias type
         """
         viki_id = viki_show.get("id") or viki_show.get("viki_id")
+        ctx = ctx or MatchContext()
 
-        api_key = self.tvdb_api_key or os.getenv("TVDB_API_KEY")  # Fallback to env for backward compat
-        if not api_key:
+        auth = self._tvdb_auth()
+        if not auth:
             return MatchResult(viki_id=viki_id, viki_title=viki_title)
 
         try:
             tvdb = get_tvdb_session()
 
-            # Login to get token
-            token_resp = tvdb.session.post(
-                "https://api4.thetvdb.com/v4/login",
-                json={"apikey": api_key},
-                timeout=15,
-            )
-            if token_resp.status_code != 200:
-                return MatchResult(viki_id=viki_id, viki_title=viki_title)
-            token = token_resp.json().get("data", {}).get("token")
-            if not token:
+            if not auth.token():
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
 
-            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-            # Normalization functions
-            import re
-            def _norm(s: str) -> str:
-                return re.sub(r"[^a-z0-9]+", " ", (s or "").lower()).strip()
-
-            def _norm_no_article(s: str) -> str:
-                ns = _norm(s)
-                return re.sub(r"^(the|a|an)\s+", "", ns)
-
-            norm_query = _norm(viki_title)
-            norm_query_wo = _norm_no_article(viki_title)
+            norm_query = norm_title(viki_title)
+            norm_query_wo = norm_title_no_article(viki_title)
 
             # Search TVDB
-            params = {"query": viki_title, "type": "series"}
-            search_resp = tvdb.get("https://api4.thetvdb.com/v4/search", params=params, headers=headers)
+            search_resp = self._tvdb_search(ctx, auth, tvdb, viki_title)
             if search_resp.status_code != 200:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             results = search_resp.json().get("data", [])
@@ -661,47 +1139,32 @@ class ShowMatcher:
             best_match = None
             best_confidence = 0.0
 
-            for result in results[:10]:  # Check top 10 results
-                tvdb_id = result.get("tvdb_id") or result.get("id")
-                if not tvdb_id:
-                    continue
+            # Check top 10 results, in search order
+            candidate_ids = [result.get("tvdb_id") or result.get("id") for result in results[:10]]
+            details = self._tvdb_series_details(ctx, auth, candidate_ids)
 
-                # Fetch full series details
-                try:
-                    detail_resp = tvdb.get(
-                        f"https://api4.thetvdb.com/v4/series/{tvdb_id}",
-                        headers=headers,
-                        timeout=10
-                    )
-                    if detail_resp.status_code != 200:
-                        continue
-                    detail_data = detail_resp.json().get("data", {})
-                except Exception:
-                    continue
+            for series in details.values():
+                tvdb_id = series.tvdb_id
 
                 # Check primary name
-                primary_name = detail_data.get("name")
-                if primary_name and _norm(primary_name) == norm_query:
-                    best_match = (tvdb_id, detail_data.get("name"), 0.95, "tvdb_alias_primary")
+                primary_name = series.name
+                if primary_name and norm_title(primary_name) == norm_query:
+                    best_match = (tvdb_id, primary_name, 0.95, "tvdb_alias_primary")
                     break
-                elif primary_name and _norm_no_article(primary_name) == norm_query_wo:
+                elif primary_name and norm_title_no_article(primary_name) == norm_query_wo:
                     if best_confidence < 0.85:
                         best_match = (tvdb_id, primary_name, 0.85, "tvdb_alias_primary_article")
                         best_confidence = 0.85
 
                 # Check aliases
-                aliases = detail_data.get("aliases", [])
-                if aliases:
-                    for alias_item in aliases:
-                        alias_name = alias_item.get("language") == "eng" and alias_item.get("name")
-                        if alias_name:
-                            if _norm(alias_name) == norm_query:
-                                best_match = (tvdb_id, alias_name, 0.92, "tvdb_alias_match")
-                                break
-                            elif _norm_no_article(alias_name) == norm_query_wo:
-                                if best_confidence < 0.82:
-                                    best_match = (tvdb_id, alias_name, 0.82, "tvdb_alias_match_article")
-                                    best_confidence = 0.82
+                for alias_name in series.alias_names("eng"):
+                    if norm_title(alias_name) == norm_query:
+                        best_match = (tvdb_id, alias_name, 0.92, "tvdb_alias_match")
+                        break
+                    elif norm_title_no_article(alias_name) == norm_query_wo:
+                        if best_confidence < 0.82:
+                            best_match = (tvdb_id, alias_name, 0.82, "tvdb_alias_match_article")
+                            best_confidence = 0.82
 
                 if best_match and best_match[2] >= 0.92:
                     break
@@ -715,7 +1178,7 @@ class ShowMatcher:
             if not self.trakt:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             
-            t_show = self.trakt.get_show_by_tvdb(tvdb_id)
+            t_show = self._trakt_by_tvdb(ctx, tvdb_id)
             if not t_show:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             
@@ -747,7 +1210,9 @@ class ShowMatcher:
             logger.debug(f"TVDB alias tier HTTP error: {e}")
             return MatchResult(viki_id=viki_id, viki_title=viki_title)
 
-    def _tier_mdl(self, viki_show: Dict, viki_title: str) -> MatchResult:
+    def _tier_mdl(
+        self, viki_show: Dict, viki_title: str, ctx: Optional[MatchContext] = None
+    ) -> MatchResult:
         """Tier 4: MyDramaList alias resolution.
 
         Scrapes MDL to find English aliases + Viki ID,
@@ -758,18 +1223,19 @@ class ShowMatcher:
           1) Search MDL by viki_title (HTML scrape)
           2) Load MDL detail page
           3) Extract English aliases from page
-          4) Search TVDB with each alias (decreasing confidence)
+          4) Search TVDB with each alias (concurrently; earlier aliases win
+             and get higher confidence)
           5) Cross-reference to Trakt by TVDB ID
           6) Cache Viki ID from MDL for future use
         """
         viki_id = viki_show.get("id") or viki_show.get("viki_id")
+        ctx = ctx or MatchContext()
         
         try:
-            from .mdl_client import MdlClient
-            mdl = MdlClient()
+            mdl = self._mdl_client()
             
             # Step 1-3: Search MDL, load detail, extract aliases
-            mdl_data = mdl.search_alias(viki_title)
+            mdl_data = ctx.call("mdl.alias", viki_title, lambda: mdl.search_alias(viki_title))
             if not mdl_data:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             
@@ -786,72 +1252,39 @@ class ShowMatcher:
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             
             # Step 4: Try to match each alias to TVDB
-            api_key = self.tvdb_api_key or os.getenv("TVDB_API_KEY")  # Fallback to env for backward compat
-            if not api_key:
+            auth = self._tvdb_auth()
+            if not auth:
                 logger.debug("MDL tier: Missing TVDB API key in config")
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
             
             try:
                 tvdb = get_tvdb_session()
                 
-                # Try each English alias with decreasing confidence
-                for i, alias in enumerate(english_aliases):
-                    confidence_boost = 0.95 - (i * 0.03)  # 0.95, 0.92, 0.89, ...
-                    
-                    search_resp = tvdb.session.get(
-                        f"{tvdb.base_url}/search",
-                        params={"query": alias, "type": "series"},
-                        headers=tvdb.headers,
-                        timeout=10
-                    )
-                    
-                    if search_resp.status_code != 200:
-                        continue
-                    
-                    results = search_resp.json().get("data", [])
-                    if not results:
-                        continue
-                    
-                    # Use first TVDB result
-                    tvdb_id = results[0].get("tvdb_id")
-                    tvdb_name = results[0].get("name")
-                    
-                    if not tvdb_id:
-                        continue
-                    
-                    # Cross-reference to Trakt
-                    if not self.trakt:
-                        continue
-                    
-                    t_show = self.trakt.get_show_by_tvdb(tvdb_id)
-                    if not t_show:
-                        continue
-                    
+                # Resolve the English aliases concurrently; the lowest-index
+                # alias that resolves wins (0.95, 0.92, 0.89, ...)
+                resolved = self._resolve_mdl_aliases(ctx, auth, tvdb, english_aliases) if self.trakt else None
+                if resolved:
+                    i, alias, tvdb_id, t_show = resolved
                     ids = t_show.get("ids", {})
-                    trakt_id = ids.get("trakt")
-                    trakt_slug = ids.get("slug")
                     trakt_title = t_show.get("title")
-                    
-                    if not trakt_id:
-                        continue
-                    
+
                     logger.debug(
                         f"MDL match: {viki_title} → {trakt_title} "
                         f"(via MDL alias: {alias}, TVDB: {tvdb_id})"
                     )
-                    
+
                     return MatchResult(
                         viki_id=viki_id,
                         viki_title=viki_title,
-                        trakt_id=trakt_id,
-                        trakt_slug=trakt_slug,
+                        trakt_id=ids.get("trakt"),
+                        trakt_slug=ids.get("slug"),
                         trakt_title=trakt_title,
                         tvdb_id=tvdb_id,
-                        match_confidence=confidence_boost,
+                        match_confidence=0.95 - (i * 0.03),
                         match_method="mdl",
                         matched_at=datetime.now(timezone.utc),
                     )
-                
+
                 # No alias matched to Trakt
                 logger.debug(f"MDL {viki_title}: Aliases found but no Trakt match")
                 return MatchResult(viki_id=viki_id, viki_title=viki_title)
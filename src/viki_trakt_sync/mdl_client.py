@@ -10,19 +10,48 @@ Architecture:
   4. Extract English aliases from JSON-LD structured data
   5. Search TVDB with extracted aliases to find TVDB ID
   6. Return aliases + Viki ID for caching
+
+Pages are not parsed into a DOM: the few things needed (first result link,
+JSON-LD block, Viki redirect links) are pulled out with precompiled
+patterns. Results are kept in MdlCache so a title is scraped at most once
+per TTL.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Optional, List
+from datetime import datetime, timedelta, timezone
+from html import unescape
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
 import logging
 import re
 import requests
-from bs4 import BeautifulSoup
 import json
+import sqlite3
+import threading
+
+from .http_utils import DEFAULT_TIMEOUT
+from .normalize import norm_title
+from .transport import HttpTransport, get_transport
 
 logger = logging.getLogger(__name__)
 
+# MDL pages of aired shows rarely change; titles MDL doesn't know are
+# retried sooner in case they get added
+DEFAULT_MDL_TTL = timedelta(days=30)
+DEFAULT_MDL_MISS_TTL = timedelta(days=7)
+
+_A_TAG = re.compile(r"<a\s[^>]*>", re.IGNORECASE)
+_ATTR = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+_LD_JSON = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_CJK = re.compile(r"[\u4e00-\u9fff\uac00-\ud7af\u3040-\u309f]")
+_MDL_ID = re.compile(r"/(\d+)")
+_VIKI_TV_ID = re.compile(r"/tv/([a-z0-9]+)")
+
 # Initialize user agent once with fallback
 _MDL_USER_AGENT: str = ""
 try:
@@ -34,18 +63,174 @@ except Exception as e:
     _MDL_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
 
 
+def _attrs(tag: str) -> Dict[str, str]:
+    """Attributes of one start tag, names lowercased and values unescaped."""
+    attrs: Dict[str, str] = {}
+    for match in _ATTR.finditer(tag):
+        value = next((v for v in match.group(2, 3, 4) if v is not None), "")
+        attrs.setdefault(match.group(1).lower(), unescape(value))
+    return attrs
+
+
+def _anchors(html: str, needle: str) -> Iterator[Dict[str, str]]:
+    """Attributes of every <a> start tag containing needle (case-insensitive)."""
+    needle = needle.lower()
+    for match in _A_TAG.finditer(html):
+        tag = match.group(0)
+        if needle in tag.lower():
+            yield _attrs(tag)
+
+
+def extract_first_result(html: str) -> Optional[str]:
+    """Path of the first search result (the first <a class="text-primary">).
+
+    Returns:
+        href such as "/712567-chilly-cohabitation", or None
+    """
+    for attrs in _anchors(html, "text-primary"):
+        if "text-primary" in attrs.get("class", "").split():
+            return attrs.get("href")
+    return None
+
+
+def extract_aliases(html: str) -> List[str]:
+    """English aliases from the first JSON-LD block with an alternateName.
+
+    Aliases containing CJK characters are dropped.
+    """
+    for match in _LD_JSON.finditer(html):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        alt_names = data.get("alternateName") or []
+        if isinstance(alt_names, str):
+            alt_names = [alt_names]
+        if alt_names:
+            return [name for name in alt_names if isinstance(name, str) and not _CJK.search(name)]
+    return []
+
+
+def extract_viki_id(html: str) -> Optional[str]:
+    """Viki container ID from the first "where to watch" link to Viki.
+
+    Links look like /redirect?q=https%3A%2F%2Fwww.viki.com%2Ftv%2F38670c-my-chilling-roommate
+    (or carry the Viki URL unencoded).
+    """
+    for attrs in _anchors(html, "viki"):
+        href = attrs.get("href", "")
+        if "viki" in href.lower():
+            viki_match = _VIKI_TV_ID.search(unquote(href))
+            if viki_match:
+                return viki_match.group(1)
+    return None
+
+
+class MdlCache:
+    """SQLite store of MDL lookups (~/.config/viki-trakt-sync/mdl_cache.db).
+
+    Keyed by normalised title. "Not on MDL" is remembered too, for a
+    shorter TTL; network errors are never stored. Safe to share between
+    threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: timedelta = DEFAULT_MDL_TTL,
+        miss_ttl: timedelta = DEFAULT_MDL_MISS_TTL,
+    ):
+        """Initialize cache.
+
+        Args:
+            db_path: Path to SQLite database (default: ~/.config/viki-trakt-sync/mdl_cache.db)
+            ttl: Max age of a stored MDL result
+            miss_ttl: Max age of a stored "not found"
+        """
+        if db_path is None:
+            db_path = Path.home() / ".config" / "viki-trakt-sync" / "mdl_cache.db"
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS mdl_aliases (
+                    query TEXT PRIMARY KEY,
+                    result TEXT,
+                    fetched_at TEXT
+                )
+                """
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, title: str) -> Tuple[bool, Optional[Dict]]:
+        """Look a title up.
+
+        Returns:
+            (True, result or None) when a fresh entry exists, else (False, None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at FROM mdl_aliases WHERE query = ?", (norm_title(title),)
+            ).fetchone()
+        if row is None:
+            return False, None
+
+        result = json.loads(row[0]) if row[0] else None
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(row[1])
+        if age > (self.ttl if result else self.miss_ttl):
+            return False, None
+        return True, result
+
+    def put(self, title: str, result: Optional[Dict]) -> None:
+        """Store a lookup result (None = not on MDL)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mdl_aliases (query, result, fetched_at) VALUES (?, ?, ?)",
+                (
+                    norm_title(title),
+                    json.dumps(result) if result else None,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+
 class MdlClient:
     """MyDramaList scraper for alias resolution."""
 
-    def __init__(self):
-        """Initialize MDL client."""
-        self.session = requests.Session()
+    def __init__(self, transport: Optional[HttpTransport] = None, cache: Optional[MdlCache] = None):
+        """Initialize MDL client.
+
+        Args:
+            transport: Pooled HTTP transport (default: shared global transport)
+            cache: Store for lookup results (default: none, always scrape)
+        """
+        self._transport = transport
+        self.cache = cache
         # Use persistent user agent for all requests
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': _MDL_USER_AGENT
-        })
+        }
         self.base_url = "https://mydramalist.com"
 
+    @property
+    def transport(self) -> HttpTransport:
+        """HTTP transport used for all requests (keeps MDL connections alive across calls)."""
+        return self._transport or get_transport()
+
     def search_alias(self, title: str, origin_country: Optional[str] = None) -> Optional[Dict]:
         """Search MDL for a show and extract aliases + Viki ID.
 
@@ -56,6 +241,8 @@ class MdlClient:
           4. Extract English aliases from JSON-LD
           5. Extract Viki ID from "where to watch" links
 
+        Served from the cache when one is configured and holds the title.
+
         Args:
             title: Show title to search for
             origin_country: ISO country code (unused, kept for API compatibility)
@@ -63,82 +250,14 @@ class MdlClient:
         Returns:
             Dict with 'english_aliases' list and 'viki_id' string, or None if not found
         """
-        try:
-            # Step 1: Search MDL
-            search_url = f"{self.base_url}/search"
-            logger.debug(f"Searching MDL for: {title}")
-
-            search_resp = self.session.get(search_url, params={'q': title}, timeout=10)
-            search_resp.raise_for_status()
-
-            search_soup = BeautifulSoup(search_resp.content, 'html.parser')
-
-            # Step 2: Extract first result link
-            results = search_soup.find_all('a', class_='text-primary')
-            if not results:
-                logger.debug(f"MDL: No results for {title}")
-                return None
-
-            result_link = results[0]
-            if not result_link:
-                logger.debug(f"MDL: No link in first result")
-                return None
-
-            mdl_path = result_link.get('href')
-            # Extract MDL ID from URL like /712567-chilly-cohabitation
-            mdl_id_match = re.match(r'/(\d+)', mdl_path)
-            mdl_id = mdl_id_match.group(1) if mdl_id_match else None
-
-            detail_url = f"{self.base_url}{mdl_path}"
-            logger.debug(f"Loading MDL detail: {detail_url}")
-
-            # Step 3: Load detail page
-            detail_resp = self.session.get(detail_url, timeout=10)
-            detail_resp.raise_for_status()
-
-            detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-
-            # Step 4: Extract English aliases from JSON-LD
-            english_aliases = []
-            scripts = detail_soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                try:
-                    data = json.loads(script.string)
-                    alt_names = data.get('alternateName', [])
-                    if alt_names:
-                        # Filter to English aliases (heuristic: no CJK characters)
-                        for name in alt_names:
-                            if not re.search(r'[\u4e00-\u9fff\uac00-\ud7af\u3040-\u309f]', name):
-                                english_aliases.append(name)
-                        logger.debug(f"Extracted aliases from JSON-LD: {english_aliases}")
-                        break
-                except (json.JSONDecodeError, TypeError):
-                    continue
-
-            # Step 5: Extract Viki ID
-            viki_id = None
-            for link in detail_soup.find_all('a'):
-                href = link.get('href', '')
-                if 'viki' in href.lower():
-                    # URL format: /redirect?q=https%3A%2F%2Fwww.viki.com%2Ftv%2F38670c-my-chilling-roommate
-                    viki_match = re.search(r'/tv/([a-z0-9]+)', href)
-                    if viki_match:
-                        viki_id = viki_match.group(1)
-                        logger.debug(f"Extracted Viki ID: {viki_id}")
-                        break
-
-            if not english_aliases and not viki_id:
-                logger.debug(f"MDL {title}: No aliases or Viki ID found")
-                return None
-
-            logger.debug(f"MDL {title}: {len(english_aliases)} aliases, Viki ID: {viki_id}")
-            return {
-                "english_aliases": english_aliases,
-                "viki_id": viki_id,
-                "mdl_url": detail_url,
-                "mdl_id": mdl_id,
-            }
+        if self.cache is not None:
+            found, cached = self.cache.get(title)
+            if found:
+                logger.debug(f"MDL {title}: served from cache")
+                return cached
 
+        try:
+            result = self._scrape(title)
         except requests.RequestException as e:
             logger.debug(f"MDL search error for {title}: {e}")
             return None
@@ -146,6 +265,60 @@ class MdlClient:
             logger.debug(f"MDL parse error for {title}: {e}")
             return None
 
+        if self.cache is not None:
+            self.cache.put(title, result)
+        return result
+
+    def _scrape(self, title: str) -> Optional[Dict]:
+        """Fetch and extract the search and detail pages (raises on HTTP errors)."""
+        # Step 1: Search MDL
+        search_url = f"{self.base_url}/search"
+        logger.debug(f"Searching MDL for: {title}")
+
+        search_resp = self.transport.get(
+            search_url, params={'q': title}, headers=self.headers, timeout=DEFAULT_TIMEOUT
+        )
+        search_resp.raise_for_status()
+
+        # Step 2: Extract first result link
+        mdl_path = extract_first_result(search_resp.text)
+        if not mdl_path:
+            logger.debug(f"MDL: No results for {title}")
+            return None
+
+        # Extract MDL ID from URL like /712567-chilly-cohabitation
+        mdl_id_match = _MDL_ID.match(mdl_path)
+        mdl_id = mdl_id_match.group(1) if mdl_id_match else None
+
+        detail_url = f"{self.base_url}{mdl_path}"
+        logger.debug(f"Loading MDL detail: {detail_url}")
+
+        # Step 3: Load detail page
+        detail_resp = self.transport.get(detail_url, headers=self.headers, timeout=DEFAULT_TIMEOUT)
+        detail_resp.raise_for_status()
+        detail_html = detail_resp.text
+
+        # Step 4: Extract English aliases from JSON-LD
+        english_aliases = extract_aliases(detail_html)
+        logger.debug(f"Extracted aliases from JSON-LD: {english_aliases}")
+
+        # Step 5: Extract Viki ID
+        viki_id = extract_viki_id(detail_html)
+        if viki_id:
+            logger.debug(f"Extracted Viki ID: {viki_id}")
+
+        if not english_aliases and not viki_id:
+            logger.debug(f"MDL {title}: No aliases or Viki ID found")
+            return None
+
+        logger.debug(f"MDL {title}: {len(english_aliases)} aliases, Viki ID: {viki_id}")
+        return {
+            "english_aliases": english_aliases,
+            "viki_id": viki_id,
+            "mdl_url": detail_url,
+            "mdl_id": mdl_id,
+        }
+
     def search_title(self, title: str) -> Optional[Dict]:
         """Simple title search without country filtering.
 
@@ -65,6 +65,8 @@ class Show(BaseModel):
     first_seen_at = DateTimeField(null=True)
     last_fetched_at = DateTimeField(null=True)
     last_synced_at = DateTimeField(null=True)
+    episodes_fetched_at = DateTimeField(null=True)  # full episode list cached
+    container_fetched_at = DateTimeField(null=True)  # title/type/origin from Viki
     
     class Meta:
         table_name = 'shows'
@@ -92,6 +94,11 @@ class Episode(BaseModel):
     synced_at = DateTimeField(null=True)
     sync_session_id = IntegerField(null=True, index=True)  # Links to SyncLog.id for undo
     
+    # Set when Trakt answered the episode as not_found; kept out of the push
+    # queue until the show's match changes
+    trakt_rejected_at = DateTimeField(null=True)
+    trakt_reject_reason = CharField(null=True)
+    
     class Meta:
         table_name = 'episodes'
         indexes = (
@@ -148,14 +155,52 @@ class SyncMetadata(BaseModel):
         table_name = 'sync_metadata'
 
 
+class TraktSeasonMap(BaseModel):
+    """Absolute episode number -> Trakt season/episode for one Trakt show.
+    
+    Built from /shows/{id}/seasons?extended=episodes. Viki numbers episodes
+    absolutely, while Trakt may split a show into seasons.
+    """
+    
+    trakt_id = IntegerField(primary_key=True)
+    episodes = TextField()  # JSON [[season, episode], ...] in absolute order
+    fetched_at = DateTimeField(default=lambda: datetime.now(timezone.utc))
+    
+    class Meta:
+        table_name = 'trakt_season_maps'
+
+
 # All models for table creation
-ALL_MODELS = [Show, Episode, Match, SyncLog, SyncMetadata]
+ALL_MODELS = [Show, Episode, Match, SyncLog, SyncMetadata, TraktSeasonMap]
+
+
+def _add_missing_columns() -> None:
+    """Add columns introduced after an existing database was created.
+    
+    create_tables(safe=True) never alters existing tables, so new nullable
+    fields are added here with ALTER TABLE ... ADD COLUMN.
+    """
+    from playhouse.migrate import SqliteMigrator, migrate
+    
+    migrator = SqliteMigrator(database)
+    operations = []
+    for model in ALL_MODELS:
+        table = model._meta.table_name
+        existing = {column.name for column in database.get_columns(table)}
+        for field in model._meta.sorted_fields:
+            if field.column_name not in existing:
+                operations.append(migrator.add_column(table, field.column_name, field))
+    
+    if operations:
+        with database.atomic():
+            migrate(*operations)
 
 
 def init_db() -> None:
     """Initialize database and create tables."""
     database.connect(reuse_if_open=True)
     database.create_tables(ALL_MODELS, safe=True)
+    _add_missing_columns()
 
 
 def close_db() -> None:
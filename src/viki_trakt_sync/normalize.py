@@ -0,0 +1,113 @@
+"""Title normalisation shared by the matcher tiers and corpus tools.
+
+Every tier compares a Viki title against many candidate titles (Trakt
+search results, TVDB names and aliases). The same candidates recur across
+tiers and shows, so the keys are computed with precompiled patterns and
+memoised:
+
+  - norm_title("The K2!")            -> "the k2"
+  - norm_title_no_article("The K2!") -> "k2"
+  - slugify("The K2!")               -> "the-k2"
+  - slugify_no_article("The K2!")    -> "k2"
+
+title_keys() returns all four at once; normalize_many() does it for a
+whole candidate list.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_LEADING_ARTICLE = re.compile(r"^(the|a|an)\s+")
+_LEADING_ARTICLE_ANY_CASE = re.compile(r"^(the|a|an)\s+", re.IGNORECASE)
+
+# Distinct titles kept per key function (a full watchlist plus its candidates)
+_CACHE_SIZE = 8192
+
+
+class TitleKeys(NamedTuple):
+    """All comparison keys for one title."""
+    norm: str
+    norm_no_article: str
+    slug: str
+    slug_no_article: str
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def norm_title(title: Optional[str]) -> str:
+    """Lowercase, with runs of non-alphanumerics collapsed to one space."""
+    return _NON_ALNUM.sub(" ", (title or "").lower()).strip()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def norm_title_no_article(title: Optional[str]) -> str:
+    """norm_title() without a leading "the", "a" or "an"."""
+    return _LEADING_ARTICLE.sub("", norm_title(title))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def slugify(title: Optional[str]) -> str:
+    """Trakt-style slug: lowercase alphanumerics joined by hyphens."""
+    return _NON_ALNUM.sub("-", (title or "").lower()).strip("-")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def slugify_no_article(title: Optional[str]) -> str:
+    """slugify() after dropping a leading article."""
+    return slugify(_LEADING_ARTICLE_ANY_CASE.sub("", title or ""))
+
+
+def title_keys(title: Optional[str]) -> TitleKeys:
+    """Get every comparison key for a title (each one memoised)."""
+    return TitleKeys(
+        norm_title(title),
+        norm_title_no_article(title),
+        slugify(title),
+        slugify_no_article(title),
+    )
+
+
+def normalize_many(titles: Iterable[Optional[str]]) -> List[TitleKeys]:
+    """title_keys() for a whole candidate list, in order."""
+    return [title_keys(title) for title in titles]
+
+
+def slug_candidates(title: Optional[str], years: Optional[Sequence[int]] = None) -> List[str]:
+    """Slugs to probe for a title: the bare slug, then year-suffixed ones.
+
+    Args:
+        title: Show title
+        years: Suffixes to try (default: this year, last year, next year,
+               two years ago)
+
+    Returns:
+        Slug strings, bare slug first
+    """
+    base = slugify(title)
+    if years is None:
+        current_year = datetime.now().year
+        years = [current_year, current_year - 1, current_year + 1, current_year - 2]
+    return [base] + [f"{base}-{year}" for year in years]
+
+
+def cache_clear() -> None:
+    """Drop all memoised keys."""
+    for fn in (norm_title, norm_title_no_article, slugify, slugify_no_article):
+        fn.cache_clear()
+
+
+__all__ = [
+    "TitleKeys",
+    "cache_clear",
+    "norm_title",
+    "norm_title_no_article",
+    "normalize_many",
+    "slug_candidates",
+    "slugify",
+    "slugify_no_article",
+    "title_keys",
+]
@@ -0,0 +1,106 @@
+"""Pipelined pagination for page-numbered APIs.
+
+Viki list endpoints return ``{"response": [...], "more": bool}`` (and
+sometimes a total ``count``). Walking them strictly page by page costs one
+full round-trip per page. iter_pages() overlaps those round-trips:
+
+  - Page 1 is fetched alone, so single-page lists cost exactly one request
+  - If page 1 reports a total count, all remaining pages are fanned out
+  - Otherwise the next ``prefetch`` pages are requested speculatively while
+    the current one is being consumed
+
+Pages are always yielded in order, and iteration stops at the first page
+with ``more`` false or an empty list; speculative pages past the end are
+cancelled or discarded.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pages requested ahead of the one being consumed
+DEFAULT_PAGE_PREFETCH = 2
+
+
+def _has_more(response: Dict[str, Any]) -> bool:
+    return bool(response.get("more", False)) and bool(response.get("response"))
+
+
+def _last_page(response: Dict[str, Any], page_size: Optional[int], first_page: int) -> Optional[int]:
+    """Last page number implied by a total count, if the response has one."""
+    count = response.get("count")
+    if not page_size or not isinstance(count, int) or count <= 0:
+        return None
+    return first_page + math.ceil(count / page_size) - 1
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    prefetch: int = DEFAULT_PAGE_PREFETCH,
+    page_size: Optional[int] = None,
+    first_page: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """Yield paginated responses in page order, fetching ahead.
+
+    Args:
+        fetch_page: Called with a page number, returns that page's response
+        prefetch: Max pages in flight ahead of the current one (0 = sequential)
+        page_size: Items per page, used to turn a total ``count`` into a page range
+        first_page: Number of the first page
+
+    Yields:
+        Response dicts, in page order
+
+    Raises:
+        Whatever fetch_page raised, when the failing page is reached
+    """
+    response = fetch_page(first_page)
+    yield response
+    if not _has_more(response):
+        return
+
+    page = first_page + 1
+    if prefetch <= 0:
+        while True:
+            response = fetch_page(page)
+            yield response
+            if not _has_more(response):
+                return
+            page += 1
+
+    last_page = _last_page(response, page_size, first_page)
+    inflight: Dict[int, Future] = {}
+    next_page = page
+
+    with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="page-prefetch") as pool:
+
+        def submit_through(limit: int) -> None:
+            nonlocal next_page
+            while next_page <= limit:
+                inflight[next_page] = pool.submit(fetch_page, next_page)
+                next_page += 1
+
+        try:
+            while True:
+                # Known total: fan out everything; otherwise keep `prefetch` pages ahead
+                submit_through(last_page if last_page is not None else page + prefetch - 1)
+                if page not in inflight:
+                    # Server says "more" past the advertised count
+                    submit_through(page)
+
+                response = inflight.pop(page).result()
+                yield response
+                if not _has_more(response):
+                    return
+                page += 1
+        finally:
+            for future in inflight.values():
+                future.cancel()
+
+
+__all__ = ["DEFAULT_PAGE_PREFETCH", "iter_pages"]
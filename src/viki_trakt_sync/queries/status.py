@@ -25,6 +25,7 @@ class SyncStats:
     pending_sync: int
     last_sync: Optional[datetime]
     last_sync_status: Optional[str]
+    rejected_episodes: int = 0  # Trakt answered not_found; not re-pushed
     
     @property
     def match_rate(self) -> float:
@@ -78,6 +79,7 @@ class StatusQuery:
             pending_sync=stats.get('pending_sync', 0),
             last_sync=stats.get('last_sync'),
             last_sync_status=stats.get('last_sync_status'),
+            rejected_episodes=stats.get('rejected_episodes', 0),
         )
     
     def get_issues(self) -> List[SyncIssue]:
@@ -105,6 +107,14 @@ class StatusQuery:
                 context="Run 'sync' to sync to Trakt",
             ))
         
+        # Check for episodes Trakt refused
+        if stats.rejected_episodes > 0:
+            issues.append(SyncIssue(
+                severity="warning",
+                message=f"{stats.rejected_episodes} episode(s) rejected by Trakt (not found)",
+                context="Re-match the show to queue them again",
+            ))
+        
         # Check last sync status
         if stats.last_sync_status and stats.last_sync_status != "success":
             issues.append(SyncIssue(
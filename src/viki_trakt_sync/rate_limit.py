@@ -0,0 +1,258 @@
+"""Per-host rate limiting with Retry-After aware backoff.
+
+Every request sent through the shared transport (see transport.py) first
+takes a token from its host's bucket: reads (GET/HEAD/OPTIONS) and writes
+(POST/PUT/PATCH/DELETE) have separate budgets, since upstreams like Trakt
+limit writes far more tightly (about one per second) than reads.
+
+When an upstream still answers 429 (or 503 with Retry-After), the whole
+host is paused for the advertised delay, so concurrent workers back off
+together instead of each hammering it again.
+
+Time spent waiting is recorded per host (RateLimiter.snapshot()).
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Cap for computed (not server-advertised) backoff delays
+MAX_BACKOFF = 60.0
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Request budget for one host."""
+    read_per_second: float
+    write_per_second: float
+    read_burst: Optional[float] = None  # default: max(1, read_per_second)
+    write_burst: Optional[float] = None  # default: max(1, write_per_second)
+
+
+# Trakt: 1000 authed GETs per 5 minutes, POST/PUT/DELETE once per second.
+# Viki/TVDB publish no limits; these are conservative. MDL is scraped - be polite.
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    "api.trakt.tv": RateLimit(read_per_second=1000 / 300, write_per_second=1.0, read_burst=10, write_burst=1),
+    "api.viki.io": RateLimit(read_per_second=8.0, write_per_second=2.0, read_burst=16),
+    "www.viki.com": RateLimit(read_per_second=4.0, write_per_second=1.0),
+    "api4.thetvdb.com": RateLimit(read_per_second=10.0, write_per_second=2.0, read_burst=20),
+    "mydramalist.com": RateLimit(read_per_second=1.0, write_per_second=1.0, read_burst=2),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are reserved rather than polled: a caller that finds the bucket
+    empty still takes its token (driving the balance negative) and is told
+    how long to sleep, so waiters are served in arrival order without spinning.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds the caller must wait before using it (0.0 if available now)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@dataclass
+class ThrottleStats:
+    """Rate limiting counters for one upstream host."""
+    throttled_requests: int = 0
+    throttled_seconds: float = 0.0
+    rate_limited: int = 0  # 429 responses
+    retries: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display."""
+        return {
+            "throttled_requests": self.throttled_requests,
+            "throttled_seconds": self.throttled_seconds,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+        }
+
+
+@dataclass
+class _HostState:
+    read: Optional[TokenBucket]
+    write: Optional[TokenBucket]
+    blocked_until: float = 0.0
+    stats: ThrottleStats = field(default_factory=ThrottleStats)
+
+
+class RateLimiter:
+    """Per-host read/write token buckets plus Retry-After host pauses.
+
+    Usage:
+        limiter = RateLimiter()
+        limiter.acquire("api.trakt.tv", "POST")   # blocks until allowed
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize limiter.
+
+        Args:
+            limits: Per-host budgets (default: DEFAULT_RATE_LIMITS). Hosts
+                    without an entry are not throttled, but still honor
+                    Retry-After pauses.
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                limit = self.limits.get(host)
+                if limit is None:
+                    state = _HostState(read=None, write=None)
+                else:
+                    state = _HostState(
+                        read=TokenBucket(
+                            limit.read_per_second,
+                            limit.read_burst or max(1.0, limit.read_per_second),
+                            self._clock,
+                        ),
+                        write=TokenBucket(
+                            limit.write_per_second,
+                            limit.write_burst or max(1.0, limit.write_per_second),
+                            self._clock,
+                        ),
+                    )
+                self._hosts[host] = state
+            return state
+
+    def acquire(self, host: str, method: str = "GET") -> float:
+        """Wait until a request to host is allowed.
+
+        Args:
+            host: Upstream hostname
+            method: HTTP method (selects the read or write budget)
+
+        Returns:
+            Seconds spent waiting
+        """
+        state = self._state(host)
+        bucket = state.write if method.upper() in WRITE_METHODS else state.read
+
+        wait = bucket.reserve() if bucket is not None else 0.0
+        with self._lock:
+            wait = max(wait, state.blocked_until - self._clock())
+            if wait > 0:
+                state.stats.throttled_requests += 1
+                state.stats.throttled_seconds += wait
+
+        if wait > 0:
+            logger.debug(f"Throttling {method} {host} for {wait:.2f}s")
+            self._sleep(wait)
+            return wait
+        return 0.0
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Block all requests to host for the next `seconds` (e.g. Retry-After)."""
+        state = self._state(host)
+        with self._lock:
+            state.blocked_until = max(state.blocked_until, self._clock() + seconds)
+
+    def record_response(self, host: str, status_code: int, retrying: bool) -> None:
+        """Count a rate-limited response and/or a retry."""
+        state = self._state(host)
+        with self._lock:
+            if status_code == 429:
+                state.stats.rate_limited += 1
+            if retrying:
+                state.stats.retries += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the per-host throttle counters as plain dicts."""
+        with self._lock:
+            return {host: state.stats.to_dict() for host, state in self._hosts.items()}
+
+    def reset(self) -> None:
+        """Clear all counters and pauses (buckets keep their configuration)."""
+        with self._lock:
+            self._hosts.clear()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait (>= 0), or None if missing/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None, backoff_factor: float = 1.0) -> float:
+    """Delay before retry number `attempt` (0-based), with jitter.
+
+    A server-advertised Retry-After is honored as a floor plus up to 10%
+    jitter; otherwise exponential backoff (backoff_factor * 2**attempt,
+    capped at MAX_BACKOFF) with "equal jitter" (half fixed, half random),
+    so parallel workers don't retry in lockstep.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, retry_after * 0.1)
+    delay = min(MAX_BACKOFF, backoff_factor * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+__all__ = [
+    "DEFAULT_RATE_LIMITS",
+    "RateLimit",
+    "RateLimiter",
+    "ThrottleStats",
+    "TokenBucket",
+    "parse_retry_after",
+    "retry_delay",
+]
@@ -7,10 +7,14 @@ to the Peewee models, handling all database operations.
 from __future__ import annotations
 
 import hashlib
+import json
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from .models import Show, Episode, Match, SyncLog, SyncMetadata, database, init_db
+from .models import Show, Episode, Match, SyncLog, SyncMetadata, TraktSeasonMap, database, init_db
+
+logger = logging.getLogger(__name__)
 
 
 class Repository:
@@ -67,6 +71,28 @@ class Repository:
         
         return show
     
+    def get_container_fetched_times(self, viki_ids: List[str]) -> Dict[str, Optional[datetime]]:
+        """Get when each show's container metadata was last fetched.
+    
+        Args:
+            viki_ids: Viki container IDs
+    
+        Returns:
+            Dict mapping viki_id -> container_fetched_at (unknown shows omitted)
+        """
+        if not viki_ids:
+            return {}
+        query = (
+            Show.select(Show.viki_id, Show.container_fetched_at)
+            .where(Show.viki_id.in_(viki_ids))
+        )
+        return {show.viki_id: show.container_fetched_at for show in query}
+    
+    def mark_container_fetched(self, viki_id: str) -> None:
+        """Record that a show's container metadata was just fetched."""
+        now = datetime.now(timezone.utc)
+        Show.update(container_fetched_at=now).where(Show.viki_id == viki_id).execute()
+    
     def get_unmatched_shows(self) -> List[Show]:
         """Get shows without a Trakt match."""
         return list(Show.select().where(
@@ -148,17 +174,59 @@ class Repository:
         
         return episode
     
-    def get_unsynced_episodes(self) -> List[Episode]:
-        """Get episodes that are watched but not synced to Trakt."""
-        return list(
+    def store_episode_metadata(self, viki_id: str, episodes: List[Dict[str, Any]]) -> int:
+        """Store a show's full episode list and stamp it as fetched.
+    
+        Only metadata is written; watch progress on existing rows is untouched.
+        Creates a placeholder show if the container hasn't been stored yet.
+    
+        Args:
+            viki_id: Viki container ID
+            episodes: Dicts with viki_video_id, episode_number, duration, credits_marker
+    
+        Returns:
+            Number of episodes stored
+        """
+        now = datetime.now(timezone.utc)
+        with database.atomic():
+            show = self.get_show(viki_id) or self.upsert_show(viki_id)
+            for ep in episodes:
+                self.upsert_episode(
+                    viki_video_id=ep['viki_video_id'],
+                    viki_id=viki_id,
+                    episode_number=ep.get('episode_number'),
+                    duration=ep.get('duration'),
+                    credits_marker=ep.get('credits_marker'),
+                )
+            show.episodes_fetched_at = now
+            show.save()
+        return len(episodes)
+    
+    def invalidate_episode_metadata(self, viki_id: str) -> None:
+        """Forget that a show's episode list was fetched (forces a refetch)."""
+        Show.update(episodes_fetched_at=None).where(Show.viki_id == viki_id).execute()
+    
+    def get_unsynced_episodes(self, viki_ids: Optional[List[str]] = None) -> List[Episode]:
+        """Get episodes that are watched but not synced to Trakt.
+        
+        Episodes Trakt rejected are excluded (see get_rejected_episodes).
+        
+        Args:
+            viki_ids: Restrict to these shows (default: all shows)
+        """
+        query = (
             Episode.select()
             .join(Show)
             .where(
                 (Episode.is_watched == True) &
                 (Episode.synced_to_trakt == False) &
+                (Episode.trakt_rejected_at.is_null(True)) &
                 (Show.trakt_id.is_null(False))
             )
         )
+        if viki_ids is not None:
+            query = query.where(Show.viki_id.in_(viki_ids))
+        return list(query)
     
     def mark_episodes_synced(self, episodes: List[Episode], session_id: Optional[int] = None) -> int:
         """Mark episodes as synced to Trakt (atomic operation).
@@ -179,6 +247,8 @@ class Repository:
                     ep.synced_to_trakt = True
                     ep.synced_at = now
                     ep.sync_session_id = session_id
+                    ep.trakt_rejected_at = None
+                    ep.trakt_reject_reason = None
                     ep.save()
         except Exception as e:
             logger.error(f"Failed to mark {len(episodes)} episodes as synced: {e}")
@@ -186,6 +256,63 @@ class Repository:
         
         return len(episodes)
     
+    def mark_episodes_rejected(self, episodes: List[Episode], reason: str = "not_found") -> int:
+        """Park episodes Trakt refused so they are not re-pushed every run.
+        
+        Args:
+            episodes: Episodes Trakt rejected
+            reason: Why (e.g. the response section they appeared in)
+        """
+        if not episodes:
+            return 0
+        
+        now = datetime.now(timezone.utc)
+        try:
+            with database.atomic():
+                for ep in episodes:
+                    ep.trakt_rejected_at = now
+                    ep.trakt_reject_reason = reason
+                    ep.save()
+        except Exception as e:
+            logger.error(f"Failed to mark {len(episodes)} episodes as rejected: {e}")
+            return 0
+        
+        return len(episodes)
+    
+    def get_rejected_episodes(self, viki_ids: Optional[List[str]] = None) -> List[Episode]:
+        """Get unsynced episodes that Trakt rejected.
+        
+        Args:
+            viki_ids: Restrict to these shows (default: all shows)
+        """
+        query = (
+            Episode.select()
+            .join(Show)
+            .where(
+                (Episode.synced_to_trakt == False) &
+                (Episode.trakt_rejected_at.is_null(False))
+            )
+        )
+        if viki_ids is not None:
+            query = query.where(Show.viki_id.in_(viki_ids))
+        return list(query)
+    
+    def clear_rejections(self, viki_id: Optional[str] = None) -> int:
+        """Put rejected episodes back in the push queue.
+        
+        Args:
+            viki_id: Only this show's episodes (default: all shows)
+            
+        Returns:
+            Number of episodes re-queued
+        """
+        query = Episode.update(trakt_rejected_at=None, trakt_reject_reason=None).where(
+            Episode.trakt_rejected_at.is_null(False)
+        )
+        if viki_id is not None:
+            query = query.where(Episode.show == viki_id)
+        return query.execute()
+    
     def undo_sync(self, session_id: int) -> int:
         """Undo a sync session by clearing sync flags for all episodes in that session.
         
@@ -256,6 +383,8 @@ class Repository:
             show.match_confidence = confidence
             show.match_method = method
             show.save()
+            # A different Trakt show may know the episodes the old one rejected
+            self.clear_rejections(viki_id)
         
         return match
     
@@ -337,6 +466,15 @@ class Repository:
         total_episodes = Episode.select().count()
         watched_episodes = Episode.select().where(Episode.is_watched == True).count()
         synced_episodes = Episode.select().where(Episode.synced_to_trakt == True).count()
+        rejected_episodes = Episode.select().where(
+            (Episode.synced_to_trakt == False) & (Episode.trakt_rejected_at.is_null(False))
+        ).count()
+        # Rejected episodes are parked, not pending (see get_unsynced_episodes)
+        watched_rejected = Episode.select().where(
+            (Episode.is_watched == True) &
+            (Episode.synced_to_trakt == False) &
+            (Episode.trakt_rejected_at.is_null(False))
+        ).count()
         
         last_sync = self.get_last_sync()
         
@@ -347,7 +485,8 @@ class Repository:
             'total_episodes': total_episodes,
             'watched_episodes': watched_episodes,
             'synced_episodes': synced_episodes,
-            'pending_sync': watched_episodes - synced_episodes,
+            'pending_sync': watched_episodes - synced_episodes - watched_rejected,
+            'rejected_episodes': rejected_episodes,
             'last_sync': last_sync.timestamp if last_sync else None,
             'last_sync_status': last_sync.status if last_sync else None,
         }
@@ -394,6 +533,41 @@ class Repository:
         shows = self.get_all_shows()
         return [self.get_show_progress(s.viki_id) for s in shows]
     
+    # --- Trakt Season Maps ---
+    
+    def get_trakt_season_maps(self, trakt_ids: List[int]) -> Dict[int, TraktSeasonMap]:
+        """Get stored season maps for these Trakt shows (missing ones omitted)."""
+        if not trakt_ids:
+            return {}
+        query = TraktSeasonMap.select().where(TraktSeasonMap.trakt_id.in_(list(trakt_ids)))
+        return {row.trakt_id: row for row in query}
+    
+    def store_trakt_season_map(self, trakt_id: int, episodes: List[List[int]]) -> None:
+        """Store a Trakt show's season map.
+        
+        Episodes Trakt rejected for this show were probably pushed with the
+        old (or no) mapping, so they are re-queued when the map changes.
+        
+        Args:
+            trakt_id: Trakt show ID
+            episodes: [season, episode] pairs in absolute episode order
+        """
+        value = json.dumps(episodes)
+        now = datetime.now(timezone.utc)
+        with database.atomic():
+            existing = TraktSeasonMap.get_or_none(TraktSeasonMap.trakt_id == trakt_id)
+            TraktSeasonMap.insert(
+                trakt_id=trakt_id,
+                episodes=value,
+                fetched_at=now,
+            ).on_conflict(
+                conflict_target=[TraktSeasonMap.trakt_id],
+                update={'episodes': value, 'fetched_at': now},
+            ).execute()
+            if existing is None or existing.episodes != value:
+                for show in Show.select().where(Show.trakt_id == trakt_id):
+                    self.clear_rejections(show.viki_id)
+    
     # --- Metadata Operations ---
     
     def get_metadata(self, key: str) -> Optional[str]:
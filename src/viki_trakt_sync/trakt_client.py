@@ -8,7 +8,13 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+import requests
+
+from .http_cache import CachedSession, get_trakt_session
+from .http_utils import API_TIMEOUT
+from .transport import HttpTransport, get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +22,27 @@ logger = logging.getLogger(__name__)
 class TraktClient:
     """Trakt.tv API client using PyTrakt library."""
     
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        transport: Optional[HttpTransport] = None,
+        http_cache: Optional[CachedSession] = None,
+    ):
         """Initialize Trakt client with credentials.
         
         Args:
             client_id: Trakt API client ID (from settings.toml)
             client_secret: Trakt API client secret (from settings.toml)
+            transport: Pooled HTTP transport (default: shared global transport)
+            http_cache: Cache for show lookups and searches (default: shared Trakt cache)
         """
         # Credentials MUST come from config, not environment variables
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None  # Set via configure_oauth_token() if needed
+        self._transport = transport
+        self._http_cache = http_cache
         
         if not self.client_id or not self.client_secret:
             raise RuntimeError("TRAKT_CLIENT_ID and TRAKT_CLIENT_SECRET are required in settings.toml [trakt] section")
@@ -56,6 +72,32 @@ class TraktClient:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize PyTrakt: {e}") from e
 
+    @property
+    def transport(self) -> HttpTransport:
+        """HTTP transport used for all API requests."""
+        return self._transport or get_transport()
+
+    @property
+    def http_cache(self) -> CachedSession:
+        """Cache used for all public GET lookups."""
+        return self._http_cache or get_trakt_session()
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            'Content-Type': 'application/json',
+            'trakt-api-version': '2',
+            'trakt-api-key': self.client_id,
+        }
+        if self.access_token:
+            headers['Authorization'] = f'Bearer {self.access_token}'
+        return headers
+
+    def _get(self, url: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Cached GET (404s and empty results are cached with a shorter TTL)."""
+        return self.http_cache.get(
+            url, endpoint=endpoint, params=params, headers=self._headers(), timeout=API_TIMEOUT
+        )
+
     def device_login(self, poll: bool = True, timeout: int = 600) -> Dict:
         """Run device-code login flow via OAuth.
         
@@ -97,19 +139,12 @@ class TraktClient:
         """
         # PyTrakt requires OAuth/PIN auth, but we can still use HTTP API directly
         # with just the client ID (no auth required for public search)
-        import requests
-        
         try:
-            headers = {
-                'Content-Type': 'application/json',
-                'trakt-api-version': '2',
-                'trakt-api-key': self.client_id,
-            }
-            if self.access_token:
-                headers['Authorization'] = f'Bearer {self.access_token}'
-            
-            url = f"https://api.trakt.tv/search?type=show&query={title}"
-            resp = requests.get(url, headers=headers, params=None, timeout=30)
+            # Trakt search ignores case and spacing; normalising the query
+            # lets equivalent titles share one cache entry
+            query = normalize_query(title)
+            url = "https://api.trakt.tv/search"
+            resp = self._get(url, "search", params={"type": "show", "query": query})
             resp.raise_for_status()
             
             results = resp.json() or []
@@ -131,19 +166,11 @@ class TraktClient:
         Returns:
             Show data dict with full metadata, or None if not found
         """
-        import requests
-        
         try:
-            headers = {
-                'Content-Type': 'application/json',
-                'trakt-api-version': '2',
-                'trakt-api-key': self.client_id,
-            }
-            if self.access_token:
-                headers['Authorization'] = f'Bearer {self.access_token}'
-            
-            url = f"https://api.trakt.tv/shows/{slug}?extended=full"
-            resp = requests.get(url, headers=headers, timeout=30)
+            url = f"https://api.trakt.tv/shows/{slug.strip().lower()}"
+            resp = self._get(url, "shows", params={"extended": "full"})
+            if resp.status_code == 404:
+                return None
             resp.raise_for_status()
             
             show = resp.json()
@@ -178,20 +205,9 @@ class TraktClient:
             Show data dict with ids, or None if not found
         """
         try:
-            # PyTrakt can search by TVDB ID via the search by id method
-            # This is a bit of a workaround since PyTrakt doesn't have direct TVDB lookup
-            # We'll use the HTTP API approach as fallback
-            import requests
-            headers = {
-                'Content-Type': 'application/json',
-                'trakt-api-version': '2',
-                'trakt-api-key': self.client_id,
-            }
-            if self.access_token:
-                headers['Authorization'] = f'Bearer {self.access_token}'
-            
-            url = f"https://api.trakt.tv/search/tvdb/{tvdb_id}?type=show"
-            resp = requests.get(url, headers=headers, timeout=30)
+            # PyTrakt doesn't have a direct TVDB lookup; use the HTTP id search
+            url = f"https://api.trakt.tv/search/tvdb/{str(tvdb_id).strip()}"
+            resp = self._get(url, "search/tvdb", params={"type": "show"})
             resp.raise_for_status()
             
             results = resp.json()
@@ -211,3 +227,8 @@ class TraktClient:
         except Exception as e:
             logger.debug(f"get_show_by_tvdb failed for {tvdb_id}: {e}")
             return None
+
+
+def normalize_query(title: str) -> str:
+    """Normalise a search query for Trakt (case-folded, single-spaced)."""
+    return " ".join((title or "").split()).casefold()
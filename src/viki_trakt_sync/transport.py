@@ -0,0 +1,367 @@
+"""Shared HTTP transport for all upstream clients.
+
+Owns one pooled keep-alive ``requests.Session`` per upstream host, so
+repeated calls to Viki, Trakt, TVDB and MDL reuse TCP+TLS connections
+instead of opening a new one per request.
+
+Every session (including the requests-cache sessions from http_cache)
+gets an InstrumentedAdapter mounted, which:
+  - sizes the urllib3 connection pool
+  - waits for the host's read/write token bucket (rate_limit.py)
+  - retries 429s (and transient 5xx on reads), honoring Retry-After
+  - records per-host request counts, latency and bytes received
+
+Cached responses never reach the adapter, so the counters only reflect
+real network traffic.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .http_utils import DEFAULT_TIMEOUT
+from .rate_limit import DEFAULT_RATE_LIMITS, RateLimit, RateLimiter, WRITE_METHODS, parse_retry_after, retry_delay
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+
+# Retried for any method (the request was not processed)
+_RETRY_ALWAYS = frozenset({429})
+# Retried for reads only; writes only when the server sends Retry-After
+_RETRY_READS = frozenset({502, 503, 504})
+
+
+def _accept_encoding() -> str:
+    """Content encodings we can decode (brotli only if a decoder is installed)."""
+    try:
+        import brotli  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        pass
+    try:
+        import brotlicffi  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        return "gzip, deflate"
+
+
+ACCEPT_ENCODING = _accept_encoding()
+
+
+@dataclass
+class HostStats:
+    """Network counters for one upstream host."""
+    requests: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    total_latency: float = 0.0  # seconds
+    max_latency: float = 0.0  # seconds
+
+    @property
+    def avg_latency(self) -> float:
+        """Average request latency in seconds."""
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "avg_latency_ms": self.avg_latency * 1000,
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+@dataclass
+class TransportStats:
+    """Thread-safe per-host network counters."""
+    hosts: Dict[str, HostStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, host: str, latency: float, bytes_received: int = 0, error: bool = False) -> None:
+        """Record one network request."""
+        with self._lock:
+            stats = self.hosts.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.bytes_received += bytes_received
+            if error:
+                stats.errors += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the counters as plain dicts."""
+        with self._lock:
+            return {host: stats.to_dict() for host, stats in self.hosts.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self.hosts.clear()
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter that rate limits, retries throttled requests and records
+    latency and bytes for each network request."""
+
+    def __init__(
+        self,
+        stats: TransportStats,
+        limiter: Optional[RateLimiter] = None,
+        max_retries_throttled: int = DEFAULT_MAX_RETRIES,
+        **kwargs: Any,
+    ):
+        self.stats = stats
+        self.limiter = limiter
+        self.max_retries_throttled = max_retries_throttled
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        host = urlsplit(request.url).hostname or ""
+        method = (request.method or "GET").upper()
+
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire(host, method)
+            response = self._send_once(request, host, **kwargs)
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            retrying = (
+                attempt < self.max_retries_throttled
+                and _should_retry(method, response.status_code, retry_after)
+            )
+            if self.limiter is not None:
+                self.limiter.record_response(host, response.status_code, retrying)
+            if not retrying:
+                return response
+
+            delay = retry_delay(attempt, retry_after)
+            logger.debug(
+                f"{method} {host} returned {response.status_code}, "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries_throttled})"
+            )
+            response.close()
+            if self.limiter is not None:
+                # Pause the whole host so concurrent workers back off too
+                self.limiter.pause(host, delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def _send_once(self, request: requests.PreparedRequest, host: str, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.stats.record(host, time.perf_counter() - start, error=True)
+            raise
+
+        if kwargs.get("stream"):
+            # Don't consume streamed bodies; trust the declared length
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            size = len(response.content or b"")
+
+        self.stats.record(
+            host,
+            time.perf_counter() - start,
+            bytes_received=size,
+            error=response.status_code >= 500,
+        )
+        return response
+
+
+def _should_retry(method: str, status_code: int, retry_after: Optional[float]) -> bool:
+    if status_code in _RETRY_ALWAYS:
+        return True
+    if status_code in _RETRY_READS:
+        return method not in WRITE_METHODS or (status_code == 503 and retry_after is not None)
+    return False
+
+
+class HttpTransport:
+    """Pooled keep-alive sessions per upstream host.
+
+    Usage:
+        transport = get_transport()
+        resp = transport.get("https://api.trakt.tv/search", params=..., headers=...)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_sizes: Optional[Dict[str, int]] = None,
+        timeout: Any = DEFAULT_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        """Initialize transport.
+
+        Args:
+            pool_connections: Number of connection pools to cache per session
+            pool_maxsize: Max keep-alive connections per host (default)
+            pool_sizes: Per-host overrides of pool_maxsize, e.g. {"api.viki.io": 16}
+            timeout: Default (connect, read) timeout when a call doesn't pass one
+            rate_limiter: Per-host limiter (default: RateLimiter with DEFAULT_RATE_LIMITS)
+            max_retries: Retries for throttled (429) / transient responses
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_sizes = dict(pool_sizes or {})
+        self.timeout = timeout
+        self.limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.stats = TransportStats()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _make_adapter(self, host: str) -> InstrumentedAdapter:
+        maxsize = self.pool_sizes.get(host, self.pool_maxsize)
+        return InstrumentedAdapter(
+            self.stats,
+            limiter=self.limiter,
+            max_retries_throttled=self.max_retries,
+            pool_connections=self.pool_connections,
+            pool_maxsize=maxsize,
+        )
+
+    def instrument(self, session: requests.Session, host: str = "") -> requests.Session:
+        """Mount a pooled, instrumented adapter on an externally owned session.
+
+        Used for the requests-cache sessions so their network traffic is
+        pooled and counted like everything else.
+
+        Args:
+            session: Session to configure
+            host: Host the session mainly talks to (selects pool size)
+
+        Returns:
+            The same session
+        """
+        adapter = self._make_adapter(host)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def session(self, host: str) -> requests.Session:
+        """Get (or create) the pooled session for a host."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self.instrument(requests.Session(), host)
+                self._sessions[host] = session
+                logger.debug(f"Created pooled session for {host}")
+            return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the host's pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to requests.Session.request (timeout defaults
+                      to the transport's timeout)
+
+        Returns:
+            Response object
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname or ""
+        return self.session(host).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET through the pooled session."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST through the pooled session."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Global transport instance
+_transport: Optional[HttpTransport] = None
+
+
+def get_transport() -> HttpTransport:
+    """Get global HTTP transport.
+
+    Returns:
+        Shared HttpTransport
+    """
+    global _transport
+
+    if _transport is None:
+        _transport = HttpTransport()
+
+    return _transport
+
+
+def configure_transport(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_sizes: Optional[Dict[str, int]] = None,
+    rate_limits: Optional[Dict[str, Dict[str, float]]] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> HttpTransport:
+    """Replace the global transport with one using the given settings.
+
+    Call before creating clients (e.g. from the [http] config section).
+
+    Args:
+        pool_connections: Number of connection pools to cache per session
+        pool_maxsize: Max keep-alive connections per host (default)
+        pool_sizes: Per-host overrides of pool_maxsize
+        rate_limits: Per-host overrides of DEFAULT_RATE_LIMITS, e.g.
+                     {"api.viki.io": {"read_per_second": 4, "write_per_second": 1}}
+        max_retries: Retries for throttled (429) / transient responses
+
+    Returns:
+        The new global HttpTransport
+    """
+    global _transport
+
+    if _transport is not None:
+        _transport.close()
+    limits = dict(DEFAULT_RATE_LIMITS)
+    for host, limit in (rate_limits or {}).items():
+        limits[host] = RateLimit(**limit)
+    _transport = HttpTransport(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_sizes=pool_sizes,
+        rate_limiter=RateLimiter(limits),
+        max_retries=max_retries,
+    )
+    return _transport
+
+
+__all__ = [
+    "HttpTransport",
+    "InstrumentedAdapter",
+    "HostStats",
+    "TransportStats",
+    "get_transport",
+    "configure_transport",
+]
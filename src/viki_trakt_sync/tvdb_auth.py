@@ -0,0 +1,237 @@
+"""TVDB v4 bearer-token management.
+
+TVDB v4 wants ``Authorization: Bearer <jwt>`` on every call, and the JWT
+from ``POST /v4/login`` is valid for about a month. TvdbAuth:
+
+  - reuses one token until shortly before its ``exp`` claim
+  - logs in at most once when many threads need a token at the same time
+    (double-checked under a lock)
+  - persists the token to ~/.config/viki-trakt-sync/tvdb_token.json, so
+    later runs skip the login entirely
+  - drops the token and logs in again once when TVDB answers 401
+
+Tokens are stored with a hash of the API key that minted them, so
+changing the key in settings.toml never reuses a stale token.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .transport import get_transport
+
+logger = logging.getLogger(__name__)
+
+TVDB_LOGIN_URL = "https://api4.thetvdb.com/v4/login"
+
+# Refresh this long before the token's exp claim
+DEFAULT_REFRESH_MARGIN = 6 * 3600.0
+
+# Assumed lifetime when the token carries no readable exp claim
+DEFAULT_TOKEN_LIFETIME = 28 * 24 * 3600.0
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the exp claim (epoch seconds) from a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _bearer(token: Optional[str]) -> Dict[str, str]:
+    if not token:
+        return {}
+    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class TvdbAuth:
+    """Cached, thread-safe TVDB bearer token.
+
+    Usage:
+        auth = get_tvdb_auth(api_key)
+        response = auth.get(get_tvdb_session(), "https://api4.thetvdb.com/v4/search", params=...)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        token_path: Optional[Path] = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize token manager.
+
+        Args:
+            api_key: TVDB v4 API key
+            token_path: Where to persist the token
+                        (default: ~/.config/viki-trakt-sync/tvdb_token.json)
+            refresh_margin: Seconds before expiry at which to log in again
+            clock: Wall clock in epoch seconds (injectable for tests)
+        """
+        if token_path is None:
+            token_path = Path.home() / ".config" / "viki-trakt-sync" / "tvdb_token.json"
+
+        self.api_key = api_key
+        self.token_path = token_path
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.logins = 0
+
+    def _valid(self) -> bool:
+        return self._token is not None and self._clock() < self._expires_at - self.refresh_margin
+
+    def token(self) -> Optional[str]:
+        """Get a valid bearer token, logging in if needed.
+
+        Returns:
+            JWT string, or None if login failed
+        """
+        if self._valid():
+            return self._token
+
+        with self._lock:
+            if self._valid():
+                return self._token
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+                if self._valid():
+                    return self._token
+            self._login()
+            return self._token if self._valid() else None
+
+    def headers(self) -> Dict[str, str]:
+        """Authorization headers for a TVDB request (empty if login failed)."""
+        return _bearer(self.token())
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """Forget the current token (e.g. after a 401).
+
+        Args:
+            token: Only drop it if it is still this token, so concurrent
+                   401s for the same token trigger a single re-login
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+    def get(self, session: Any, url: str, **kwargs: Any) -> Any:
+        """Authorized GET through a (cached) session, retrying once on 401.
+
+        Args:
+            session: Object with get(url, **kwargs), e.g. get_tvdb_session()
+            url: TVDB URL
+            **kwargs: Passed to session.get (headers are merged)
+
+        Returns:
+            Response object
+        """
+        extra = kwargs.pop("headers", None) or {}
+        token = self.token()
+        response = session.get(url, headers={**_bearer(token), **extra}, **kwargs)
+        if getattr(response, "status_code", None) == 401 and token:
+            logger.debug("TVDB rejected cached token; logging in again")
+            self.invalidate(token)
+            response = session.get(url, headers={**self.headers(), **extra}, **kwargs)
+        return response
+
+    def _login(self) -> None:
+        """POST /v4/login and store the new token. Caller holds the lock."""
+        self.logins += 1
+        try:
+            response = get_transport().post(TVDB_LOGIN_URL, json={"apikey": self.api_key}, timeout=15)
+        except Exception as e:
+            logger.warning(f"TVDB login failed: {e}")
+            return
+        if response.status_code != 200:
+            logger.warning(f"TVDB login failed: HTTP {response.status_code}")
+            return
+        token = (response.json().get("data") or {}).get("token")
+        if not token:
+            logger.warning("TVDB login returned no token")
+            return
+
+        self._token = token
+        self._expires_at = _token_expiry(token) or self._clock() + DEFAULT_TOKEN_LIFETIME
+        logger.debug("Obtained new TVDB token")
+        self._save()
+
+    def _load(self) -> None:
+        """Load a persisted token minted with the same API key."""
+        try:
+            data = json.loads(self.token_path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("key") != _key_hash(self.api_key):
+            return
+        token = data.get("token")
+        if isinstance(token, str) and token:
+            self._token = token
+            self._expires_at = float(data.get("expires_at") or 0.0)
+
+    def _save(self) -> None:
+        """Persist the current token (owner-only permissions)."""
+        data = {"key": _key_hash(self.api_key), "token": self._token, "expires_at": self._expires_at}
+        try:
+            self.token_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.token_path.with_suffix(".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.token_path)
+        except OSError as e:
+            logger.debug(f"Could not persist TVDB token: {e}")
+
+
+# Shared managers, one per API key
+_auths: Dict[str, TvdbAuth] = {}
+_auths_lock = threading.Lock()
+
+
+def get_tvdb_auth(api_key: Optional[str] = None) -> Optional[TvdbAuth]:
+    """Get the shared token manager for an API key.
+
+    Args:
+        api_key: TVDB API key (default: TVDB_API_KEY env var)
+
+    Returns:
+        TvdbAuth, or None if no API key is available
+    """
+    api_key = api_key or os.getenv("TVDB_API_KEY")
+    if not api_key:
+        return None
+    with _auths_lock:
+        auth = _auths.get(api_key)
+        if auth is None:
+            auth = TvdbAuth(api_key)
+            _auths[api_key] = auth
+        return auth
+
+
+__all__ = [
+    "DEFAULT_REFRESH_MARGIN",
+    "TVDB_LOGIN_URL",
+    "TvdbAuth",
+    "get_tvdb_auth",
+]
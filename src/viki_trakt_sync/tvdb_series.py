@@ -0,0 +1,294 @@
+"""Local store of TVDB series details (name, year, aliases).
+
+The matcher's alias tiers and MetadataAdapter look at /v4/series/{id} for
+many search candidates, and the same candidates come back for many shows.
+TvdbSeriesStore keeps each series in SQLite
+(~/.config/viki-trakt-sync/tvdb_series.db) for a long TTL and fetches
+missing or stale ones concurrently:
+
+    store = TvdbSeriesStore()
+    details = store.get_many([81189, 305288], auth=get_tvdb_auth())
+
+A series requested by several threads at once is fetched only once.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .tvdb_auth import TvdbAuth
+
+logger = logging.getLogger(__name__)
+
+TVDB_SERIES_URL = "https://api4.thetvdb.com/v4/series/{}"
+
+# Names and aliases of a series rarely change once it has aired
+DEFAULT_SERIES_TTL = timedelta(days=30)
+
+# Concurrent /series requests per store
+DEFAULT_SERIES_WORKERS = 8
+
+
+@dataclass
+class TvdbSeries:
+    """The parts of a TVDB series record the matcher uses."""
+    tvdb_id: int
+    name: Optional[str] = None
+    year: Optional[int] = None
+    aliases: List[Dict[str, str]] = field(default_factory=list)  # [{"language": "eng", "name": ...}]
+    fetched_at: Optional[datetime] = None
+
+    @classmethod
+    def from_api(cls, tvdb_id: int, data: Dict[str, Any]) -> "TvdbSeries":
+        """Build from the "data" object of a /v4/series/{id} response."""
+        year = data.get("year") or (data.get("firstAired") or "")[:4]
+        return cls(
+            tvdb_id=int(tvdb_id),
+            name=data.get("name"),
+            year=int(year) if str(year).isdigit() else None,
+            aliases=[
+                {"language": a.get("language") or "", "name": a["name"]}
+                for a in data.get("aliases") or []
+                if isinstance(a, dict) and a.get("name")
+            ],
+            fetched_at=datetime.now(timezone.utc),
+        )
+
+    def alias_names(self, language: Optional[str] = None) -> List[str]:
+        """Alias names, optionally only those in one language (e.g. "eng")."""
+        return [a["name"] for a in self.aliases if language is None or a.get("language") == language]
+
+    def titles(self, language: Optional[str] = "eng") -> List[str]:
+        """Primary name followed by aliases in the given language."""
+        return [t for t in [self.name, *self.alias_names(language)] if t]
+
+
+class TvdbSeriesStore:
+    """Cached, concurrently fetched TVDB series details keyed by TVDB id.
+
+    Safe to share between threads (matcher tiers, parallel matches, the
+    metadata adapter).
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        auth: Optional["TvdbAuth"] = None,
+        session: Any = None,
+        ttl: timedelta = DEFAULT_SERIES_TTL,
+        max_workers: int = DEFAULT_SERIES_WORKERS,
+    ):
+        """Initialize store.
+
+        Args:
+            db_path: Path to SQLite database (default: ~/.config/viki-trakt-sync/tvdb_series.db)
+            auth: TVDB token manager (default: shared one for TVDB_API_KEY)
+            session: HTTP session for TVDB (default: cached TVDB session)
+            ttl: Refetch series stored longer ago than this
+            max_workers: Concurrent /series requests
+        """
+        if db_path is None:
+            db_path = Path.home() / ".config" / "viki-trakt-sync" / "tvdb_series.db"
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._auth = auth
+        self._session = session
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._series: Dict[int, TvdbSeries] = {}
+        self._inflight: Dict[int, Future] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tvdb_series (
+                    tvdb_id INTEGER PRIMARY KEY,
+                    name TEXT,
+                    year INTEGER,
+                    aliases TEXT,
+                    fetched_at TEXT
+                )
+                """
+            )
+
+    @property
+    def session(self):
+        """Lazy-load TVDB session."""
+        if self._session is None:
+            from .http_cache import get_tvdb_session
+            self._session = get_tvdb_session()
+        return self._session
+
+    def close(self) -> None:
+        """Stop fetch workers and close the database connection."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            self._conn.close()
+
+    def get(self, tvdb_id: int, auth: Optional["TvdbAuth"] = None) -> Optional[TvdbSeries]:
+        """Get one series, fetching it if missing or stale.
+
+        Returns:
+            TvdbSeries, or None if TVDB has no such series (or is unreachable)
+        """
+        return self.get_many([tvdb_id], auth=auth).get(int(tvdb_id))
+
+    def get_many(
+        self, tvdb_ids: Iterable[Any], auth: Optional["TvdbAuth"] = None
+    ) -> Dict[int, TvdbSeries]:
+        """Get several series, fetching missing or stale ones concurrently.
+
+        Args:
+            tvdb_ids: TVDB series ids (falsy or non-numeric ids are skipped)
+            auth: Token manager for fetches (default: the store's)
+
+        Returns:
+            Dict of tvdb_id -> TvdbSeries for every series found
+        """
+        ids = list(dict.fromkeys(int(i) for i in tvdb_ids if str(i or "").isdigit() and int(i)))
+        found = self._cached(ids)
+        missing = [i for i in ids if i not in found]
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(missing)
+        if not missing:
+            return found
+
+        auth = auth or self._resolve_auth()
+        futures = {tvdb_id: self._submit(tvdb_id, auth) for tvdb_id in missing}
+        for tvdb_id, future in futures.items():
+            try:
+                series = future.result()
+            except Exception as e:
+                logger.debug(f"TVDB series {tvdb_id} fetch failed: {e}")
+                continue
+            if series is not None:
+                found[tvdb_id] = series
+        return {i: found[i] for i in ids if i in found}
+
+    def _cached(self, ids: List[int]) -> Dict[int, TvdbSeries]:
+        """Fresh series from memory, then from the database."""
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        with self._lock:
+            found = {i: self._series[i] for i in ids if i in self._series}
+            unknown = [i for i in ids if i not in found]
+            for start in range(0, len(unknown), 500):
+                batch = unknown[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT tvdb_id, name, year, aliases, fetched_at FROM tvdb_series "
+                    f"WHERE tvdb_id IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for tvdb_id, name, year, aliases, fetched_at in rows:
+                    series = TvdbSeries(
+                        tvdb_id=tvdb_id,
+                        name=name,
+                        year=year,
+                        aliases=json.loads(aliases) if aliases else [],
+                        fetched_at=datetime.fromisoformat(fetched_at) if fetched_at else None,
+                    )
+                    self._series[tvdb_id] = series
+                    found[tvdb_id] = series
+        return {
+            i: s for i, s in found.items()
+            if s.fetched_at is not None and s.fetched_at >= cutoff
+        }
+
+    def _submit(self, tvdb_id: int, auth: Optional["TvdbAuth"]) -> Future:
+        """Start (or join) the fetch of one series."""
+        with self._lock:
+            future = self._inflight.get(tvdb_id)
+            if future is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tvdb-series")
+                future = self._pool.submit(self._fetch, tvdb_id, auth)
+                self._inflight[tvdb_id] = future
+                future.add_done_callback(lambda _f, i=tvdb_id: self._forget(i))
+            return future
+
+    def _forget(self, tvdb_id: int) -> None:
+        with self._lock:
+            self._inflight.pop(tvdb_id, None)
+
+    def _fetch(self, tvdb_id: int, auth: Optional["TvdbAuth"]) -> Optional[TvdbSeries]:
+        """Fetch one series from TVDB and store it."""
+        url = TVDB_SERIES_URL.format(tvdb_id)
+        response = auth.get(self.session, url, timeout=10) if auth else self.session.get(url, timeout=10)
+        if response.status_code != 200:
+            return None
+        data = (response.json() or {}).get("data") or {}
+        if not data:
+            return None
+        series = TvdbSeries.from_api(tvdb_id, data)
+        self.put(series)
+        return series
+
+    def put(self, series: TvdbSeries) -> None:
+        """Store a series (e.g. one fetched elsewhere)."""
+        if series.fetched_at is None:
+            series.fetched_at = datetime.now(timezone.utc)
+        with self._lock:
+            self._series[series.tvdb_id] = series
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tvdb_series (tvdb_id, name, year, aliases, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        series.tvdb_id,
+                        series.name,
+                        series.year,
+                        json.dumps(series.aliases),
+                        series.fetched_at.isoformat(),
+                    ),
+                )
+
+    def _resolve_auth(self) -> Optional["TvdbAuth"]:
+        if self._auth is None:
+            from .tvdb_auth import get_tvdb_auth
+            self._auth = get_tvdb_auth()
+        return self._auth
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses and hit_rate (0.0-1.0)
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+__all__ = [
+    "DEFAULT_SERIES_TTL",
+    "DEFAULT_SERIES_WORKERS",
+    "TVDB_SERIES_URL",
+    "TvdbSeries",
+    "TvdbSeriesStore",
+]
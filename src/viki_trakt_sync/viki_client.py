@@ -4,14 +4,18 @@ Built from working test.py code - uses exact same request structure.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-
-import requests
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from .http_cache import CachedSession, get_viki_session
 from .http_utils import API_TIMEOUT
+from .json_stream import iter_object_items
+from .transport import HttpTransport, get_transport
 
 logger = logging.getLogger(__name__)
 
+# Read size for streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # Initialize user agent once per process with fallback
 # Constrained to Chrome/macOS for consistency and modern browser support
 _USER_AGENT: str = ""
@@ -45,17 +49,29 @@ class VikiClient:
         'x-viki-device-id': '276378550d',
     }
 
-    def __init__(self, cookies: Dict[str, str], token: Optional[str] = None, user_id: Optional[str] = None):
+    def __init__(
+        self,
+        cookies: Dict[str, str],
+        token: Optional[str] = None,
+        user_id: Optional[str] = None,
+        transport: Optional[HttpTransport] = None,
+        http_cache: Optional[CachedSession] = None,
+    ):
         """Initialize Viki client.
         
         Args:
             cookies: Dict of cookies (exactly like test.py uses)
             token: API token (optional, for other endpoints)
             user_id: User ID (optional)
+            transport: Pooled HTTP transport (default: shared global transport)
+            http_cache: Revalidating cache for container/episode/video lookups
+                        (default: shared Viki cached session)
         """
         self.cookies = cookies
         self.token = token
         self.user_id = user_id
+        self._transport = transport
+        self._http_cache = http_cache
         
         # Create request headers with persistent user agent
         self.headers = self.HEADERS.copy()
@@ -67,6 +83,16 @@ class VikiClient:
         if missing:
             raise ValueError(f"Missing required cookies: {missing}")
 
+    @property
+    def transport(self) -> HttpTransport:
+        """HTTP transport used for all requests."""
+        return self._transport or get_transport()
+
+    @property
+    def http_cache(self) -> CachedSession:
+        """Conditional-GET cache for public v4 catalogue endpoints."""
+        return self._http_cache or get_viki_session()
+
     def get_watch_history(self, from_timestamp: int = 0) -> Dict[str, Any]:
         """Get user's watch history.
         
@@ -83,7 +109,7 @@ class VikiClient:
         logger.debug(f"Calling watch_markers with {len(self.cookies)} cookies")
         
         # Exact same call pattern as test.py
-        response = requests.get(
+        response = self.transport.get(
             'https://www.viki.com/api/vw_watch_markers',
             params=params,
             cookies=self.cookies,
@@ -112,12 +138,46 @@ class VikiClient:
         """
         return self.get_watch_history(from_timestamp=from_timestamp)
 
+    def iter_watch_markers(self, from_timestamp: int = 1) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream watch markers one container at a time.
+        
+        Same request as get_watch_markers(), but the body is parsed
+        incrementally, so memory stays bounded on full-history pulls.
+        
+        Args:
+            from_timestamp: Unix timestamp to fetch markers from (default: 1 for all)
+            
+        Yields:
+            (container_id, {video_id: marker}) tuples, in response order
+        """
+        params = {'from': str(from_timestamp)}
+        
+        response = self.transport.get(
+            'https://www.viki.com/api/vw_watch_markers',
+            params=params,
+            cookies=self.cookies,
+            headers=self.headers,
+            timeout=API_TIMEOUT,
+            stream=True,
+        )
+        
+        with response:
+            if response.status_code != 200:
+                logger.error(f"API error (HTTP {response.status_code}): {response.text[:300]}")
+                raise ValueError(f"API request failed with status {response.status_code}: {response.text[:100]}")
+            
+            # JSON is always UTF-8 (RFC 8259), whatever the Content-Type says
+            yield from iter_object_items(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                "markers",
+            )
+
     def get_container(self, container_id: str) -> Dict[str, Any]:
         """Get container (show) details."""
         url = f"https://api.viki.io/v4/containers/{container_id}.json"
         params = {"app": "100000a"}
         
-        response = requests.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
+        response = self.http_cache.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -131,7 +191,7 @@ class VikiClient:
             "direction": "asc",
         }
         
-        response = requests.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
+        response = self.http_cache.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -140,7 +200,7 @@ class VikiClient:
         url = f"https://api.viki.io/v4/videos/{video_id}.json"
         params = {"app": "100000a"}
         
-        response = requests.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
+        response = self.http_cache.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -156,6 +216,6 @@ class VikiClient:
             "per_page": per_page,
         }
         
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self.transport.get(url, params=params, headers=self.headers, timeout=API_TIMEOUT)
         response.raise_for_status()
         return response.json()
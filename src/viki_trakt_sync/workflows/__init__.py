@@ -5,5 +5,6 @@ that coordinate multiple adapters and repository operations.
 """
 
 from .sync import SyncWorkflow
+from .async_sync import AsyncSyncWorkflow
 
-__all__ = ['SyncWorkflow']
+__all__ = ['SyncWorkflow', 'AsyncSyncWorkflow']
@@ -0,0 +1,408 @@
+"""Async Sync Workflow - asyncio engine for the Viki → Trakt sync.
+
+Same contract as SyncWorkflow (SyncResult, dry-run semantics), but the
+stages overlap instead of running strictly in sequence:
+
+  1. Fetch watch markers (ONE global call, as before)
+  2. Per show, concurrently: container fetch + episode enrichment
+  3. As soon as a show is stored, match it (if unmatched)
+  4. As soon as a matched show has unsynced episodes, queue them for
+     the Trakt pusher, which batches whatever is ready into one POST
+
+All repository writes happen on the event loop thread, so the database
+only ever sees a single writer. Network calls run on worker threads via
+the async adapters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..adapters import VikiAdapter, TraktAdapter, MetadataAdapter
+from ..adapters.trakt import DEFAULT_HISTORY_CHUNK_SIZE, DEFAULT_PUSH_CONCURRENCY
+from ..adapters.aio import AsyncMetadataAdapter, AsyncTraktAdapter, AsyncVikiAdapter
+from ..cache import ContainerMetadataCache, TraktSeasonMapCache, TraktWatchedIndex
+from ..repository import Repository
+from ..models import SyncLog
+from .sync import DEFAULT_MATCH_CONCURRENCY, DEFAULT_MATCH_TIMEOUT, SyncResult, SyncWorkflow
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel: push every remaining unsynced episode, then stop
+_PUSH_REMAINING = None
+
+
+async def _no_fetch() -> None:
+    """Placeholder for a skipped fetch (cached container metadata)."""
+    return None
+
+
+class AsyncSyncWorkflow(SyncWorkflow):
+    """Asyncio variant of SyncWorkflow with overlapping stages.
+
+    Takes the same (blocking) adapters as SyncWorkflow and wraps them in
+    their async variants for the duration of each run.
+    """
+
+    def __init__(
+        self,
+        viki: VikiAdapter,
+        trakt: TraktAdapter,
+        metadata: Optional[MetadataAdapter] = None,
+        repository: Optional[Repository] = None,
+        matcher: Optional[Callable] = None,
+        container_cache: Optional[ContainerMetadataCache] = None,
+        push_chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+        push_concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+        watched_index: Optional[TraktWatchedIndex] = None,
+        season_map: Optional[TraktSeasonMapCache] = None,
+        match_concurrency: int = DEFAULT_MATCH_CONCURRENCY,
+        match_timeout: float = DEFAULT_MATCH_TIMEOUT,
+    ):
+        """Initialize workflow (see SyncWorkflow)."""
+        super().__init__(
+            viki=viki,
+            trakt=trakt,
+            metadata=metadata,
+            repository=repository,
+            matcher=matcher,
+            container_cache=container_cache,
+            push_chunk_size=push_chunk_size,
+            push_concurrency=push_concurrency,
+            watched_index=watched_index,
+            season_map=season_map,
+            match_concurrency=match_concurrency,
+            match_timeout=match_timeout,
+        )
+
+    def run(
+        self,
+        force_refresh: bool = False,
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> SyncResult:
+        """Execute the full sync workflow on a fresh event loop.
+
+        Args:
+            force_refresh: Force refresh all shows (ignore billboard hash and episode cache)
+            dry_run: Preview only, don't sync to Trakt
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            SyncResult with operation counts
+        """
+        return asyncio.run(
+            self.run_async(
+                force_refresh=force_refresh,
+                dry_run=dry_run,
+                progress_callback=progress_callback,
+            )
+        )
+
+    async def run_async(
+        self,
+        force_refresh: bool = False,
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> SyncResult:
+        """Execute the full sync workflow (WATCH-STATUS-FIRST), overlapped.
+
+        Args:
+            force_refresh: Force refresh all shows (ignore billboard hash and episode cache)
+            dry_run: Preview only, don't sync to Trakt
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            SyncResult with operation counts
+        """
+        result = SyncResult()
+
+        def log_progress(msg: str):
+            logger.info(msg)
+            if progress_callback:
+                progress_callback(msg)
+
+        viki = AsyncVikiAdapter(self.viki)
+        trakt = AsyncTraktAdapter(self.trakt)
+        metadata = AsyncMetadataAdapter(self.metadata, max_concurrency=self.match_concurrency)
+        try:
+            return await self._run_stages(
+                viki, trakt, metadata, result, log_progress, force_refresh, dry_run
+            )
+        finally:
+            # Abandoned (timed-out) matches finish in the background
+            metadata.close()
+
+    async def _run_stages(
+        self,
+        viki: AsyncVikiAdapter,
+        trakt: AsyncTraktAdapter,
+        metadata: AsyncMetadataAdapter,
+        result: SyncResult,
+        log_progress: Callable[[str], None],
+        force_refresh: bool,
+        dry_run: bool,
+    ) -> SyncResult:
+        """Steps 1-5 of run_async on the given async adapters."""
+        # STEP 1 (PRIMARY): Fetch watch markers - SOURCE OF TRUTH
+        log_progress("Fetching watch status from Viki...")
+        try:
+            from_timestamp = self.repo.get_last_watch_markers_timestamp()
+            if from_timestamp == 1:
+                log_progress("First sync - fetching all watch history from beginning (from=1)")
+            else:
+                log_progress(f"Incremental sync from timestamp {from_timestamp}")
+
+            # Capture timestamp BEFORE fetch to ensure we don't miss updates
+            current_timestamp = int(time.time())
+            markers = await viki.get_watch_markers(from_timestamp=from_timestamp)
+
+            if not markers:
+                log_progress("No new watch history found")
+                self.repo.set_last_watch_markers_timestamp(current_timestamp)
+                return result
+
+            result.shows_fetched = len(markers)
+            total_episodes = sum(len(videos) for videos in markers.values())
+            log_progress(f"Found watch status for {result.shows_fetched} shows, {total_episodes} episodes")
+
+            self.repo.set_last_watch_markers_timestamp(current_timestamp)
+
+        except Exception as e:
+            result.errors.append(f"Failed to fetch watch status: {e}")
+            logger.error(result.errors[-1])
+            return result
+
+        # Trakt pusher runs alongside the per-show pipelines
+        push_queue: asyncio.Queue = asyncio.Queue()
+        sync_session: Dict[str, Optional[SyncLog]] = {"log": None}
+        pusher = None
+        if not dry_run:
+            pusher = asyncio.create_task(
+                self._push_worker(trakt, push_queue, result, sync_session, log_progress, force_refresh)
+            )
+
+        # STEPS 2-4 per show, all shows concurrently (only stale containers hit Viki)
+        stale = set(self.container_cache.stale(list(markers), force_refresh=force_refresh))
+        processed: Set[str] = set()
+        await asyncio.gather(*(
+            self._process_show(
+                viki, metadata, trakt, viki_id, videos, result, push_queue, dry_run, processed,
+                force_refresh, fetch_container=viki_id in stale,
+            )
+            for viki_id, videos in markers.items()
+        ))
+        log_progress(f"Processed {result.episodes_fetched} episodes with watch status")
+
+        # Match any other unmatched shows left over from earlier runs
+        leftovers = [s for s in self.repo.get_unmatched_shows() if s.viki_id not in processed]
+        if leftovers:
+            log_progress(f"Matching {len(leftovers)} unmatched shows...")
+            await asyncio.gather(*(self._match_show(metadata, trakt, show, result) for show in leftovers))
+
+        # STEP 5: Flush remaining unsynced episodes to Trakt
+        if pusher is not None:
+            await push_queue.put(_PUSH_REMAINING)
+            await pusher
+
+            sync_log = sync_session["log"]
+            if sync_log is None:
+                log_progress("All episodes already synced")
+            else:
+                sync_log.episodes_synced = result.episodes_synced
+                sync_log.status = "success" if result.episodes_synced or result.episodes_skipped else "failed"
+                sync_log.save()
+        else:
+            unsynced = self.repo.get_unsynced_episodes()
+            log_progress(f"[DRY RUN] Would sync {len(unsynced)} episodes")
+
+        log_progress("Sync complete!")
+        return result
+
+    async def _process_show(
+        self,
+        viki: AsyncVikiAdapter,
+        metadata: AsyncMetadataAdapter,
+        trakt: AsyncTraktAdapter,
+        viki_id: str,
+        videos: Dict[str, Any],
+        result: SyncResult,
+        push_queue: asyncio.Queue,
+        dry_run: bool,
+        processed: Set[str],
+        force_refresh: bool = False,
+        fetch_container: bool = True,
+    ) -> None:
+        """Fetch, store, match and queue one show."""
+        container_res, episodes_res = await asyncio.gather(
+            viki.get_container(viki_id) if fetch_container else _no_fetch(),
+            viki.get_episodes(viki_id, video_ids=list(videos), force_refresh=force_refresh),
+            return_exceptions=True,
+        )
+
+        if isinstance(episodes_res, BaseException):
+            logger.error(f"Failed to fetch episodes for {viki_id}: {episodes_res}")
+            result.errors.append(f"Episode fetch failed for {viki_id}: {episodes_res}")
+            episodes_res = []
+
+        try:
+            if isinstance(container_res, BaseException):
+                raise container_res
+            if fetch_container:
+                self._store_container(viki_id, container_res)
+        except Exception as e:
+            logger.warning(f"Could not fetch container {viki_id}: {e}")
+            result.errors.append(f"Container fetch failed for {viki_id}: {e}")
+            if self.repo.get_show(viki_id) is None:
+                return
+
+        result.episodes_fetched += self._upsert_watch_status(
+            viki_id, viki.merge_markers(videos, episodes_res)
+        )
+        processed.add(viki_id)
+
+        show = self.repo.get_show(viki_id)
+        if show.trakt_id is None or show.match_source == "NONE":
+            matched = await self._match_show(metadata, trakt, show, result)
+            if not matched:
+                return
+
+        if not dry_run:
+            await push_queue.put(viki_id)
+
+    async def _match_show(
+        self, metadata: AsyncMetadataAdapter, trakt: AsyncTraktAdapter, show, result: SyncResult
+    ) -> bool:
+        """Match one show, persisting the outcome on the loop thread."""
+        result.matches_attempted += 1
+
+        if self.matcher is None:
+            # Trakt search on a worker thread; only the save runs on the loop
+            try:
+                found = await trakt.search(show.title or "")
+            except Exception as e:
+                logger.error(f"Match failed for {show.viki_id}: {e}")
+                return False
+            matched = self._apply_search_results(show, found)
+        else:
+            try:
+                # The timeout starts once a match slot is free, as in SyncWorkflow
+                match_result = await metadata.match(
+                    self.matcher, self._matcher_input(show), timeout=self.match_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Match timed out for {show.viki_id} after {self.match_timeout:.0f}s")
+                result.errors.append(f"Match timed out for {show.viki_id}")
+                return False
+            except Exception as e:
+                logger.error(f"Match failed for {show.viki_id}: {e}")
+                return False
+            matched = self._apply_match(show, match_result)
+
+        if matched:
+            result.matches_found += 1
+        return matched
+
+    async def _refresh_watched_index_async(self, trakt: AsyncTraktAdapter) -> None:
+        """Refresh the Trakt watched index; requests on a worker, writes on the loop."""
+        index = self.watched_index
+        if index is None:
+            return
+        try:
+            activities = await trakt.get_last_activities()
+            if isinstance(activities, dict) and not index.is_current(activities):
+                index.rebuild(await trakt.get_watched_shows(), activities)
+        except Exception as e:
+            logger.warning(f"Could not refresh Trakt watched index: {e}")
+
+    async def _prepare_season_map_async(
+        self,
+        trakt: AsyncTraktAdapter,
+        episodes: List,
+        force_refresh: bool = False,
+    ) -> None:
+        """Fetch stale Trakt season maps concurrently; store them on the loop."""
+        if self.season_map is None:
+            return
+        try:
+            stale = self.season_map.stale(self._show_trakt_ids(episodes), force_refresh=force_refresh)
+            seasons = await asyncio.gather(*(trakt.get_seasons(trakt_id) for trakt_id in stale))
+            for trakt_id, show_seasons in zip(stale, seasons):
+                self.season_map.store(trakt_id, show_seasons)
+        except Exception as e:
+            logger.warning(f"Could not prepare Trakt season maps: {e}")
+
+    async def _push_worker(
+        self,
+        trakt: AsyncTraktAdapter,
+        push_queue: asyncio.Queue,
+        result: SyncResult,
+        sync_session: Dict[str, Optional[SyncLog]],
+        log_progress: Callable[[str], None],
+        force_refresh: bool = False,
+    ) -> None:
+        """Push queued shows' unsynced episodes to Trakt in batches.
+
+        Drains whatever is queued into one batch, so pushes overlap with
+        fetching/matching without one request per show. Each batch is split
+        into show-grouped chunks that are POSTed concurrently and accounted
+        for independently.
+        """
+        await self._refresh_watched_index_async(trakt)
+        attempted: Set[str] = set()
+        done = False
+        while not done:
+            viki_ids: List[str] = []
+            item = await push_queue.get()
+            while True:
+                if item is _PUSH_REMAINING:
+                    done = True
+                else:
+                    viki_ids.append(item)
+                if push_queue.empty():
+                    break
+                item = push_queue.get_nowait()
+
+            # Episodes already pushed this run are never resent in the final flush
+            unsynced = [
+                ep for ep in self.repo.get_unsynced_episodes(viki_ids=None if done else viki_ids)
+                if ep.viki_video_id not in attempted
+            ]
+            if not unsynced:
+                continue
+
+            if sync_session["log"] is None:
+                # Create sync session BEFORE syncing for undo capability
+                sync_session["log"] = self.repo.log_sync(
+                    operation="sync",
+                    shows_processed=result.shows_fetched,
+                    episodes_synced=len(unsynced),
+                    status="in_progress",
+                )
+            session_id = sync_session["log"].id
+            result.sync_session_id = session_id
+
+            log_progress(f"Syncing {len(unsynced)} episodes to Trakt (session #{session_id})...")
+            await self._prepare_season_map_async(trakt, unsynced, force_refresh)
+            chunks = self._chunk_for_push(unsynced, result)
+            if not chunks:
+                continue
+            attempted.update(ep.viki_video_id for ep in unsynced)
+            chunk_results = await asyncio.gather(
+                *(
+                    trakt.sync_watched([trakt_ep for _, trakt_ep in chunk], chunk_size=self.push_chunk_size)
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
+            )
+            for chunk, sync_result in zip(chunks, chunk_results):
+                if isinstance(sync_result, BaseException):
+                    logger.error(f"Trakt push failed for {len(chunk)} episodes: {sync_result}")
+                    result.errors.append(f"Trakt push failed: {sync_result}")
+                    continue
+                result.episodes_synced += self._apply_sync_result(
+                    chunk, sync_result, session_id=session_id, result=result
+                )
@@ -17,19 +17,40 @@ Implements the Command/Orchestrator pattern.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from typing import Callable, List, Optional
 
 from ..adapters import VikiAdapter, TraktAdapter, MetadataAdapter
-from ..adapters.viki import VikiBillboardItem, VikiEpisode
-from ..adapters.trakt import TraktEpisode
+from ..adapters.viki import DEFAULT_MAX_CONCURRENCY, VikiBillboardItem, VikiEpisode
+from ..adapters.trakt import (
+    DEFAULT_HISTORY_CHUNK_SIZE,
+    DEFAULT_PUSH_CONCURRENCY,
+    TraktEpisode,
+    chunk_by_show,
+    episode_key,
+)
+from ..cache import ContainerMetadataCache, TraktSeasonMapCache, TraktWatchedIndex
 from ..repository import Repository
 from ..models import Show
 
 logger = logging.getLogger(__name__)
 
+# Containers stored per batch when streaming watch markers
+STREAM_BATCH_SIZE = 50
+
+# Shows matched concurrently (each match can hit Trakt, TVDB and MDL)
+DEFAULT_MATCH_CONCURRENCY = 4
+# Seconds one show may spend matching before it is left for the next run
+DEFAULT_MATCH_TIMEOUT = 120.0
+
+# How often a queued match re-checks whether a worker can still pick it up
+_QUEUED_POLL_SECONDS = 0.5
+
 
 @dataclass
 class SyncResult:
@@ -40,6 +61,8 @@ class SyncResult:
     matches_attempted: int = 0
     matches_found: int = 0
     episodes_synced: int = 0
+    episodes_skipped: int = 0  # Already watched on Trakt, not pushed
+    episodes_rejected: int = 0  # Reported not_found by Trakt, parked
     sync_session_id: Optional[int] = None  # For undo capability
     errors: List[str] = None
     
@@ -65,6 +88,14 @@ class SyncWorkflow:
         metadata: Optional[MetadataAdapter] = None,
         repository: Optional[Repository] = None,
         matcher: Optional[Callable] = None,  # Optional matcher function
+        container_cache: Optional[ContainerMetadataCache] = None,
+        stream_markers: bool = False,
+        push_chunk_size: int = DEFAULT_HISTORY_CHUNK_SIZE,
+        push_concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+        watched_index: Optional[TraktWatchedIndex] = None,
+        season_map: Optional[TraktSeasonMapCache] = None,
+        match_concurrency: int = DEFAULT_MATCH_CONCURRENCY,
+        match_timeout: float = DEFAULT_MATCH_TIMEOUT,
     ):
         """Initialize workflow.
         
@@ -74,12 +105,31 @@ class SyncWorkflow:
             metadata: Metadata adapter (optional)
             repository: Data repository (default: new instance)
             matcher: Function to match shows (from matcher.py)
+            container_cache: Container metadata cache (default: backed by repository)
+            stream_markers: Parse watch markers incrementally and store them in
+                            batches (bounded memory on full-history pulls)
+            push_chunk_size: Max episodes per Trakt history POST
+            push_concurrency: Max concurrent Trakt history POSTs
+            watched_index: Index of episodes already watched on Trakt; those
+                           are marked synced without being pushed
+            season_map: Trakt season layouts used to map Viki's absolute
+                        episode numbers (default: everything is season 1)
+            match_concurrency: Max shows matched concurrently
+            match_timeout: Seconds before a running match is abandoned
         """
         self.viki = viki
         self.trakt = trakt
         self.metadata = metadata or MetadataAdapter()
         self.repo = repository or Repository()
         self.matcher = matcher
+        self.container_cache = container_cache or ContainerMetadataCache(self.repo)
+        self.stream_markers = stream_markers
+        self.push_chunk_size = max(1, int(push_chunk_size))
+        self.push_concurrency = max(1, int(push_concurrency))
+        self.watched_index = watched_index
+        self.season_map = season_map
+        self.match_concurrency = max(1, int(match_concurrency))
+        self.match_timeout = float(match_timeout)
     
     def run(
         self,
@@ -101,7 +151,7 @@ class SyncWorkflow:
         (matching, metadata, billboard) enables accurate watch syncing.
         
         Args:
-            force_refresh: Force refresh all shows (ignore billboard hash)
+            force_refresh: Force refresh all shows (ignore billboard hash and episode cache)
             dry_run: Preview only, don't sync to Trakt
             progress_callback: Optional callback for progress updates
             
@@ -118,92 +168,17 @@ class SyncWorkflow:
         # STEP 1 (PRIMARY): Fetch watch status - SOURCE OF TRUTH
         # Uses ?from=timestamp for incremental syncs (ONE global call)
         log_progress("Fetching watch status from Viki...")
-        try:
-            # Get last fetch timestamp for incremental sync
-            # IMPORTANT: Default to 1 (ALL HISTORY) on first sync, never start incremental
-            from_timestamp = self.repo.get_last_watch_markers_timestamp()
-            
-            # Force from=1 on first sync to ensure we get complete history
-            # This is critical - if we miss the initial sync, we're blind to old watches forever
-            is_first_sync = from_timestamp == 1
-            if is_first_sync:
-                log_progress("First sync - fetching all watch history from beginning (from=1)")
-            else:
-                log_progress(f"Incremental sync from timestamp {from_timestamp}")
-            
-            # Fetch watch status (ONE global call with ?from=timestamp)
-            watch_status, current_timestamp = self.viki.get_watch_status_with_metadata(
-                from_timestamp=from_timestamp
-            )
-            
-            if not watch_status:
-                log_progress("No new watch history found")
-                # Still update timestamp to avoid re-fetching
-                self.repo.set_last_watch_markers_timestamp(current_timestamp)
+        if self.stream_markers:
+            # STEPS 1-3 interleaved: markers are stored in batches as they stream in
+            if not self._stream_watch_status(force_refresh, result, log_progress):
+                return result
+        else:
+            watch_status = self._fetch_watch_status(force_refresh, result, log_progress)
+            if watch_status is None:
                 return result
             
-            result.shows_fetched = len(watch_status)
-            total_episodes = sum(len(videos) for videos in watch_status.values())
-            log_progress(f"Found watch status for {result.shows_fetched} shows, {total_episodes} episodes")
-            
-            # Save timestamp for next incremental sync
-            self.repo.set_last_watch_markers_timestamp(current_timestamp)
-            
-        except Exception as e:
-            result.errors.append(f"Failed to fetch watch status: {e}")
-            logger.error(result.errors[-1])
-            return result
-        
-        # STEP 2: Upsert shows from watch status
-        for viki_id, videos in watch_status.items():
-            # Get show info from billboard to get titles
-            try:
-                container = self.viki.get_container(viki_id)
-                if container:
-                    title = self._extract_title(container)
-                    show_type = container.get("type", "series")
-                    origin = container.get("origin", {})
-                    
-                    self.repo.upsert_show(
-                        viki_id=viki_id,
-                        title=title,
-                        type_=show_type,
-                        origin_country=origin.get("country"),
-                        origin_language=origin.get("language"),
-                    )
-                else:
-                    # Fallback if container fetch fails
-                    self.repo.upsert_show(
-                        viki_id=viki_id,
-                        title=f"Show {viki_id}",
-                        type_="series",
-                    )
-            except Exception as e:
-                logger.warning(f"Could not fetch container {viki_id}: {e}")
-                result.errors.append(f"Container fetch failed for {viki_id}: {e}")
-        
-        # STEP 3: Upsert episodes with watch status
-        for viki_id, videos in watch_status.items():
-            for video_id, watch_data in videos.items():
-                # Parse timestamp if available (ISO 8601 string from Viki API)
-                watched_at = None
-                if watch_data.get("timestamp"):
-                    try:
-                        watched_at = datetime.fromisoformat(watch_data["timestamp"].replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        # If parsing fails, fall back to None (will use default in repo)
-                        logger.debug(f"Could not parse timestamp for {video_id}: {watch_data.get('timestamp')}")
-                
-                self.repo.upsert_episode(
-                    viki_video_id=video_id,
-                    viki_id=viki_id,
-                    episode_number=watch_data["episode_number"],
-                    duration=watch_data["duration"],
-                    watched_seconds=watch_data["watched_seconds"],
-                    credits_marker=watch_data.get("credits_marker"),
-                    last_watched_at=watched_at,  # Use Viki marker timestamp
-                )
-                result.episodes_fetched += 1
+            # STEPS 2-3: Upsert shows and episodes from watch status
+            self._store_watch_status(watch_status, force_refresh, result, log_progress)
         
         log_progress(f"Processed {result.episodes_fetched} episodes with watch status")
         
@@ -211,10 +186,7 @@ class SyncWorkflow:
         unmatched = self.repo.get_unmatched_shows()
         if unmatched:
             log_progress(f"Matching {len(unmatched)} unmatched shows...")
-            for show in unmatched:
-                result.matches_attempted += 1
-                if self._try_match(show):
-                    result.matches_found += 1
+            self._match_shows(unmatched, result)
         
         # STEP 5: Sync watch status to Trakt
         if not dry_run:
@@ -229,12 +201,16 @@ class SyncWorkflow:
                 )
                 result.sync_session_id = sync_log.id
                 
+                self._refresh_watched_index()
+                self._prepare_season_map(unsynced, force_refresh=force_refresh)
                 log_progress(f"Syncing {len(unsynced)} episodes to Trakt (session #{sync_log.id})...")
-                result.episodes_synced = self._sync_to_trakt(unsynced, session_id=sync_log.id)
+                result.episodes_synced = self._sync_to_trakt(
+                    unsynced, session_id=sync_log.id, result=result
+                )
                 
                 # Update sync log with final status
                 sync_log.episodes_synced = result.episodes_synced
-                sync_log.status = "success" if result.episodes_synced > 0 else "failed"
+                sync_log.status = "success" if result.episodes_synced or result.episodes_skipped else "failed"
                 sync_log.save()
             else:
                 log_progress("All episodes already synced")
@@ -245,6 +221,236 @@ class SyncWorkflow:
         log_progress("Sync complete!")
         return result
     
+    def _get_from_timestamp(self, log_progress: Callable[[str], None]) -> int:
+        """Get the incremental-sync start timestamp (1 = all history)."""
+        # IMPORTANT: Default to 1 (ALL HISTORY) on first sync, never start incremental
+        from_timestamp = self.repo.get_last_watch_markers_timestamp()
+        
+        # Force from=1 on first sync to ensure we get complete history
+        # This is critical - if we miss the initial sync, we're blind to old watches forever
+        if from_timestamp == 1:
+            log_progress("First sync - fetching all watch history from beginning (from=1)")
+        else:
+            log_progress(f"Incremental sync from timestamp {from_timestamp}")
+        return from_timestamp
+    
+    def _collect_enrichment_errors(self, result: SyncResult) -> None:
+        """Per-show enrichment failures don't abort the sync; report them."""
+        enrichment_errors = getattr(self.viki, "enrichment_errors", None)
+        if isinstance(enrichment_errors, dict):
+            for viki_id, error in enrichment_errors.items():
+                result.errors.append(f"Episode fetch failed for {viki_id}: {error}")
+    
+    def _fetch_watch_status(
+        self,
+        force_refresh: bool,
+        result: SyncResult,
+        log_progress: Callable[[str], None],
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """STEP 1: Fetch enriched watch status in one piece.
+        
+        Returns:
+            Watch status by container, or None if there is nothing to do
+            (no new history, or the fetch failed)
+        """
+        try:
+            from_timestamp = self._get_from_timestamp(log_progress)
+            
+            # Fetch watch status (ONE global call with ?from=timestamp)
+            watch_status, current_timestamp = self.viki.get_watch_status_with_metadata(
+                from_timestamp=from_timestamp,
+                force_refresh=force_refresh,
+            )
+            
+            if not watch_status:
+                log_progress("No new watch history found")
+                # Still update timestamp to avoid re-fetching
+                self.repo.set_last_watch_markers_timestamp(current_timestamp)
+                return None
+            
+            result.shows_fetched = len(watch_status)
+            self._collect_enrichment_errors(result)
+            
+            total_episodes = sum(len(videos) for videos in watch_status.values())
+            log_progress(f"Found watch status for {result.shows_fetched} shows, {total_episodes} episodes")
+            
+            # Save timestamp for next incremental sync
+            self.repo.set_last_watch_markers_timestamp(current_timestamp)
+            return watch_status
+            
+        except Exception as e:
+            result.errors.append(f"Failed to fetch watch status: {e}")
+            logger.error(result.errors[-1])
+            return None
+    
+    def _stream_watch_status(
+        self,
+        force_refresh: bool,
+        result: SyncResult,
+        log_progress: Callable[[str], None],
+    ) -> bool:
+        """STEPS 1-3 streamed: store watch status in batches as it arrives.
+        
+        Only STREAM_BATCH_SIZE containers are held at a time, so memory
+        stays bounded on full-history pulls. The incremental timestamp is
+        only advanced once the whole stream has been stored.
+        
+        Returns:
+            True if the sync should continue with matching and pushing
+        """
+        total_episodes = 0
+        try:
+            from_timestamp = self._get_from_timestamp(log_progress)
+            
+            # Capture timestamp BEFORE fetch to ensure we don't miss updates
+            current_timestamp = int(time.time())
+            batch: Dict[str, Dict[str, Any]] = {}
+            for viki_id, videos in self.viki.iter_watch_status_with_metadata(
+                from_timestamp=from_timestamp,
+                force_refresh=force_refresh,
+            ):
+                batch[viki_id] = videos
+                result.shows_fetched += 1
+                total_episodes += len(videos)
+                if len(batch) >= STREAM_BATCH_SIZE:
+                    self._store_watch_status(batch, force_refresh, result, log_progress)
+                    batch = {}
+            if batch:
+                self._store_watch_status(batch, force_refresh, result, log_progress)
+            
+        except Exception as e:
+            result.errors.append(f"Failed to fetch watch status: {e}")
+            logger.error(result.errors[-1])
+            return False
+        
+        self._collect_enrichment_errors(result)
+        if not result.shows_fetched:
+            log_progress("No new watch history found")
+            self.repo.set_last_watch_markers_timestamp(current_timestamp)
+            return False
+        
+        log_progress(f"Found watch status for {result.shows_fetched} shows, {total_episodes} episodes")
+        self.repo.set_last_watch_markers_timestamp(current_timestamp)
+        return True
+    
+    def _store_watch_status(
+        self,
+        watch_status: Dict[str, Dict[str, Any]],
+        force_refresh: bool,
+        result: SyncResult,
+        log_progress: Callable[[str], None],
+    ) -> None:
+        """STEPS 2-3: Upsert shows (only stale containers hit Viki) and episodes."""
+        stale = self.container_cache.stale(list(watch_status), force_refresh=force_refresh)
+        cached_count = len(watch_status) - len(stale)
+        if cached_count:
+            log_progress(f"Using cached metadata for {cached_count} shows")
+        
+        containers = self._fetch_containers(stale)
+        for viki_id in stale:
+            try:
+                outcome = containers[viki_id]
+                if isinstance(outcome, Exception):
+                    raise outcome
+                self._store_container(viki_id, outcome)
+            except Exception as e:
+                logger.warning(f"Could not fetch container {viki_id}: {e}")
+                result.errors.append(f"Container fetch failed for {viki_id}: {e}")
+        
+        for viki_id, videos in watch_status.items():
+            result.episodes_fetched += self._upsert_watch_status(viki_id, videos)
+    
+    def _fetch_containers(self, viki_ids: List[str]) -> Dict[str, Any]:
+        """Fetch container metadata for several shows in parallel.
+        
+        Only network I/O runs on the worker threads; results are stored
+        by the caller.
+        
+        Returns:
+            Dict mapping viki_id -> container dict, None, or the raised exception
+        """
+        outcomes: Dict[str, Any] = {}
+        if not viki_ids:
+            return outcomes
+        
+        max_concurrency = getattr(self.viki, "max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        if not isinstance(max_concurrency, int):
+            max_concurrency = DEFAULT_MAX_CONCURRENCY
+        
+        workers = max(1, min(max_concurrency, len(viki_ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="viki-container") as pool:
+            futures = {viki_id: pool.submit(self.viki.get_container, viki_id) for viki_id in viki_ids}
+            for viki_id, future in futures.items():
+                try:
+                    outcomes[viki_id] = future.result()
+                except Exception as e:
+                    outcomes[viki_id] = e
+        return outcomes
+    
+    def _store_container(self, viki_id: str, container: Optional[Dict[str, Any]]) -> None:
+        """Persist a container fetch result and refresh its cache timestamp.
+        
+        A failed fetch (None) keeps existing metadata and leaves the show
+        stale, so it is retried on the next run.
+        """
+        if not container:
+            existing = self.repo.get_show(viki_id)
+            if existing is not None and existing.title:
+                return
+        self._upsert_container(viki_id, container)
+        if container:
+            self.container_cache.mark_fetched(viki_id)
+    
+    def _upsert_container(self, viki_id: str, container: Optional[Dict[str, Any]]) -> Show:
+        """Create or update a show from Viki container data.
+        
+        Falls back to a placeholder title if the container fetch failed.
+        """
+        if not container:
+            return self.repo.upsert_show(
+                viki_id=viki_id,
+                title=f"Show {viki_id}",
+                type_="series",
+            )
+        
+        origin = container.get("origin", {})
+        return self.repo.upsert_show(
+            viki_id=viki_id,
+            title=self._extract_title(container),
+            type_=container.get("type", "series"),
+            origin_country=origin.get("country"),
+            origin_language=origin.get("language"),
+        )
+    
+    def _upsert_watch_status(self, viki_id: str, videos: Dict[str, Dict[str, Any]]) -> int:
+        """Create or update episodes from one show's enriched watch status.
+        
+        Returns:
+            Number of episodes upserted
+        """
+        count = 0
+        for video_id, watch_data in videos.items():
+            # Parse timestamp if available (ISO 8601 string from Viki API)
+            watched_at = None
+            if watch_data.get("timestamp"):
+                try:
+                    watched_at = datetime.fromisoformat(watch_data["timestamp"].replace('Z', '+00:00'))
+                except (ValueError, AttributeError):
+                    # If parsing fails, fall back to None (will use default in repo)
+                    logger.debug(f"Could not parse timestamp for {video_id}: {watch_data.get('timestamp')}")
+            
+            self.repo.upsert_episode(
+                viki_video_id=video_id,
+                viki_id=viki_id,
+                episode_number=watch_data["episode_number"],
+                duration=watch_data["duration"],
+                watched_seconds=watch_data["watched_seconds"],
+                credits_marker=watch_data.get("credits_marker"),
+                last_watched_at=watched_at,  # Use Viki marker timestamp
+            )
+            count += 1
+        return count
+    
     def _upsert_show(self, item: VikiBillboardItem) -> Show:
         """Create or update a show in the repository."""
         return self.repo.upsert_show(
@@ -293,58 +499,137 @@ class SyncWorkflow:
                     
                     logger.debug(f"Updated episode {video_id}: {watched_seconds}s watched")
     
-    def _try_match(self, show: Show) -> bool:
-        """Try to match a show to Trakt.
+    def _match_shows(self, shows: List[Show], result: SyncResult) -> None:
+        """Match shows concurrently; persist the outcomes on this thread.
         
-        Returns True if match found.
+        Lookups run on a bounded worker pool, while every repository write
+        happens here, in input order, so runs are deterministic and the
+        database sees a single writer. A show still matching match_timeout
+        seconds after it started is abandoned (nothing is saved, so it is
+        retried next run) instead of stalling the stage. An abandoned match
+        keeps its worker, so once every worker is held by one, the shows
+        still queued are given up too.
         """
-        if self.matcher is None:
-            # No matcher provided - try simple search
-            return self._simple_match(show)
+        started: Dict[int, float] = {}
+        abandoned: List[Future] = []
+        
+        def find(index: int, show_input: Dict[str, Any]) -> Any:
+            started[index] = time.monotonic()
+            return self._find_match(show_input)
         
-        # Use provided matcher function
+        workers = min(self.match_concurrency, len(shows))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="matcher")
         try:
-            viki_show = {
-                "id": show.viki_id,
-                "viki_id": show.viki_id,
-                "titles": {"en": show.title},
-                "origin": {
-                    "country": show.origin_country,
-                    "language": show.origin_language,
-                },
-            }
-            result = self.matcher(viki_show)
-            
-            if result and result.is_matched():
-                self.repo.save_match(
-                    viki_id=show.viki_id,
-                    trakt_id=result.trakt_id,
-                    trakt_slug=result.trakt_slug,
-                    trakt_title=result.trakt_title,
-                    source="AUTO",
-                    confidence=result.match_confidence,
-                    method=result.match_method,
-                )
-                return True
+            futures = [
+                pool.submit(find, index, self._matcher_input(show))
+                for index, show in enumerate(shows)
+            ]
+            for index, (show, future) in enumerate(zip(shows, futures)):
+                result.matches_attempted += 1
+                try:
+                    found = self._await_match(future, started, index, abandoned, workers)
+                except FutureTimeout:
+                    logger.warning(f"Match timed out for {show.viki_id} after {self.match_timeout:.0f}s")
+                    result.errors.append(f"Match timed out for {show.viki_id}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Match failed for {show.viki_id}: {e}")
+                    continue
+                if self._apply_found_match(show, found):
+                    result.matches_found += 1
+        finally:
+            # Abandoned matches finish in the background; don't wait for them
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _await_match(
+        self,
+        future: Future,
+        started: Dict[int, float],
+        index: int,
+        abandoned: List[Future],
+        workers: int,
+    ) -> Any:
+        """Wait for one match, giving up match_timeout seconds after it started.
+        
+        A match that never started is given up (and cancelled) as soon as
+        every worker is held by an abandoned match, since none can free up.
+        Timed-out matches are added to abandoned.
+        """
+        while True:
+            begun = started.get(index)
+            if begun is None:
+                if sum(not f.done() for f in abandoned) >= workers and future.cancel():
+                    raise FutureTimeout()
+                # Queued behind other shows: its clock hasn't started, so
+                # check back soon for a worker freeing up or getting stuck
+                remaining = min(self.match_timeout, _QUEUED_POLL_SECONDS)
             else:
-                # Record no-match
-                self.repo.save_match(
-                    viki_id=show.viki_id,
-                    trakt_id=None,
-                    trakt_slug=None,
-                    trakt_title=None,
-                    source="NONE",
-                    notes="No match found",
-                )
-                return False
-                
-        except Exception as e:
-            logger.error(f"Match failed for {show.viki_id}: {e}")
-            return False
+                remaining = begun + self.match_timeout - time.monotonic()
+            try:
+                return future.result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                if begun is not None:
+                    abandoned.append(future)
+                    raise
+    
+    def _find_match(self, show_input: Dict[str, Any]) -> Any:
+        """Network half of matching (safe to run on a worker thread)."""
+        if self.matcher is None:
+            return self.trakt.search(show_input["titles"]["en"] or "")
+        return self.matcher(show_input)
+    
+    def _apply_found_match(self, show: Show, found: Any) -> bool:
+        """Persist the outcome of _find_match. Returns True if matched."""
+        if self.matcher is None:
+            return self._apply_search_results(show, found)
+        return self._apply_match(show, found)
+    
+    def _matcher_input(self, show: Show) -> Dict[str, Any]:
+        """Build the viki_show dict expected by ShowMatcher.match."""
+        return {
+            "id": show.viki_id,
+            "viki_id": show.viki_id,
+            "titles": {"en": show.title},
+            "origin": {
+                "country": show.origin_country,
+                "language": show.origin_language,
+            },
+        }
+    
+    def _apply_match(self, show: Show, result: Any) -> bool:
+        """Persist a matcher result (match or no-match) for a show.
+        
+        Returns True if the show was matched.
+        """
+        if result and result.is_matched():
+            self.repo.save_match(
+                viki_id=show.viki_id,
+                trakt_id=result.trakt_id,
+                trakt_slug=result.trakt_slug,
+                trakt_title=result.trakt_title,
+                source="AUTO",
+                confidence=result.match_confidence,
+                method=result.match_method,
+            )
+            return True
+        
+        # Record no-match
+        self.repo.save_match(
+            viki_id=show.viki_id,
+            trakt_id=None,
+            trakt_slug=None,
+            trakt_title=None,
+            source="NONE",
+            notes="No match found",
+        )
+        return False
     
     def _simple_match(self, show: Show) -> bool:
         """Simple matching using just Trakt search."""
-        results = self.trakt.search(show.title or "")
+        return self._apply_search_results(show, self.trakt.search(show.title or ""))
+    
+    def _apply_search_results(self, show: Show, results: List) -> bool:
+        """Save the first high-confidence Trakt search result as the match."""
         if not results:
             return False
         
@@ -378,41 +663,194 @@ class SyncWorkflow:
             )
         return str(titles) if titles else f"Show {container.get('id', 'unknown')}"
     
-    def _sync_to_trakt(self, episodes: List, session_id: Optional[int] = None) -> int:
-        """Sync watched episodes to Trakt.
+    def _sync_to_trakt(
+        self,
+        episodes: List,
+        session_id: Optional[int] = None,
+        result: Optional[SyncResult] = None,
+    ) -> int:
+        """Sync watched episodes to Trakt in show-grouped chunks.
+        
+        Chunks are POSTed concurrently (bounded by push_concurrency); each
+        chunk's result is applied on this thread, so only episodes whose
+        chunk succeeded are marked synced.
         
         Args:
             episodes: Episodes to sync
             session_id: SyncLog.id to link for undo capability
+            result: Optional SyncResult to record skips and failed chunks in
         
         Returns count of synced episodes.
         """
-        # Group by show and build Trakt episodes
-        trakt_episodes = []
+        chunks = self._chunk_for_push(episodes, result)
+        if not chunks:
+            return 0
+        
+        workers = min(self.push_concurrency, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trakt-push") as pool:
+            futures = [
+                pool.submit(
+                    self.trakt.sync_watched,
+                    [trakt_ep for _, trakt_ep in chunk],
+                    chunk_size=self.push_chunk_size,
+                )
+                for chunk in chunks
+            ]
+            synced = 0
+            for chunk, future in zip(chunks, futures):
+                try:
+                    sync_result = future.result()
+                except Exception as e:
+                    logger.error(f"Trakt push failed for {len(chunk)} episodes: {e}")
+                    if result is not None:
+                        result.errors.append(f"Trakt push failed: {e}")
+                    continue
+                synced += self._apply_sync_result(chunk, sync_result, session_id=session_id, result=result)
+        return synced
+    
+    def _chunk_for_push(self, episodes: List, result: Optional[SyncResult] = None) -> List[List[tuple]]:
+        """Pair local episodes with Trakt references and chunk them by show.
+        
+        Episodes the watched index already has are marked synced here and
+        left out of the chunks.
+        
+        Args:
+            episodes: Episodes to sync
+            result: Optional SyncResult to count skipped episodes in
+        
+        Returns:
+            Chunks of (local episode, TraktEpisode) pairs
+        """
+        pairs = self._drop_already_watched(self._pair_trakt_episodes(episodes), result)
+        return chunk_by_show(pairs, self.push_chunk_size, show_id=lambda pair: pair[1].show_trakt_id)
+    
+    def _refresh_watched_index(self) -> None:
+        """Bring the Trakt watched index up to date (failures only cost the skip)."""
+        if self.watched_index is None:
+            return
+        try:
+            self.watched_index.refresh(self.trakt)
+        except Exception as e:
+            logger.warning(f"Could not refresh Trakt watched index: {e}")
+    
+    def _drop_already_watched(self, pairs: List[tuple], result: Optional[SyncResult] = None) -> List[tuple]:
+        """Mark pairs already watched on Trakt as synced and return the rest.
+        
+        Skipped episodes are not linked to the sync session, so undoing the
+        session does not queue them for another push.
+        """
+        if self.watched_index is None:
+            return pairs
+        
+        remaining = []
+        present = []
+        for local, trakt_ep in pairs:
+            if self.watched_index.contains(trakt_ep.show_trakt_id, trakt_ep.season, trakt_ep.episode):
+                present.append(local)
+            else:
+                remaining.append((local, trakt_ep))
+        
+        if present:
+            self.repo.mark_episodes_synced(present)
+            logger.info(f"Skipping {len(present)} episodes already watched on Trakt")
+            if result is not None:
+                result.episodes_skipped += len(present)
+        return remaining
+    
+    def _prepare_season_map(self, episodes: List, force_refresh: bool = False) -> None:
+        """Fetch missing/stale Trakt season maps for these episodes' shows.
+        
+        Runs before the push so that mapping episodes needs no requests.
+        """
+        if self.season_map is None:
+            return
+        try:
+            stale = self.season_map.stale(self._show_trakt_ids(episodes), force_refresh=force_refresh)
+            if not stale:
+                return
+            workers = min(self.push_concurrency, len(stale))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trakt-seasons") as pool:
+                for trakt_id, seasons in zip(stale, pool.map(self.trakt.get_seasons, stale)):
+                    self.season_map.store(trakt_id, seasons)
+        except Exception as e:
+            logger.warning(f"Could not prepare Trakt season maps: {e}")
+    
+    def _show_trakt_ids(self, episodes: List) -> List[int]:
+        """Distinct Trakt IDs of the (matched) shows these episodes belong to."""
+        trakt_ids = []
+        for ep in episodes:
+            show = self.repo.get_show(ep.show_id) if hasattr(ep, 'show_id') else ep.show
+            if show and show.trakt_id:
+                trakt_ids.append(show.trakt_id)
+        return list(dict.fromkeys(trakt_ids))
+    
+    def _map_episode(self, trakt_id: int, number: int) -> tuple:
+        """Map an absolute Viki episode number to a Trakt (season, episode)."""
+        mapped = self.season_map.lookup(trakt_id, number) if self.season_map is not None else None
+        # Without a season map, assume a single season (most Viki dramas)
+        return mapped or (1, number)
+    
+    def _build_trakt_episodes(self, episodes: List) -> List[TraktEpisode]:
+        """Map local episodes of matched shows to Trakt episode references."""
+        return [trakt_ep for _, trakt_ep in self._pair_trakt_episodes(episodes)]
+    
+    def _pair_trakt_episodes(self, episodes: List) -> List[tuple]:
+        """Map local episodes of matched shows to (episode, TraktEpisode) pairs."""
+        pairs = []
         
         for ep in episodes:
             show = self.repo.get_show(ep.show_id) if hasattr(ep, 'show_id') else ep.show
             if not show or not show.trakt_id:
                 continue
             
-            # Map Viki episode to Trakt (assume season 1 for Asian dramas)
-            trakt_episodes.append(TraktEpisode(
+            season, number = self._map_episode(show.trakt_id, ep.episode_number or 1)
+            pairs.append((ep, TraktEpisode(
                 show_trakt_id=show.trakt_id,
-                season=1,  # Most Viki shows are single-season
-                episode=ep.episode_number or 1,
+                season=season,
+                episode=number,
                 watched_at=ep.last_watched_at,
-            ))
+            )))
+        
+        return pairs
+    
+    def _apply_sync_result(
+        self,
+        pairs: List[tuple],
+        response: Dict[str, Any],
+        session_id: Optional[int] = None,
+        result: Optional[SyncResult] = None,
+    ) -> int:
+        """Reconcile a Trakt sync_watched response episode by episode.
+        
+        Episodes Trakt reported as not_found are parked as rejected; the
+        rest are marked synced once Trakt acknowledged the POST. A failed
+        POST marks nothing, so the whole chunk is retried next run.
         
-        if not trakt_episodes:
+        Args:
+            pairs: (local episode, TraktEpisode) pairs that were POSTed
+            response: sync_watched result (counts plus 'rejected' episodes)
+            session_id: SyncLog.id to link for undo capability
+            result: Optional SyncResult to count rejections in
+        
+        Returns count of synced episodes.
+        """
+        if response.get("failed", 0):
             return 0
         
-        result = self.trakt.sync_watched(trakt_episodes)
+        rejected_keys = {episode_key(ep) for ep in response.get("rejected") or []}
+        accepted = [local for local, trakt_ep in pairs if episode_key(trakt_ep) not in rejected_keys]
+        rejected = [local for local, trakt_ep in pairs if episode_key(trakt_ep) in rejected_keys]
+        
+        if rejected:
+            logger.warning(f"Trakt rejected {len(rejected)} episodes (not_found)")
+            self.repo.mark_episodes_rejected(rejected, reason="not_found")
+            if result is not None:
+                result.episodes_rejected += len(rejected)
         
         # Mark as synced when episodes are added OR already existing (idempotent)
-        # If result shows items were synced, mark all as done
-        synced_count = result.get("added", 0) + result.get("existing", 0)
-        if synced_count > 0:
-            self.repo.mark_episodes_synced(episodes, session_id=session_id)
-            return len(episodes)  # Return total submitted, not just newly added
+        synced_count = response.get("added", 0) + response.get("existing", 0)
+        if accepted and synced_count > 0:
+            self.repo.mark_episodes_synced(accepted, session_id=session_id)
+            return len(accepted)  # Return total accepted, not just newly added
         
         return 0
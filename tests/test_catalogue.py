@@ -0,0 +1,48 @@
+"""Tests for the offline Trakt catalogue tier."""
+
+from viki_trakt_sync.catalogue import TraktCatalogue
+from viki_trakt_sync.matcher import ShowMatcher
+
+
+def _show(trakt_id, title, slug, year=None, tvdb=None):
+    return {"title": title, "year": year, "ids": {"trakt": trakt_id, "slug": slug, "tvdb": tvdb}}
+
+
+def test_catalogue_indexes_persist_and_seed_from_corpus(tmp_path):
+    catalogue = TraktCatalogue(tmp_path / "catalogue.db")
+    added = catalogue.seed_from_corpus({"items": [{
+        "viki_titles": {"en": "Goblin"},
+        "trakt_search": [{"show": _show(1, "Guardian: The Lonely and Great God", "guardian", 2016, 311)}],
+        "trakt_slug_fetch": {"my-youth-2025": _show(2, "My Youth", "my-youth-2025", 2025)},
+        "matched": {"trakt_id": 1, "trakt_title": "Guardian: The Lonely and Great God", "match_confidence": 1.0},
+    }]})
+    catalogue.close()
+
+    reopened = TraktCatalogue(tmp_path / "catalogue.db")
+    assert added == 2 and len(reopened) == 2
+    assert [s.trakt_id for s in reopened.lookup_title("goblin")] == [1]  # learned alias
+    assert reopened.lookup_tvdb(311).trakt_id == 1
+    assert [s.slug for s in reopened.lookup_slug_prefix("my-youth")] == ["my-youth-2025"]
+
+
+def test_catalogue_tier_matches_without_network(tmp_path, monkeypatch):
+    monkeypatch.delenv("TRAKT_CLIENT_ID", raising=False)
+    catalogue = TraktCatalogue(tmp_path / "catalogue.db")
+    catalogue.add_many([
+        (_show(10, "The K2", "the-k2"), []),
+        (_show(20, "My Youth", "my-youth-2025", 2025), []),
+        (_show(30, "Love", "love-2019", 2019), []),
+        (_show(31, "Love", "love-2021", 2021), []),
+    ])
+    matcher = ShowMatcher(db_path=tmp_path / "matches.db", catalogue=catalogue)
+
+    k2 = matcher.match({"id": "1c", "titles": {"en": "K2"}})
+    youth = matcher.match({"id": "2c", "titles": {"en": "My Youth"}})
+    # Two shows titled "Love": left to the network tiers
+    ambiguous = matcher._tier_catalogue({"id": "3c"}, "Love")
+    by_year = matcher.match({"id": "4c", "titles": {"en": "Love"}, "year": 2021})
+
+    assert (k2.trakt_id, k2.match_method) == (10, "catalogue_article")
+    assert (youth.trakt_id, youth.match_method) == (20, "catalogue")
+    assert not ambiguous.is_matched()
+    assert by_year.trakt_id == 31
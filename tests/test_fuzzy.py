@@ -0,0 +1,86 @@
+"""Tests for the TF-IDF fuzzy title scorer."""
+
+import pytest
+
+from viki_trakt_sync.catalogue import TraktCatalogue
+from viki_trakt_sync.fuzzy import HAVE_NUMPY, FuzzyIndex, rank_titles
+from viki_trakt_sync.matcher import ShowMatcher
+
+TITLES = ["Goblin", "Guardian: The Lonely and Great God", "The K2", "Crash Landing on You", "Love"]
+
+
+def test_top_ranks_closest_titles_first():
+    index = FuzzyIndex(TITLES, keys=[1, 2, 3, 4, 5], use_numpy=False)
+
+    top = index.top("Crash Landing On U", k=2)
+
+    assert top[0][0] == 4 and top[0][2] > 0.6
+    assert index.top("zzzz") == []
+    scores = rank_titles("The K2", TITLES)
+    assert scores.index(max(scores)) == 2 and max(scores) == pytest.approx(1.0)
+
+
+@pytest.mark.skipif(not HAVE_NUMPY, reason="numpy not installed")
+def test_numpy_and_pure_python_scores_agree():
+    query = "guardian lonely god"
+    fast = FuzzyIndex(TITLES, use_numpy=True)
+    slow = FuzzyIndex(TITLES, use_numpy=False)
+
+    assert list(fast.scores(query)) == pytest.approx(slow.scores(query))
+    assert fast.top(query, k=3) == pytest.approx(slow.top(query, k=3))
+
+
+def test_fuzzy_tier_needs_a_clear_winner(tmp_path):
+    catalogue = TraktCatalogue(tmp_path / "catalogue.db")
+    catalogue.add_many([
+        ({"title": "Crash Landing on You", "ids": {"trakt": 1, "slug": "crash-landing-on-you"}}, []),
+        ({"title": "Love Alarm", "ids": {"trakt": 2, "slug": "love-alarm"}}, []),
+        ({"title": "Love Alarm 2", "ids": {"trakt": 3, "slug": "love-alarm-2"}}, []),
+        ({"title": "Money Heist: Korea", "ids": {"trakt": 4, "slug": "money-heist-korea"}}, []),
+        ({"title": "Money Heist Korea", "ids": {"trakt": 5, "slug": "money-heist-korea-jea"}}, []),
+    ])
+    matcher = ShowMatcher(db_path=tmp_path / "matches.db", catalogue=catalogue)
+
+    close = matcher._tier_fuzzy({"id": "1c"}, "Crash Landing On You (2019)")
+    too_far = matcher._tier_fuzzy({"id": "2c"}, "Crash Course in Romance")
+    tied = matcher._tier_fuzzy({"id": "3c"}, "Money Heist - Korea (JEA)")
+
+    assert (close.trakt_id, close.match_method) == (1, "fuzzy")
+    assert 0.6 < close.match_confidence < 0.9
+    assert not too_far.is_matched()
+    assert not tied.is_matched()
+
+
+def test_extended_index_matches_a_rebuild_and_leaves_the_original_alone():
+    base = FuzzyIndex(TITLES[:3], keys=[1, 2, 3], use_numpy=False)
+    grown = base.extended(TITLES[3:], keys=[4, 5])
+    rebuilt = FuzzyIndex(TITLES, keys=[1, 2, 3, 4, 5], use_numpy=False)
+
+    assert len(base) == 3 and base.top("Crash Landing on You", k=1, min_score=0.5) == []
+    assert grown.top("Crash Landing On U", k=1)[0][0] == rebuilt.top("Crash Landing On U", k=1)[0][0] == 4
+    assert grown.top("The K2", k=1) == base.top("The K2", k=1)
+
+
+def test_fuzzy_index_grows_incrementally_with_the_catalogue(tmp_path, monkeypatch):
+    import viki_trakt_sync.matcher as matcher_mod
+
+    catalogue = TraktCatalogue(tmp_path / "catalogue.db")
+    catalogue.add_many([
+        ({"title": f"Show Number {i}", "ids": {"trakt": i, "slug": f"show-number-{i}"}}, []) for i in range(1, 41)
+    ])
+    matcher = ShowMatcher(db_path=tmp_path / "matches.db", catalogue=catalogue)
+    builds = []
+    real_index = matcher_mod.FuzzyIndex
+    monkeypatch.setattr(matcher_mod, "FuzzyIndex", lambda *a, **kw: builds.append(1) or real_index(*a, **kw))
+
+    matcher._fuzzy_index()
+    version = catalogue.version
+    catalogue.add({"title": "Show Number 1", "ids": {"trakt": 1, "slug": "show-number-1"}})
+    assert catalogue.version == version  # nothing changed
+
+    catalogue.add({"title": "Crash Landing on You", "ids": {"trakt": 99, "slug": "crash-landing-on-you"}})
+    top = matcher._fuzzy_index().top("Crash Landing on You", k=1)
+
+    assert top[0][0] == 99
+    assert len(matcher._fuzzy_index()) == 41
+    assert builds == [1]  # built once, then extended
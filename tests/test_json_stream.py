@@ -0,0 +1,33 @@
+"""Tests for the incremental JSON parser."""
+
+import json
+
+import pytest
+
+from viki_trakt_sync.json_stream import iter_object_items
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+def test_yields_markers_across_chunk_boundaries(chunk_size):
+    doc = {
+        "count": 12345,
+        "markers": {
+            "1c": {"v1": {"watch_marker": 10, "timestamp": "2025-01-01T00:00:00Z"}},
+            "2c": {"v2": {"watch_marker": 2700}, "v3": 1.5e3},
+        },
+        "title": "드라마",
+    }
+    data = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_object_items(_chunks(data, chunk_size), "markers")) == list(doc["markers"].items())
+
+
+def test_missing_key_and_truncated_body():
+    assert list(iter_object_items([b'{"other": {"a": 1}}'], "markers")) == []
+
+    with pytest.raises(ValueError):
+        list(iter_object_items([b'{"markers": {"1c": {"v1": '], "markers"))
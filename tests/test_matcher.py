@@ -156,3 +156,123 @@ def test_article_drop_match(monkeypatch, tmp_path):
     assert result.trakt_slug == "divorce-lawyer-in-love"
     assert result.match_method == "exact_trakt_article"
     assert result.match_confidence == 0.9
+
+
+def test_matchdb_batched_lookups_and_saves(tmp_path):
+    db = matcher_mod.MatchDB(tmp_path / "matches.db")
+    db.save_many([
+        matcher_mod.MatchResult(viki_id=f"{i}c", viki_title=f"Show {i}", trakt_id=i, match_confidence=1.0)
+        for i in range(1, 601)
+    ] + [matcher_mod.MatchResult(viki_id="0c", viki_title="Unmatched")])
+
+    found = db.get_many([f"{i}c" for i in range(0, 700)])
+
+    assert len(found) == 601
+    assert found["42c"].trakt_id == 42 and not found["0c"].is_matched()
+    assert db.stats() == {"total": 601, "matched": 600, "unmatched": 1}
+
+    db.close()
+    assert db.get("42c").viki_title == "Show 42"  # reopens lazily
+
+
+def test_match_context_runs_each_upstream_query_once(monkeypatch, tmp_path):
+    monkeypatch.delenv("TVDB_API_KEY", raising=False)
+    calls = {"search": 0, "slug": 0}
+
+    class StubTrakt:
+        def search_shows(self, title):
+            calls["search"] += 1
+            return [{"type": "show", "show": {"title": "Other", "ids": {"trakt": 111, "slug": "other"}}}]
+
+        def get_show_by_slug(self, slug):
+            calls["slug"] += 1
+            return None
+
+    matcher = ShowMatcher(db_path=tmp_path / "matches.db")
+    matcher.trakt, matcher.trakt_available = StubTrakt(), True
+    monkeypatch.setattr(matcher, "_tier_mdl", lambda show, title, ctx=None: matcher_mod.MatchResult(show["id"], title))
+
+    context = matcher_mod.MatchContext()
+    result = matcher.match({"id": "Z", "titles": {"en": "Some Title"}}, context=context)
+
+    # Tier 2 runs first and again as the final fallback, but only searches once
+    assert (result.trakt_id, result.match_method) == (111, "exact_trakt_first")
+    assert calls == {"search": 1, "slug": 5}
+    assert context.calls == {"trakt.search": 1, "trakt.slug": 5}
+
+
+def test_speculative_tiers_keep_precedence_and_run_concurrently(monkeypatch, tmp_path):
+    import time
+
+    monkeypatch.delenv("TVDB_API_KEY", raising=False)
+    started = []
+
+    def slow_tier(name, delay, confidence):
+        def tier(show, title, ctx=None):
+            started.append(name)
+            time.sleep(delay)
+            if confidence is None:
+                return matcher_mod.MatchResult(show["id"], title)
+            return matcher_mod.MatchResult(
+                show["id"], title, trakt_id=hash(name) % 1000, match_method=name, match_confidence=confidence
+            )
+        return tier
+
+    with ShowMatcher(db_path=tmp_path / "matches.db", speculative=True) as matcher:
+        # Trakt misses its gate; TVDB (0.75 > 0.7) must win over the faster MDL hit
+        monkeypatch.setattr(matcher, "_tier_exact_trakt", slow_tier("exact_trakt", 0.2, None))
+        monkeypatch.setattr(matcher, "_tier_tvdb", slow_tier("tvdb", 0.2, 0.75))
+        monkeypatch.setattr(matcher, "_tier_tvdb_aliases", slow_tier("tvdb_aliases", 0.2, None))
+        monkeypatch.setattr(matcher, "_tier_mdl", slow_tier("mdl", 0.01, 0.9))
+
+        began = time.perf_counter()
+        result = matcher.match({"id": "S1", "titles": {"en": "Speculative Show"}})
+        elapsed = time.perf_counter() - began
+
+    assert result.match_method == "tvdb"
+    assert sorted(started) == ["exact_trakt", "mdl", "tvdb", "tvdb_aliases"]
+    assert elapsed < 0.5
+
+
+def test_match_context_cancel_stops_pending_calls():
+    context = matcher_mod.MatchContext()
+    assert context.call("trakt.search", "a", lambda: 1) == 1
+    context.cancel()
+
+    # Memoised answers are still served; new upstream calls are refused
+    assert context.call("trakt.search", "a", lambda: 2) == 1
+    with pytest.raises(matcher_mod.MatchCancelledError):
+        context.call("trakt.search", "b", lambda: 3)
+    assert context.calls == {"trakt.search": 1}
+
+
+def test_mdl_aliases_resolve_concurrently_and_lowest_index_wins(monkeypatch, tmp_path):
+    import time
+
+    aliases = ["Miss A", "Slow Hit B", "Fast Hit C", "Miss D"]
+    delays = {"Miss A": 0.3, "Slow Hit B": 0.3, "Fast Hit C": 0.01, "Miss D": 0.3}
+
+    class StubMdl:
+        def search_alias(self, title):
+            return {"english_aliases": aliases, "viki_id": None}
+
+    def resolve(ctx, auth, tvdb, alias, stop):
+        time.sleep(delays[alias])
+        if "Hit" not in alias:
+            return None
+        return hash(alias) % 1000, {"title": alias, "ids": {"trakt": hash(alias) % 1000, "slug": "s"}}
+
+    matcher = ShowMatcher(db_path=tmp_path / "matches.db")
+    matcher.trakt = object()
+    monkeypatch.setattr(matcher, "_mdl_client", lambda: StubMdl())
+    monkeypatch.setattr(matcher, "_tvdb_auth", lambda: object())
+    monkeypatch.setattr(matcher, "_resolve_mdl_alias", resolve)
+
+    began = time.perf_counter()
+    result = matcher._tier_mdl({"id": "M1"}, "Some Drama")
+    elapsed = time.perf_counter() - began
+
+    # "Fast Hit C" finishes first, but alias 1 outranks it
+    assert (result.trakt_title, result.match_method) == ("Slow Hit B", "mdl")
+    assert result.match_confidence == pytest.approx(0.92)
+    assert elapsed < 0.5  # ~0.3s in parallel, 0.6s with one alias at a time
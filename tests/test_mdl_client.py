@@ -0,0 +1,84 @@
+"""Tests for MDL page extraction and the MDL result cache."""
+
+from datetime import timedelta
+from pathlib import Path
+
+import requests
+
+from viki_trakt_sync.mdl_client import (
+    MdlCache,
+    MdlClient,
+    extract_aliases,
+    extract_first_result,
+    extract_viki_id,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "mdl"
+SEARCH_HTML = (FIXTURES / "search.html").read_text(encoding="utf-8")
+DETAIL_HTML = (FIXTURES / "detail.html").read_text(encoding="utf-8")
+
+
+def test_extractors_read_saved_pages():
+    assert extract_first_result(SEARCH_HTML) == "/712567-chilly-cohabitation"
+    # Breadcrumb JSON-LD (no alternateName) is skipped; CJK aliases dropped
+    assert extract_aliases(DETAIL_HTML) == ["My Chilling Roommate", "Cold Roommates", "Dong-geo-ui Ondo"]
+    # Viki target is percent-encoded inside MDL's /redirect link
+    assert extract_viki_id(DETAIL_HTML) == "38670c"
+
+
+def test_extractors_handle_attribute_variants():
+    html = """<a href='/1-a' class="btn">x</a>
+              <A data-id=7 CLASS='title text-primary' HREF="/2-b?x=1&amp;y=2">y</A>
+              <a class="text-primary" href="/3-c">z</a>"""
+    assert extract_first_result(html) == "/2-b?x=1&y=2"
+    assert extract_first_result("<a class='text-primary-dark' href='/1'>") is None
+    assert extract_viki_id('<a href="https://www.viki.com/tv/12345c-show">Viki</a>') == "12345c"
+    assert extract_aliases('<script type="application/ld+json">{broken</script>') == []
+
+
+class _Transport:
+    """Stand-in transport serving the saved pages."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if self.fail:
+            raise requests.ConnectionError("offline")
+
+        class _Response:
+            text = DETAIL_HTML if "/search" not in url else SEARCH_HTML
+
+            def raise_for_status(self):
+                pass
+
+        return _Response()
+
+
+def test_search_alias_results_are_cached(tmp_path):
+    transport = _Transport()
+    cache = MdlCache(tmp_path / "mdl_cache.db")
+    client = MdlClient(transport=transport, cache=cache)
+
+    first = client.search_alias("Chilly Cohabitation")
+    assert first["mdl_id"] == "712567" and first["viki_id"] == "38670c"
+    assert len(transport.urls) == 2
+
+    # Same normalised title, new client and cache instance: no requests
+    again = MdlClient(transport=transport, cache=MdlCache(tmp_path / "mdl_cache.db"))
+    assert again.search_alias("chilly cohabitation!") == first
+    assert len(transport.urls) == 2
+
+
+def test_network_errors_are_not_cached_and_misses_expire(tmp_path):
+    cache = MdlCache(tmp_path / "mdl_cache.db", miss_ttl=timedelta(0))
+    offline = MdlClient(transport=_Transport(fail=True), cache=cache)
+    assert offline.search_alias("Chilly Cohabitation") is None
+    assert cache.get("Chilly Cohabitation") == (False, None)
+
+    cache.put("Unknown Show", None)
+    assert cache.get("Unknown Show") == (False, None)  # miss_ttl 0: already stale
+    cache.put("Known Show", {"english_aliases": ["A"], "viki_id": None})
+    assert cache.get("Known Show") == (True, {"english_aliases": ["A"], "viki_id": None})
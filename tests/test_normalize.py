@@ -0,0 +1,15 @@
+"""Tests for shared title normalisation."""
+
+from viki_trakt_sync.normalize import TitleKeys, normalize_many, slug_candidates, title_keys
+
+
+def test_title_keys_strip_punctuation_and_articles():
+    assert title_keys("The K2!") == TitleKeys("the k2", "k2", "the-k2", "k2")
+    assert title_keys(None) == TitleKeys("", "", "", "")
+    # Article only dropped at the start
+    assert title_keys("Theory of Love").norm_no_article == "theory of love"
+
+
+def test_normalize_many_and_slug_candidates():
+    assert [k.norm for k in normalize_many(["A  Love", "Goblin: Part 2"])] == ["a love", "goblin part 2"]
+    assert slug_candidates("My Youth", years=[2025]) == ["my-youth", "my-youth-2025"]
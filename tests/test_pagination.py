@@ -0,0 +1,60 @@
+"""Tests for pipelined pagination."""
+
+import threading
+import time
+
+import pytest
+
+from viki_trakt_sync.pagination import iter_pages
+
+
+def _pager(total_pages, with_count=False, page_size=2, delays=None):
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            calls.append(page)
+        time.sleep((delays or {}).get(page, 0))
+        if page > total_pages:
+            return {"response": [], "more": False}
+        response = {"response": [f"p{page}a", f"p{page}b"], "more": page < total_pages}
+        if with_count:
+            response["count"] = total_pages * page_size
+        return response
+
+    return fetch, calls
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_pages_are_yielded_in_order(prefetch):
+    # Later pages finish first; output order must not change
+    fetch, _ = _pager(5, delays={2: 0.05, 3: 0.02})
+
+    pages = list(iter_pages(fetch, prefetch=prefetch))
+
+    assert [p["response"][0] for p in pages] == ["p1a", "p2a", "p3a", "p4a", "p5a"]
+
+
+def test_single_page_costs_one_request_and_count_avoids_overshoot():
+    fetch, calls = _pager(1)
+    assert len(list(iter_pages(fetch, prefetch=3))) == 1
+    assert calls == [1]
+
+    fetch, calls = _pager(4, with_count=True)
+    assert len(list(iter_pages(fetch, prefetch=3, page_size=2))) == 4
+    assert sorted(calls) == [1, 2, 3, 4]
+
+
+def test_error_surfaces_at_failing_page():
+    def fetch(page):
+        if page == 3:
+            raise RuntimeError("boom")
+        return {"response": [page], "more": True}
+
+    seen = []
+    with pytest.raises(RuntimeError):
+        for response in iter_pages(fetch, prefetch=2):
+            seen.append(response["response"][0])
+
+    assert seen == [1, 2]
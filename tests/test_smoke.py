@@ -187,6 +187,134 @@ class TestVikiAdapter:
         assert len(episodes) == 2
         assert episodes[0].episode_number == 1
         assert episodes[1].episode_number == 2
+    
+    def test_watch_status_enrichment_isolates_failures(self, mock_client):
+        """Test concurrent enrichment merges in marker order and reports failures."""
+        from viki_trakt_sync.adapters import VikiAdapter
+        
+        mock_client.get_watch_markers.return_value = {
+            "markers": {
+                "bad1c": {"ep9": {"watch_marker": 10}},
+                "12345v": {"ep001": {"watch_marker": 3600, "timestamp": "2025-01-01T00:00:00Z"}},
+            }
+        }
+        
+        def get_episodes(container_id, page=1, per_page=100):
+            if container_id == "bad1c":
+                raise RuntimeError("boom")
+            return {
+                "response": [{"id": "ep001", "number": 1, "duration": 3600}],
+                "more": False,
+            }
+        
+        mock_client.get_episodes.side_effect = get_episodes
+        
+        adapter = VikiAdapter(mock_client, max_concurrency=4)
+        status, _ = adapter.get_watch_status_with_metadata(from_timestamp=1)
+        
+        assert list(status) == ["bad1c", "12345v"]
+        assert status["12345v"]["ep001"]["episode_number"] == 1
+        assert status["bad1c"]["ep9"]["watched_seconds"] == 10
+        assert status["bad1c"]["ep9"]["duration"] == 0
+        assert list(adapter.enrichment_errors) == ["bad1c"]
+
+    def test_iter_watch_status_streams_in_marker_order(self, mock_client):
+        """Test the streaming enrichment yields containers in order and isolates failures."""
+        from viki_trakt_sync.adapters import VikiAdapter
+
+        mock_client.iter_watch_markers.return_value = iter([
+            ("12345v", {"ep001": {"watch_marker": 3600}}),
+            ("bad1c", {"ep9": {"watch_marker": 10}}),
+            ("67890v", {"ep002": {"watch_marker": 60}}),
+        ])
+
+        def get_episodes(container_id, page=1, per_page=100):
+            if container_id == "bad1c":
+                raise RuntimeError("boom")
+            return {
+                "response": [
+                    {"id": "ep001", "number": 1, "duration": 3600},
+                    {"id": "ep002", "number": 2, "duration": 3600},
+                ],
+                "more": False,
+            }
+
+        mock_client.get_episodes.side_effect = get_episodes
+
+        adapter = VikiAdapter(mock_client, max_concurrency=1)
+        status = list(adapter.iter_watch_status_with_metadata(from_timestamp=1))
+
+        assert [viki_id for viki_id, _ in status] == ["12345v", "bad1c", "67890v"]
+        assert status[2][1]["ep002"]["episode_number"] == 2
+        assert list(adapter.enrichment_errors) == ["bad1c"]
+        mock_client.get_watch_markers.assert_not_called()
+
+
+class TestEpisodeMetadataCache:
+    """Test the persistent episode metadata cache."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository with a temp database."""
+        os.environ['XDG_CONFIG_HOME'] = str(tmp_path)
+
+        from viki_trakt_sync.repository import Repository
+        from viki_trakt_sync.models import database
+
+        db_path = tmp_path / "viki-trakt-sync" / "sync.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        database.init(str(db_path))
+
+        return Repository()
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock Viki client with one show."""
+        client = Mock()
+        client.get_watch_markers.return_value = {
+            "markers": {"12345v": {"ep001": {"watch_marker": 3600}}}
+        }
+        client.get_episodes.return_value = {
+            "response": [
+                {"id": "ep001", "number": 1, "duration": 3600},
+                {"id": "ep002", "number": 2, "duration": 3600},
+            ],
+            "more": False,
+        }
+        return client
+
+    def test_enrichment_reuses_stored_episode_list(self, repo, mock_client):
+        """Test a second enrichment is served from the database."""
+        from viki_trakt_sync.adapters import VikiAdapter
+        from viki_trakt_sync.cache import EpisodeMetadataCache
+
+        cache = EpisodeMetadataCache(repo)
+        adapter = VikiAdapter(mock_client, episode_cache=cache)
+
+        adapter.get_watch_status_with_metadata(from_timestamp=1)
+        status, _ = adapter.get_watch_status_with_metadata(from_timestamp=1)
+
+        assert mock_client.get_episodes.call_count == 1
+        assert status["12345v"]["ep001"]["duration"] == 3600
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_unknown_video_or_stale_list_refetches(self, repo, mock_client):
+        """Test a new video id or an expired list is a cache miss."""
+        from datetime import timedelta
+        from viki_trakt_sync.adapters import VikiAdapter
+        from viki_trakt_sync.cache import EpisodeMetadataCache
+
+        cache = EpisodeMetadataCache(repo)
+        adapter = VikiAdapter(mock_client, episode_cache=cache)
+        adapter.get_watch_status_with_metadata(from_timestamp=1)
+
+        assert cache.lookup("12345v", ["ep001", "ep003"]) is None
+        assert cache.lookup("12345v", ["ep002"]) is not None
+
+        cache.ttl = timedelta(seconds=-1)
+        assert cache.lookup("12345v", ["ep001"]) is None
+        assert cache.stats()["misses"] == 3
 
 
 class TestTraktAdapter:
@@ -221,6 +349,64 @@ class TestTraktAdapter:
         assert results[0].show.trakt_id == 12345
         assert results[0].show.title == "Test Drama"
         assert results[0].score == 100.0
+    
+    def test_chunk_by_show_keeps_shows_together(self):
+        """Test that chunks respect the size limit without splitting small shows."""
+        from viki_trakt_sync.adapters.trakt import TraktEpisode, chunk_by_show
+        
+        episodes = (
+            [TraktEpisode(show_trakt_id=1, season=1, episode=n) for n in range(1, 4)]
+            + [TraktEpisode(show_trakt_id=2, season=1, episode=n) for n in range(1, 3)]
+            + [TraktEpisode(show_trakt_id=3, season=1, episode=n) for n in range(1, 6)]
+        )
+        
+        chunks = chunk_by_show(episodes, chunk_size=4)
+        
+        assert [[ep.show_trakt_id for ep in chunk] for chunk in chunks] == [
+            [1, 1, 1], [2, 2], [3, 3, 3, 3], [3],
+        ]
+    
+    def test_sync_watched_chunks_isolates_failures(self, mock_client):
+        """Test that a failed POST only fails its own chunk."""
+        from viki_trakt_sync.adapters import TraktAdapter
+        from viki_trakt_sync.adapters.trakt import TraktEpisode
+        
+        adapter = TraktAdapter(mock_client)
+        
+        def post(payload):
+            if payload["shows"][0]["ids"]["trakt"] == 2:
+                raise RuntimeError("timeout")
+            return {"added": {"episodes": 1}}
+        
+        adapter._post_sync_history = post
+        episodes = [TraktEpisode(show_trakt_id=i, season=1, episode=1) for i in (1, 2, 3)]
+        
+        chunks = adapter.sync_watched_chunks(episodes, chunk_size=1)
+        
+        assert [chunk.ok for chunk in chunks] == [True, False, True]
+        totals = adapter.sync_watched(episodes, chunk_size=1)
+        assert (totals["added"], totals["existing"], totals["failed"]) == (2, 0, 1)
+    
+    def test_sync_watched_reports_not_found_episodes(self, mock_client):
+        """Test that not_found items come back as rejected episodes."""
+        from viki_trakt_sync.adapters import TraktAdapter
+        from viki_trakt_sync.adapters.trakt import TraktEpisode
+        
+        adapter = TraktAdapter(mock_client)
+        adapter._post_sync_history = lambda payload: {
+            "added": {"episodes": 2},
+            "not_found": {"shows": [
+                {"ids": {"trakt": 1}, "seasons": [{"number": 1, "episodes": [{"number": 3}]}]},
+                {"ids": {"trakt": 2}},
+            ]},
+        }
+        episodes = [TraktEpisode(show_trakt_id=1, season=1, episode=n) for n in (1, 2, 3)]
+        episodes.append(TraktEpisode(show_trakt_id=2, season=1, episode=1))
+        
+        chunk = adapter.sync_watched_chunks(episodes)[0]
+        
+        assert [(ep.show_trakt_id, ep.episode) for ep in chunk.rejected] == [(1, 3), (2, 1)]
+        assert [ep.episode for ep in chunk.accepted] == [1, 2]
 
 
 # ============================================================
@@ -330,6 +516,450 @@ class TestSyncWorkflow:
         # New architecture uses get_watch_status_with_metadata as primary
         mock_viki.get_watch_status_with_metadata.assert_called_once()
 
+    def test_run_uses_cached_container_metadata(self, mock_viki, mock_trakt, repo):
+        """Test that known shows skip the container fetch unless forced."""
+        from viki_trakt_sync.workflows import SyncWorkflow
+
+        mock_viki.get_container.return_value = {
+            "titles": {"en": "Test Show"},
+            "type": "series",
+            "origin": {"country": "KR", "language": "ko"},
+        }
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+        )
+
+        workflow.run(dry_run=True)
+        workflow.run(dry_run=True)
+        assert mock_viki.get_container.call_count == 1
+        assert repo.get_show("show1").title == "Test Show"
+
+        workflow.run(force_refresh=True, dry_run=True)
+        assert mock_viki.get_container.call_count == 2
+        assert workflow.container_cache.stats()["hits"] == 1
+
+    def test_run_streams_markers_in_batches(self, mock_viki, mock_trakt, repo):
+        """Test the streaming path stores every container and advances the timestamp."""
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows import sync as sync_module
+
+        marker = {"watched_seconds": 3600, "duration": 3600, "episode_number": 1, "credits_marker": None}
+        mock_viki.enrichment_errors = {}
+        mock_viki.iter_watch_status_with_metadata.return_value = iter(
+            (f"show{i}", {f"ep{i}": dict(marker)}) for i in range(5)
+        )
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            stream_markers=True,
+        )
+
+        original_batch_size = sync_module.STREAM_BATCH_SIZE
+        sync_module.STREAM_BATCH_SIZE = 2
+        try:
+            result = workflow.run(dry_run=True)
+        finally:
+            sync_module.STREAM_BATCH_SIZE = original_batch_size
+
+        assert result.shows_fetched == 5
+        assert result.episodes_fetched == 5
+        assert repo.get_episode("ep4").is_watched
+        assert repo.get_last_watch_markers_timestamp() > 1
+        mock_viki.get_watch_status_with_metadata.assert_not_called()
+
+    def test_sync_to_trakt_marks_only_successful_chunks(self, mock_viki, mock_trakt, repo):
+        """Test that a failed push chunk leaves only its own episodes unsynced."""
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows.sync import SyncResult
+
+        for viki_id, trakt_id in (("showA", 1), ("showB", 2)):
+            repo.upsert_show(viki_id, title=viki_id)
+            repo.save_match(viki_id, trakt_id, None, viki_id, source="AUTO")
+            for n in (1, 2):
+                repo.upsert_episode(
+                    f"{viki_id}-ep{n}", viki_id, episode_number=n, duration=100, watched_seconds=100
+                )
+
+        def sync_watched(episodes, **kwargs):
+            if episodes[0].show_trakt_id == 2:
+                raise RuntimeError("timeout")
+            return {"added": len(episodes), "existing": 0, "failed": 0}
+
+        mock_trakt.sync_watched.side_effect = sync_watched
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            push_chunk_size=2,
+        )
+
+        result = SyncResult()
+        synced = workflow._sync_to_trakt(repo.get_unsynced_episodes(), result=result)
+
+        assert synced == 2
+        assert mock_trakt.sync_watched.call_count == 2
+        assert len(result.errors) == 1
+        assert sorted(ep.viki_video_id for ep in repo.get_unsynced_episodes()) == [
+            "showB-ep1", "showB-ep2",
+        ]
+
+    def test_watched_index_skips_episodes_already_on_trakt(self, mock_viki, mock_trakt, repo):
+        """Test only the delta is pushed and the index is rebuilt only on new activity."""
+        from viki_trakt_sync.cache import TraktWatchedIndex
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows.sync import SyncResult
+
+        repo.upsert_show("showA", title="showA")
+        repo.save_match("showA", 1, None, "showA", source="AUTO")
+        for n in (1, 2):
+            repo.upsert_episode(f"showA-ep{n}", "showA", episode_number=n, duration=100, watched_seconds=100)
+
+        mock_trakt.get_last_activities.return_value = {"episodes": {"watched_at": "2026-01-01T00:00:00.000Z"}}
+        mock_trakt.get_watched_shows.return_value = [
+            {"show": {"ids": {"trakt": 1}}, "seasons": [{"number": 1, "episodes": [{"number": 1}]}]},
+        ]
+        mock_trakt.sync_watched.return_value = {"added": 1, "existing": 0, "failed": 0}
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            watched_index=TraktWatchedIndex(repo),
+        )
+
+        workflow._refresh_watched_index()
+        result = SyncResult()
+        synced = workflow._sync_to_trakt(repo.get_unsynced_episodes(), result=result)
+
+        assert synced == 1
+        assert result.episodes_skipped == 1
+        pushed = mock_trakt.sync_watched.call_args[0][0]
+        assert [ep.episode for ep in pushed] == [2]
+        assert repo.get_unsynced_episodes() == []
+
+        # Unchanged activity: the stored index is reused without refetching
+        index = TraktWatchedIndex(repo)
+        assert index.refresh(mock_trakt) is False
+        assert mock_trakt.get_watched_shows.call_count == 1
+        assert index.contains(1, 1, 1) and not index.contains(1, 1, 2)
+
+    def test_rejected_episodes_are_parked_until_rematch(self, mock_viki, mock_trakt, repo):
+        """Test not_found episodes are queued separately and re-queued on re-match."""
+        from viki_trakt_sync.adapters.trakt import TraktEpisode
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows.sync import SyncResult
+
+        repo.upsert_show("showA", title="showA")
+        repo.save_match("showA", 1, None, "showA", source="AUTO")
+        for n in (1, 2, 3):
+            repo.upsert_episode(f"showA-ep{n}", "showA", episode_number=n, duration=100, watched_seconds=100)
+
+        mock_trakt.sync_watched.return_value = {
+            "added": 2, "existing": 0, "failed": 0,
+            "rejected": [TraktEpisode(show_trakt_id=1, season=1, episode=3)],
+        }
+        workflow = SyncWorkflow(viki=mock_viki, trakt=mock_trakt, repository=repo)
+
+        result = SyncResult()
+        synced = workflow._sync_to_trakt(repo.get_unsynced_episodes(), result=result)
+
+        assert synced == 2
+        assert result.episodes_rejected == 1
+        assert repo.get_unsynced_episodes() == []
+        assert [ep.viki_video_id for ep in repo.get_rejected_episodes()] == ["showA-ep3"]
+        assert repo.get_stats()["rejected_episodes"] == 1
+        assert repo.get_stats()["pending_sync"] == len(repo.get_unsynced_episodes()) == 0
+
+        repo.save_match("showA", 2, None, "showA (2020)", source="MANUAL")
+        assert [ep.viki_video_id for ep in repo.get_unsynced_episodes()] == ["showA-ep3"]
+        assert repo.get_rejected_episodes() == []
+        assert repo.get_stats()["pending_sync"] == 1
+
+    def test_season_map_splits_absolute_numbers(self, mock_viki, mock_trakt, repo):
+        """Test absolute Viki numbers map to Trakt seasons, fetched once per show."""
+        from viki_trakt_sync.cache import TraktSeasonMapCache
+        from viki_trakt_sync.workflows import SyncWorkflow
+
+        repo.upsert_show("showA", title="showA")
+        repo.save_match("showA", 1, None, "showA", source="AUTO")
+        for n in (2, 3):
+            repo.upsert_episode(f"showA-ep{n}", "showA", episode_number=n, duration=100, watched_seconds=100)
+
+        mock_trakt.get_seasons.return_value = [
+            {"number": 0, "episodes": [{"number": 1}]},
+            {"number": 2, "episodes": [{"number": 1}]},
+            {"number": 1, "episodes": [{"number": 1}, {"number": 2}]},
+        ]
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            season_map=TraktSeasonMapCache(repo),
+        )
+
+        unsynced = repo.get_unsynced_episodes()
+        workflow._prepare_season_map(unsynced)
+        pairs = workflow._pair_trakt_episodes(unsynced)
+
+        assert sorted((t.season, t.episode) for _, t in pairs) == [(1, 2), (2, 1)]
+        mock_trakt.get_seasons.assert_called_once_with(1)
+
+        # Stored maps are served locally by a fresh cache
+        cache = TraktSeasonMapCache(repo)
+        assert cache.stale([1]) == []
+        assert cache.lookup(1, 3) == (2, 1)
+        assert cache.lookup(1, 4) is None
+
+    def test_match_stage_runs_concurrently_with_timeouts(self, mock_viki, mock_trakt, repo):
+        """Test matches are applied in order and a stuck show doesn't stall the stage."""
+        import threading
+        from viki_trakt_sync.matcher import MatchResult
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows.sync import SyncResult
+
+        for i in range(4):
+            repo.upsert_show(f"show{i}", title=f"Show {i}")
+        release = threading.Event()
+
+        def matcher(viki_show):
+            if viki_show["id"] == "show1":
+                release.wait(5)
+                return MatchResult(viki_id="show1", viki_title="Show 1", trakt_id=99, match_confidence=1.0)
+            number = int(viki_show["id"][-1])
+            return MatchResult(
+                viki_id=viki_show["id"], viki_title=viki_show["titles"]["en"],
+                trakt_id=100 + number, match_confidence=0.9, match_method="exact_trakt",
+            )
+
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            matcher=matcher,
+            match_concurrency=2,
+            match_timeout=0.2,
+        )
+        result = SyncResult()
+        try:
+            workflow._match_shows(repo.get_unmatched_shows(), result)
+        finally:
+            release.set()
+
+        assert result.matches_attempted == 4
+        assert result.matches_found == 3
+        assert result.errors == ["Match timed out for show1"]
+        assert [repo.get_show(f"show{i}").trakt_id for i in range(4)] == [100, None, 102, 103]
+
+    def test_match_stage_gives_up_queued_shows_when_every_worker_is_stuck(self, mock_viki, mock_trakt, repo):
+        """Test a hung match holding the only worker doesn't leave the next show waiting forever."""
+        import threading
+        import time
+        from viki_trakt_sync.matcher import MatchResult
+        from viki_trakt_sync.workflows import SyncWorkflow
+        from viki_trakt_sync.workflows.sync import SyncResult
+
+        repo.upsert_show("show0", title="Show 0")
+        repo.upsert_show("show1", title="Show 1")
+        release = threading.Event()
+        matched = []
+
+        def matcher(viki_show):
+            matched.append(viki_show["id"])
+            if viki_show["id"] == "show0":
+                release.wait(5)
+            return MatchResult(viki_id=viki_show["id"], viki_title="x", trakt_id=1, match_confidence=1.0)
+
+        workflow = SyncWorkflow(
+            viki=mock_viki,
+            trakt=mock_trakt,
+            repository=repo,
+            matcher=matcher,
+            match_concurrency=1,
+            match_timeout=0.2,
+        )
+        result = SyncResult()
+        began = time.monotonic()
+        try:
+            workflow._match_shows(repo.get_unmatched_shows(), result)
+        finally:
+            elapsed = time.monotonic() - began
+            release.set()
+
+        assert elapsed < 2
+        assert result.matches_found == 0
+        assert result.errors == ["Match timed out for show0", "Match timed out for show1"]
+        assert matched == ["show0"]  # show1 was cancelled, never started
+
+
+class TestAsyncSyncWorkflow:
+    """Test the asyncio engine against a mocked Viki client."""
+    
+    @pytest.fixture
+    def viki(self):
+        """Create a real VikiAdapter over a mock client."""
+        from viki_trakt_sync.adapters import VikiAdapter
+        
+        client = Mock()
+        client.get_watch_markers.return_value = {
+            "markers": {"show1": {"ep1": {"watch_marker": 3600, "timestamp": "2025-01-01T00:00:00Z"}}}
+        }
+        client.get_episodes.return_value = {
+            "response": [{"id": "ep1", "number": 1, "duration": 3600}],
+            "more": False,
+        }
+        client.get_container.return_value = {
+            "id": "show1", "type": "series", "titles": {"en": "Test Show"}, "origin": {"country": "KR"},
+        }
+        return VikiAdapter(client)
+    
+    @pytest.fixture
+    def mock_trakt(self):
+        """Create a mock TraktAdapter."""
+        adapter = Mock()
+        adapter.sync_watched.return_value = {"added": 1, "existing": 0, "failed": 0}
+        return adapter
+    
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository with temp database."""
+        os.environ['XDG_CONFIG_HOME'] = str(tmp_path)
+        
+        from viki_trakt_sync.repository import Repository
+        from viki_trakt_sync.models import database
+        
+        db_path = tmp_path / "viki-trakt-sync" / "sync.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        database.init(str(db_path))
+        
+        return Repository()
+    
+    @pytest.fixture
+    def matcher(self):
+        """Matcher that always finds the show on Trakt."""
+        from viki_trakt_sync.matcher import MatchResult
+        
+        def match(viki_show):
+            return MatchResult(
+                viki_id=viki_show["id"],
+                viki_title=viki_show["titles"]["en"],
+                trakt_id=42,
+                trakt_slug="test-show",
+                trakt_title="Test Show",
+                match_confidence=1.0,
+                match_method="exact_trakt",
+            )
+        return match
+    
+    def test_run_matches_and_pushes(self, viki, mock_trakt, repo, matcher):
+        """Test that the async engine stores, matches and syncs a show."""
+        from viki_trakt_sync.workflows import AsyncSyncWorkflow
+        
+        workflow = AsyncSyncWorkflow(viki=viki, trakt=mock_trakt, repository=repo, matcher=matcher)
+        result = workflow.run()
+        
+        assert result.errors == []
+        assert result.shows_fetched == 1
+        assert result.episodes_fetched == 1
+        assert result.matches_found == 1
+        assert result.episodes_synced == 1
+        assert result.sync_session_id is not None
+        assert repo.get_show("show1").title == "Test Show"
+        assert repo.get_unsynced_episodes() == []
+        mock_trakt.sync_watched.assert_called_once()
+    
+    def test_dry_run_does_not_push(self, viki, mock_trakt, repo, matcher):
+        """Test that dry-run semantics match SyncWorkflow."""
+        from viki_trakt_sync.workflows import AsyncSyncWorkflow
+        
+        workflow = AsyncSyncWorkflow(viki=viki, trakt=mock_trakt, repository=repo, matcher=matcher)
+        result = workflow.run(dry_run=True)
+        
+        assert result.episodes_synced == 0
+        assert result.sync_session_id is None
+        assert len(repo.get_unsynced_episodes()) == 1
+        mock_trakt.sync_watched.assert_not_called()
+
+    def test_search_fallback_runs_off_the_event_loop(self, viki, mock_trakt, repo):
+        """Test that without a matcher the Trakt search runs on a worker thread."""
+        import threading
+        from viki_trakt_sync.adapters.trakt import TraktSearchResult, TraktShow
+        from viki_trakt_sync.workflows import AsyncSyncWorkflow
+
+        search_threads = []
+
+        def search(title):
+            search_threads.append(threading.current_thread())
+            return [TraktSearchResult(show=TraktShow(trakt_id=42, slug="test-show", title=title), score=90)]
+
+        mock_trakt.search.side_effect = search
+        workflow = AsyncSyncWorkflow(viki=viki, trakt=mock_trakt, repository=repo)
+        result = workflow.run(dry_run=True)
+
+        assert result.matches_found == 1
+        assert repo.get_show("show1").trakt_id == 42
+        assert search_threads and threading.main_thread() not in search_threads
+
+    def test_match_timeout_excludes_time_queued_for_a_slot(self):
+        """Test a match waiting for a metadata slot isn't timed out before it starts."""
+        import asyncio
+        import time
+        from viki_trakt_sync.adapters.aio import AsyncMetadataAdapter
+
+        def slow_match(viki_show):
+            time.sleep(0.2)
+            return viki_show["id"]
+
+        async def run():
+            metadata = AsyncMetadataAdapter(Mock(), max_concurrency=1)
+            shows = [{"id": f"show{i}"} for i in range(3)]
+            return await asyncio.gather(*(metadata.match(slow_match, show, timeout=0.3) for show in shows))
+
+        # ~0.6s in total, but each lookup only runs 0.2s of its 0.3s budget
+        assert asyncio.run(run()) == ["show0", "show1", "show2"]
+
+    def test_hung_matches_never_exceed_max_concurrency_threads(self):
+        """Test timed-out matches keep their thread and queued shows give up behind them."""
+        import asyncio
+        import threading
+        import time
+        from viki_trakt_sync.adapters.aio import AsyncMetadataAdapter
+
+        release = threading.Event()
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def hung_match(viki_show):
+            with lock:
+                running.append(viki_show["id"])
+                peak.append(len(running))
+            release.wait(5)
+            with lock:
+                running.remove(viki_show["id"])
+            return viki_show["id"]
+
+        async def run():
+            metadata = AsyncMetadataAdapter(Mock(), max_concurrency=2)
+            shows = [{"id": f"show{i}"} for i in range(8)]
+            try:
+                return await asyncio.gather(
+                    *(metadata.match(hung_match, show, timeout=0.1) for show in shows),
+                    return_exceptions=True,
+                )
+            finally:
+                metadata.close()
+
+        began = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - began
+        release.set()
+
+        assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+        assert max(peak) == 2 and len(peak) == 2  # only two shows ever reached a thread
+        assert elapsed < 1.0  # queued shows gave up; shutdown didn't wait for hung threads
+
 
 # ============================================================
 # Query Tests
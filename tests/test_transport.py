@@ -0,0 +1,128 @@
+"""Tests for the shared pooled HTTP transport."""
+
+import responses
+
+from viki_trakt_sync.transport import HttpTransport
+
+
+@responses.activate
+def test_reuses_session_per_host_and_counts_traffic():
+    responses.add(responses.GET, "https://api.trakt.tv/shows/x", body=b"0123456789", status=200)
+    responses.add(responses.GET, "https://api.viki.io/v4/containers/1c.json", json={}, status=500)
+
+    transport = HttpTransport(pool_maxsize=3, pool_sizes={"api.viki.io": 7})
+
+    transport.get("https://api.trakt.tv/shows/x")
+    transport.get("https://api.trakt.tv/shows/x")
+    transport.get("https://api.viki.io/v4/containers/1c.json")
+
+    assert transport.session("api.trakt.tv") is transport.session("api.trakt.tv")
+    assert transport.session("api.viki.io").get_adapter("https://api.viki.io")._pool_maxsize == 7
+
+    stats = transport.stats.snapshot()
+    assert stats["api.trakt.tv"]["requests"] == 2
+    assert stats["api.trakt.tv"]["bytes_received"] == 20
+    assert stats["api.viki.io"]["errors"] == 1
+
+
+@responses.activate
+def test_revalidating_cache_counts_304_as_validator_hit(tmp_path):
+    from viki_trakt_sync.http_cache import CachedSession
+
+    url = "https://api.viki.io/v4/containers/1c.json"
+
+    def respond(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return (304, {"ETag": '"v1"'}, b"")
+        return (200, {"ETag": '"v1"', "Content-Type": "application/json"}, b'{"id": "1c"}')
+
+    responses.add_callback(responses.GET, url, callback=respond)
+
+    session = CachedSession(cache_dir=tmp_path, cache_name="viki", host="api.viki.io", always_revalidate=True)
+    assert session.get_json(url) == {"id": "1c"}
+    assert session.get_json(url) == {"id": "1c"}
+
+    stats = session.stats()
+    assert len(responses.calls) == 2
+    assert stats["misses"] == 1
+    assert stats["revalidated"] == 1
+    assert stats["bytes_saved"] == len(b'{"id": "1c"}')
+    assert stats["validator_hit_rate"] == 0.5
+
+
+@responses.activate
+def test_negative_results_use_their_own_ttl(tmp_path):
+    from datetime import timedelta
+
+    from viki_trakt_sync.http_cache import CachedSession
+
+    responses.add(responses.GET, "https://api.trakt.tv/shows/missing", status=404, json={})
+    responses.add(responses.GET, "https://api.trakt.tv/search", json=[])
+    responses.add(responses.GET, "https://api.trakt.tv/sync/history", json=[])
+
+    session = CachedSession(
+        cache_dir=tmp_path,
+        cache_name="trakt",
+        expire_after=timedelta(hours=24),
+        negative_expire_after=timedelta(hours=1),
+        urls_expire_after={"api.trakt.tv/sync/*": 0},
+    )
+    for _ in range(2):
+        session.get("https://api.trakt.tv/shows/missing")
+        session.get("https://api.trakt.tv/search", params={"query": "x", "type": "show"})
+        session.get("https://api.trakt.tv/search", params={"type": "show", "query": "x"}, endpoint="search")
+        session.get("https://api.trakt.tv/sync/history")
+
+    assert len(responses.calls) == 4  # 404 + search once each, /sync every time
+    cached = session.get("https://api.trakt.tv/shows/missing")
+    assert cached.from_cache
+    assert cached.expires - cached.created_at <= timedelta(hours=1, seconds=1)
+
+    stats = session.stats()
+    assert stats["negative"] == 2
+    assert stats["endpoints"]["shows"]["hits"] == 2
+    assert stats["endpoints"]["search"] == {"hits": 3, "revalidated": 0, "misses": 1, "hit_rate": 0.75}
+
+
+def test_token_bucket_reserves_in_order():
+    from viki_trakt_sync.rate_limit import TokenBucket
+
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0])
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+@responses.activate
+def test_retries_429_honoring_retry_after_and_counts_throttling():
+    from viki_trakt_sync.rate_limit import RateLimit, RateLimiter
+
+    url = "https://api.trakt.tv/sync/history"
+    responses.add(responses.POST, url, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.POST, url, json={"added": {"episodes": 1}}, status=201)
+
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(
+        {"api.trakt.tv": RateLimit(read_per_second=10, write_per_second=1)},
+        clock=lambda: now[0],
+        sleep=sleep,
+    )
+    transport = HttpTransport(rate_limiter=limiter)
+
+    response = transport.post(url, json={})
+
+    assert response.status_code == 201
+    assert len(responses.calls) == 2
+    assert 2.0 <= sum(sleeps) <= 2.2
+    stats = limiter.snapshot()["api.trakt.tv"]
+    assert stats["rate_limited"] == 1
+    assert stats["retries"] == 1
+    assert stats["throttled_seconds"] == sum(sleeps)
@@ -0,0 +1,72 @@
+"""Tests for the shared TVDB token manager."""
+
+import base64
+import json
+import threading
+
+from viki_trakt_sync.tvdb_auth import TVDB_LOGIN_URL, TvdbAuth
+
+SEARCH_URL = "https://api4.thetvdb.com/v4/search"
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class _Session:
+    """Stand-in for a CachedSession that records Authorization headers."""
+
+    def __init__(self, statuses=None):
+        self.tokens = []
+        self.statuses = list(statuses or [])
+
+    def get(self, url, headers=None, **kwargs):
+        self.tokens.append((headers or {}).get("Authorization"))
+
+        class _Response:
+            status_code = self.statuses.pop(0) if self.statuses else 200
+
+        return _Response()
+
+
+def test_token_is_shared_across_threads_and_runs(requests_mock, tmp_path):
+    now = 1_000_000.0
+    login = requests_mock.post(TVDB_LOGIN_URL, json={"data": {"token": _jwt(now + 30 * 86400)}})
+    token_path = tmp_path / "tvdb_token.json"
+
+    auth = TvdbAuth("key", token_path=token_path, clock=lambda: now)
+    threads = [threading.Thread(target=auth.token) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert login.call_count == 1
+
+    # A new process reuses the persisted token; a different key does not
+    assert TvdbAuth("key", token_path=token_path, clock=lambda: now).token() == auth.token()
+    assert login.call_count == 1
+    TvdbAuth("other-key", token_path=token_path, clock=lambda: now).token()
+    assert login.call_count == 2
+
+
+def test_token_refreshes_before_expiry_and_after_401(requests_mock, tmp_path):
+    clock = [0.0]
+    tokens = [_jwt(10_000), _jwt(100_000), _jwt(200_000)]
+    login = requests_mock.post(
+        TVDB_LOGIN_URL,
+        [{"json": {"data": {"token": t}}} for t in tokens],
+    )
+    auth = TvdbAuth("key", token_path=tmp_path / "t.json", refresh_margin=1000, clock=lambda: clock[0])
+
+    assert auth.token() == tokens[0]
+    clock[0] = 9_500  # inside the refresh margin
+    assert auth.token() == tokens[1]
+
+    session = _Session(statuses=[401, 200])
+    response = auth.get(session, SEARCH_URL)
+
+    assert response.status_code == 200
+    assert session.tokens == [f"Bearer {tokens[1]}", f"Bearer {tokens[2]}"]
+    assert login.call_count == 3
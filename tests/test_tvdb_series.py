@@ -0,0 +1,97 @@
+"""Tests for the TVDB series-detail store."""
+
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from viki_trakt_sync.adapters.metadata import MetadataAdapter
+from viki_trakt_sync.tvdb_series import TvdbSeriesStore
+
+SERIES = {
+    101: {"name": "Goblin", "year": "2016", "aliases": [
+        {"language": "eng", "name": "Guardian: The Lonely and Great God"},
+        {"language": "kor", "name": "도깨비"},
+    ]},
+    202: {"name": "The K2", "firstAired": "2016-09-23", "aliases": []},
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_tvdb_key(monkeypatch):
+    # Unauthenticated fetches through the stub session
+    monkeypatch.delenv("TVDB_API_KEY", raising=False)
+
+
+class _Session:
+    """Stand-in for the TVDB session serving /v4/series/{id} slowly."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.urls.append(url)
+        time.sleep(self.delay)
+        data = SERIES.get(int(url.rsplit("/", 1)[1]))
+
+        class _Response:
+            status_code = 200 if data else 404
+
+            def json(self):
+                return {"data": data}
+
+        return _Response()
+
+
+def test_get_many_fetches_concurrently_and_persists(tmp_path):
+    session = _Session()
+    store = TvdbSeriesStore(tmp_path / "tvdb_series.db", session=session)
+
+    began = time.perf_counter()
+    details = store.get_many(["101", 202, 303, None])
+    elapsed = time.perf_counter() - began
+
+    assert list(details) == [101, 202]
+    assert details[101].year == 2016 and details[202].year == 2016
+    assert details[101].alias_names("eng") == ["Guardian: The Lonely and Great God"]
+    assert details[101].titles() == ["Goblin", "Guardian: The Lonely and Great God"]
+    assert elapsed < 0.25  # three fetches in parallel, not ~0.3s in a row
+    store.close()
+
+    # A new store (next run) answers from the database without fetching
+    reopened = TvdbSeriesStore(tmp_path / "tvdb_series.db", session=session)
+    assert reopened.get(101).name == "Goblin"
+    assert len(session.urls) == 3
+    assert reopened.stats()["hits"] == 1
+
+
+def test_stale_series_are_refetched_and_concurrent_callers_share_a_fetch(tmp_path):
+    session = _Session(delay=0.05)
+    store = TvdbSeriesStore(tmp_path / "tvdb_series.db", session=session, ttl=timedelta(0))
+
+    threads = [threading.Thread(target=store.get, args=(101,)) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(session.urls) == 1
+
+    store.get(101)  # ttl 0: always stale
+    assert len(session.urls) == 2
+
+
+def test_metadata_adapter_uses_the_store(tmp_path):
+    session = _Session(delay=0)
+    store = TvdbSeriesStore(tmp_path / "tvdb_series.db", session=session)
+    adapter = MetadataAdapter(tvdb_session=session, tvdb_series=store)
+
+    show = adapter.get_tvdb_show(101)
+    assert (show.tvdb_id, show.title, show.year) == (101, "Goblin", 2016)
+    assert show.aliases == ["Guardian: The Lonely and Great God", "도깨비"]
+    assert adapter.get_tvdb_show(303) is None
+    adapter.get_tvdb_show(101)
+    assert len(session.urls) == 2